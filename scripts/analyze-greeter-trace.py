@@ -0,0 +1,287 @@
+#!/usr/bin/env python3
+"""
+analyze-greeter-trace.py - Aggregate slickSDDM greeter timings across boots
+
+With [General] trace = true in the theme configuration, the greeter logs one
+"slicksddm-trace {json}" line per timing mark (see components/Trace.qml). This
+script reads those lines from the journal, groups them by greeter session and
+reports, for each stage, how long it took after the greeter started:
+
+  main       Main.qml finished loading
+  background first background image decoded
+  avatars    last avatar decoded, and each avatar's own decode time
+  unlock     lock screen to login screen transition
+  login      sddm.login() until SDDM answered
+
+It also counts how many background switches were served from the prefetched
+backgrounds (already decoded when the switch happened).
+"""
+
+import argparse
+import json
+import subprocess
+import sys
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional
+
+# ANSI colors
+GREEN = '\033[0;32m'
+YELLOW = '\033[1;33m'
+RED = '\033[0;31m'
+BLUE = '\033[0;34m'
+NC = '\033[0m'
+
+TRACE_PREFIX = "slicksddm-trace "
+
+# Stages in report order, with what they measure
+STAGES = [
+    ('main', "Main.qml completed"),
+    ('background', "first background ready"),
+    ('avatars', "last avatar loaded"),
+    ('avatar', "single avatar decode"),
+    ('unlock', "lock → login transition"),
+    ('login', "login request → reply"),
+]
+
+
+def journal_lines(since: Optional[str]) -> Iterator[str]:
+    """Raw JSON lines of every journal entry that looks like a trace mark"""
+    command = ['journalctl', '-o', 'json', '--no-pager', f'--grep={TRACE_PREFIX.strip()}']
+    if since:
+        command.append(f'--since={since}')
+    try:
+        result = subprocess.run(command, capture_output=True, text=True, check=False)
+    except FileNotFoundError:
+        print(f"{RED}✗ journalctl not found, use --input{NC}", file=sys.stderr)
+        sys.exit(1)
+    if result.returncode not in (0, 1):  # 1 means nothing matched
+        print(f"{RED}✗ journalctl failed: {result.stderr.strip()}{NC}", file=sys.stderr)
+        sys.exit(1)
+    return iter(result.stdout.splitlines())
+
+
+def parse_records(lines: Iterable[str]) -> Iterator[dict]:
+    """
+    Trace records from journal JSON entries or plain log lines. The boot of a
+    journal entry is attached to its record as "boot".
+    """
+    for line in lines:
+        line = line.strip()
+        boot = ""
+        if line.startswith('{'):
+            try:
+                entry = json.loads(line)
+            except json.JSONDecodeError:
+                continue
+            message = entry.get('MESSAGE', "")
+            if isinstance(message, list):  # Non-UTF-8 messages are byte arrays
+                message = bytes(message).decode('utf-8', 'replace')
+            boot = entry.get('_BOOT_ID', "")
+            line = message
+        start = line.find(TRACE_PREFIX)
+        if start < 0:
+            continue
+        try:
+            record = json.loads(line[start + len(TRACE_PREFIX):])
+        except json.JSONDecodeError:
+            continue
+        if not isinstance(record, dict) or 'session' not in record or 'ts' not in record:
+            continue
+        record['boot'] = boot
+        yield record
+
+
+def group_sessions(records: Iterable[dict]) -> Dict[str, List[dict]]:
+    sessions: Dict[str, List[dict]] = {}
+    for record in records:
+        sessions.setdefault(record['session'], []).append(record)
+    for events in sessions.values():
+        events.sort(key=lambda record: record['ts'])
+    return sessions
+
+
+def session_timings(events: List[dict]) -> Dict[str, List[float]]:
+    """Milliseconds spent in every stage of one greeter session"""
+    timings: Dict[str, List[float]] = {name: [] for name, _ in STAGES}
+    start = next((record['ts'] for record in events if record['event'] == 'trace.start'), events[0]['ts'])
+
+    def first(event: str) -> Optional[dict]:
+        return next((record for record in events if record['event'] == event), None)
+
+    main = first('main.completed')
+    if main:
+        timings['main'].append(main['ts'] - start)
+    background = first('background.ready')
+    if background:
+        timings['background'].append(background['ts'] - start)
+
+    created = {}
+    loaded = []
+    for record in events:
+        detail = record.get('detail') or {}
+        if record['event'] == 'avatar.created':
+            created[detail.get('id')] = record['ts']
+        elif record['event'] == 'avatar.loaded':
+            loaded.append(record['ts'])
+            if detail.get('id') in created:
+                timings['avatar'].append(record['ts'] - created.pop(detail['id']))
+    if loaded:
+        timings['avatars'].append(max(loaded) - start)
+
+    # Every lock → login change, up to the end of its transition
+    pending = None
+    for record in events:
+        detail = record.get('detail') or {}
+        if record['event'] == 'state.changed':
+            pending = record['ts'] if detail.get('state') == 'loginState' else None
+        elif record['event'] == 'state.settled' and pending is not None and detail.get('state') == 'loginState':
+            timings['unlock'].append(record['ts'] - pending)
+            pending = None
+
+    request = None
+    for record in events:
+        if record['event'] == 'login.request':
+            request = record['ts']
+        elif record['event'] in ('login.succeeded', 'login.failed') and request is not None:
+            timings['login'].append(record['ts'] - request)
+            request = None
+    return timings
+
+
+def percentile(values: List[float], fraction: float) -> float:
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, round(fraction * (len(ordered) - 1))))
+    return ordered[index]
+
+
+def summarize(sessions: Dict[str, List[dict]]) -> dict:
+    """count/median/p90/max per stage over every session, plus per-session detail"""
+    per_stage: Dict[str, List[float]] = {name: [] for name, _ in STAGES}
+    per_session = []
+    fallbacks = 0
+    switches = 0
+    cached_switches = 0
+    for session, events in sorted(sessions.items(), key=lambda item: item[1][0]['ts']):
+        timings = session_timings(events)
+        for name, values in timings.items():
+            per_stage[name].extend(values)
+        session_fallbacks = sum(1 for record in events if record['event'] == 'avatar.fallback')
+        fallbacks += session_fallbacks
+        for record in events:
+            if record['event'] == 'background.switch':
+                switches += 1
+                cached_switches += bool((record.get('detail') or {}).get('cached'))
+        per_session.append({
+            'session': session,
+            'boot': events[0].get('boot', ""),
+            'start': events[0]['ts'],
+            'fallbacks': session_fallbacks,
+            'stages': {name: max(values) for name, values in timings.items() if values},
+        })
+
+    stages = {}
+    for name, values in per_stage.items():
+        if values:
+            stages[name] = {
+                'count': len(values),
+                'median': percentile(values, 0.5),
+                'p90': percentile(values, 0.9),
+                'max': max(values),
+            }
+    return {'sessions': per_session, 'stages': stages, 'avatar_fallbacks': fallbacks,
+            'background_switches': switches, 'cached_background_switches': cached_switches}
+
+
+def print_report(summary: dict, verbose: bool):
+    print(f"{GREEN}Ubuntu Budgie SDDM Theme - Greeter Trace{NC}")
+    print("=" * 50)
+    boots = {session['boot'] for session in summary['sessions'] if session['boot']}
+    print(f"{BLUE}{len(summary['sessions'])} greeter sessions"
+          f"{f' over {len(boots)} boots' if boots else ''}{NC}\n")
+
+    print(f"{'stage':<28} {'count':>6} {'median':>9} {'p90':>9} {'max':>9}")
+    for name, label in STAGES:
+        stats = summary['stages'].get(name)
+        if not stats:
+            print(f"{label:<28} {0:>6} {'-':>9} {'-':>9} {'-':>9}")
+            continue
+        print(f"{label:<28} {stats['count']:>6} {stats['median']:>7.0f}ms {stats['p90']:>7.0f}ms "
+              f"{stats['max']:>7.0f}ms")
+    if summary['background_switches']:
+        print(f"\n{summary['cached_background_switches']} of {summary['background_switches']} "
+              f"background switches served from the prefetch cache")
+    if summary['avatar_fallbacks']:
+        print(f"\n{YELLOW}⚠ {summary['avatar_fallbacks']} avatar fallback switches{NC}")
+
+    if verbose:
+        print()
+        for session in summary['sessions']:
+            stages = ", ".join(f"{name} {value:.0f}ms" for name, value in session['stages'].items())
+            print(f"  {session['session']} {session['boot'][:8]:<8} {stages or 'no complete stages'}")
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Aggregate slickSDDM greeter trace marks from the journal",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  # Every traced greeter in the journal
+  python3 analyze-greeter-trace.py
+
+  # Only the last week, one line per greeter session
+  python3 analyze-greeter-trace.py --since "-7d" --verbose
+
+  # A log saved on another machine (journal JSON or plain text)
+  journalctl -o json -b -1 > greeter.json
+  python3 analyze-greeter-trace.py --input greeter.json
+        """
+    )
+    parser.add_argument(
+        '--input',
+        type=Path,
+        help="Read journal JSON or plain log lines from a file ('-' for stdin) instead of journalctl"
+    )
+    parser.add_argument(
+        '--since',
+        help="Only read journal entries newer than this (passed to journalctl --since)"
+    )
+    parser.add_argument(
+        '--json',
+        action='store_true',
+        help="Print the summary as JSON"
+    )
+    parser.add_argument(
+        '--verbose',
+        action='store_true',
+        help="Also list the timings of every greeter session"
+    )
+
+    args = parser.parse_args()
+
+    if args.input is None:
+        lines = journal_lines(args.since)
+    elif str(args.input) == '-':
+        lines = sys.stdin
+    else:
+        try:
+            lines = args.input.read_text(encoding='utf-8', errors='replace').splitlines()
+        except OSError as e:
+            print(f"{RED}✗ Cannot read {args.input}: {e}{NC}", file=sys.stderr)
+            sys.exit(1)
+
+    sessions = group_sessions(parse_records(lines))
+    if not sessions:
+        print(f"{YELLOW}⚠ No trace marks found. Is trace = true set in the theme configuration?{NC}",
+              file=sys.stderr)
+        sys.exit(1)
+
+    summary = summarize(sessions)
+    if args.json:
+        print(json.dumps(summary, indent=2))
+    else:
+        print_report(summary, args.verbose)
+
+
+if __name__ == '__main__':
+    main()
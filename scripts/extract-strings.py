@@ -8,21 +8,30 @@ This script:
 - Merges them into en.json while preserving existing translations
 - Reports on changes made
 
+QML files are tokenized, so references inside comments and string literals are
+ignored. Extracted keys are cached per file (mtime, size and SHA-256) under
+$XDG_CACHE_HOME/slicksddm, and files that did change are scanned on a process
+pool when there are enough of them.
+
 Usage:
     python3 extract-strings.py                    # Interactive mode
     python3 extract-strings.py --dry-run          # Show what would change
     python3 extract-strings.py --auto             # Auto-merge without prompts
 """
 
+import hashlib
 import json
 import os
 import re
 import sys
 import argparse
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import Dict, Set, List, Tuple
+from typing import Dict, Iterator, Optional, List, Tuple
 from collections import defaultdict
 
+from translation_catalog import SOURCE_LOCALE, TranslationCatalog
+
 # ANSI colors
 GREEN = '\033[0;32m'
 YELLOW = '\033[1;33m'
@@ -48,22 +57,130 @@ def print_info(message: str):
     print_color(BLUE, f"ℹ {message}")
 
 
+# Bump when the tokenizer or the cached data changes so old caches are ignored
+CACHE_VERSION = 1
+
+# Fewer files than this are scanned in-process, a pool costs more than it saves
+PARALLEL_THRESHOLD = 32
+
+DEFAULT_JOBS = os.cpu_count() or 1
+
+# Code between template literals, comments and strings; order matters, so
+# '//' and '/*' are comments before '/' is punctuation
+CODE_TOKEN = re.compile(r"""
+    (?P<space>[ \t\r\f\v]+)
+  | (?P<newline>\n)
+  | (?P<comment>//[^\n]*|/\*.*?(?:\*/|\Z))
+  | (?P<string>"(?:\\.|[^"\\\n])*"?|'(?:\\.|[^'\\\n])*'?)
+  | (?P<ident>[A-Za-z_$][\w$]*)
+  | (?P<punct>.)
+""", re.VERBOSE | re.DOTALL)
+
+# Literal text of a template string, up to its closing backtick or a ${
+TEMPLATE_TEXT = re.compile(r"(?:\\.|[^`\\$]|\$(?!\{))*", re.DOTALL)
+
+
+def tokenize_qml(text: str) -> Iterator[Tuple[str, str, int]]:
+    """
+    Yield (kind, value, line) for every identifier and punctuation token of
+    QML/JS source. Comments and string literals are skipped, but the ${...}
+    expressions of template literals are tokenized like any other code.
+    """
+    pos, line, end = 0, 1, len(text)
+    # Open brace count inside each ${...} we are in, innermost last
+    substitutions = []
+    in_template = False
+    
+    while pos < end:
+        if in_template:
+            match = TEMPLATE_TEXT.match(text, pos)
+            line += match.group().count('\n')
+            pos = match.end()
+            in_template = False
+            if text.startswith('${', pos):
+                substitutions.append(0)
+                pos += 2
+            else:
+                pos += 1  # Closing backtick
+            continue
+        
+        match = CODE_TOKEN.match(text, pos)
+        kind, value = match.lastgroup, match.group()
+        pos = match.end()
+        
+        if kind == 'newline':
+            line += 1
+        elif kind in ('comment', 'string'):
+            line += value.count('\n')
+        elif kind == 'ident':
+            yield kind, value, line
+        elif kind == 'punct':
+            if value == '`':
+                in_template = True
+                continue
+            if substitutions and value == '{':
+                substitutions[-1] += 1
+            elif substitutions and value == '}':
+                if substitutions[-1] == 0:
+                    # End of ${...}, back to the template text
+                    substitutions.pop()
+                    in_template = True
+                    continue
+                substitutions[-1] -= 1
+            yield kind, value, line
+
+
+def extract_keys(text: str) -> Dict[str, List[Tuple[int, str]]]:
+    """Map every TranslationManager.<key> in text to its (line_number, line_content) locations"""
+    lines = text.splitlines()
+    strings = defaultdict(list)
+    previous = (None, None)
+    
+    for kind, value, line in tokenize_qml(text):
+        if kind == 'ident' and previous == ('TranslationManager', '.'):
+            content = lines[line - 1].strip() if line <= len(lines) else ''
+            strings[value].append((line, content))
+        previous = (previous[1], value)
+    
+    return dict(strings)
+
+
+def scan_qml_file(job: Tuple[str, Optional[str]]) -> Tuple[Optional[str], Optional[Dict], Optional[str]]:
+    """
+    Scan one QML file for a (path, known_sha256) job. Returns (sha256, strings, error);
+    strings is None when the content still hashes to known_sha256.
+    
+    Module level so it can run in a worker process.
+    """
+    path, known_sha256 = job
+    try:
+        raw = Path(path).read_bytes()
+        sha256 = hashlib.sha256(raw).hexdigest()
+        if sha256 == known_sha256:
+            return sha256, None, None
+        return sha256, extract_keys(raw.decode('utf-8')), None
+    except (OSError, UnicodeDecodeError) as e:
+        return None, {}, str(e)
+
+
+def default_cache_file(project_root: Path) -> Path:
+    """Per-checkout cache file in $XDG_CACHE_HOME/slicksddm"""
+    cache_home = Path(os.environ.get('XDG_CACHE_HOME') or Path.home() / '.cache')
+    root_id = hashlib.sha256(str(project_root.resolve()).encode()).hexdigest()[:16]
+    return cache_home / 'slicksddm' / f'extract-strings-{root_id}.json'
+
+
 class StringExtractor:
-    def __init__(self, project_root: Path):
+    def __init__(self, project_root: Path, cache_file: Optional[Path] = None, jobs: int = DEFAULT_JOBS):
         self.project_root = project_root
         # Assuming script is in root/scripts/ and theme is in root/sddm-theme/
         self.sddm_theme_dir = project_root / "sddm-theme"
         self.translations_dir = self.sddm_theme_dir / "translations"
         self.en_json = self.translations_dir / "en.json"
         self.components_dir = self.sddm_theme_dir / "components"
-        
-        # Patterns to find TranslationManager usage in QML
-        self.patterns = [
-            # TranslationManager.propertyName
-            re.compile(r'TranslationManager\.([a-zA-Z_][a-zA-Z0-9_]*)', re.MULTILINE),
-            # For function calls: TranslationManager.functionName(...)
-            # These are captured the same way - we'll validate manually
-        ]
+        # None disables the cache of extracted keys
+        self.cache_file = cache_file
+        self.jobs = jobs
         
     def find_qml_files(self) -> List[Path]:
         """Find all QML files in the project"""
@@ -84,28 +201,94 @@ class StringExtractor:
         Extract TranslationManager references from a QML file
         Returns: Dict mapping string keys to list of (line_number, line_content) tuples
         """
-        strings = defaultdict(list)
-        
+        _, strings, error = scan_qml_file((str(qml_file), None))
+        if error:
+            print_warning(f"Error reading {qml_file.name}: {error}")
+        return strings
+    
+    def load_cache(self) -> Dict[str, Dict]:
+        """Cached scan results keyed by path relative to the project root"""
+        if self.cache_file is None:
+            return {}
         try:
-            with open(qml_file, 'r', encoding='utf-8') as f:
-                lines = f.readlines()
-                
-            for line_num, line in enumerate(lines, 1):
-                # Skip comments
-                if line.strip().startswith('//'):
+            with open(self.cache_file, 'r', encoding='utf-8') as f:
+                cache = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        if not isinstance(cache, dict) or cache.get('version') != CACHE_VERSION:
+            return {}
+        return cache.get('files', {})
+    
+    def save_cache(self, files: Dict[str, Dict]):
+        if self.cache_file is None:
+            return
+        try:
+            self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+            tmp_file = self.cache_file.with_suffix('.tmp')
+            with open(tmp_file, 'w', encoding='utf-8') as f:
+                json.dump({'version': CACHE_VERSION, 'files': files}, f, ensure_ascii=False)
+            tmp_file.replace(self.cache_file)
+        except OSError as e:
+            print_warning(f"Could not write cache {self.cache_file}: {e}")
+    
+    def scan_files(self, qml_files: List[Path]) -> Dict[Path, Dict[str, List[Tuple[int, str]]]]:
+        """
+        Extracted strings of every file, reusing cached results for files whose
+        mtime and size (or failing that, content hash) are unchanged
+        """
+        cache = self.load_cache()
+        results = {}
+        entries = {}
+        jobs = []
+        
+        for qml_file in qml_files:
+            rel = qml_file.relative_to(self.project_root).as_posix()
+            try:
+                stat = qml_file.stat()
+            except OSError as e:
+                print_warning(f"Error reading {qml_file.name}: {e}")
+                continue
+            entry = cache.get(rel)
+            if entry and entry.get('mtime_ns') == stat.st_mtime_ns and entry.get('size') == stat.st_size:
+                entries[rel] = entry
+                continue
+            jobs.append((qml_file, rel, stat, entry))
+        
+        if jobs:
+            work = [(str(qml_file), entry.get('sha256') if entry else None) for qml_file, _, _, entry in jobs]
+            if self.jobs > 1 and len(jobs) >= PARALLEL_THRESHOLD:
+                with ProcessPoolExecutor(max_workers=self.jobs) as executor:
+                    scanned = list(executor.map(scan_qml_file, work, chunksize=max(1, len(work) // (self.jobs * 4))))
+            else:
+                scanned = [scan_qml_file(job) for job in work]
+            
+            for (qml_file, rel, stat, entry), (sha256, strings, error) in zip(jobs, scanned):
+                if error:
+                    print_warning(f"Error reading {qml_file.name}: {error}")
                     continue
-                
-                # Find all TranslationManager references
-                for pattern in self.patterns:
-                    matches = pattern.findall(line)
-                    for match in matches:
-                        # Store the string key with its location
-                        strings[match].append((line_num, line.strip()))
+                if strings is None:
+                    strings = entry['strings']
+                entries[rel] = {
+                    'mtime_ns': stat.st_mtime_ns,
+                    'size': stat.st_size,
+                    'sha256': sha256,
+                    'strings': strings,
+                }
+            
+            print_info(f"Scanned {len(jobs)} changed files, {len(qml_files) - len(jobs)} cached")
         
-        except Exception as e:
-            print_warning(f"Error reading {qml_file.name}: {e}")
+        # Forget files that are gone, so the cache stays the size of the tree
+        if jobs or set(entries) != set(cache):
+            self.save_cache(entries)
         
-        return dict(strings)
+        for qml_file in qml_files:
+            entry = entries.get(qml_file.relative_to(self.project_root).as_posix())
+            if entry is not None:
+                results[qml_file] = {
+                    key: [tuple(location) for location in locations]
+                    for key, locations in entry['strings'].items()
+                }
+        return results
     
     def extract_all_strings(self) -> Dict[str, Dict[str, List[Tuple[int, str]]]]:
         """
@@ -117,9 +300,7 @@ class StringExtractor:
         
         print_info(f"Scanning {len(qml_files)} QML files...")
         
-        for qml_file in qml_files:
-            file_strings = self.extract_strings_from_file(qml_file)
-            
+        for qml_file, file_strings in self.scan_files(qml_files).items():
             for string_key, locations in file_strings.items():
                 for location in locations:
                     all_strings[string_key][qml_file.name].append(location)
@@ -133,14 +314,12 @@ class StringExtractor:
             print_warning(f"en.json not found at {self.en_json}")
             return {}
         
-        try:
-            with open(self.en_json, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-            print_success(f"Loaded {len(data)} existing strings from en.json")
-            return data
-        except json.JSONDecodeError as e:
-            print_error(f"Failed to parse en.json: {e}")
+        source = TranslationCatalog(self.translations_dir, only={SOURCE_LOCALE}).locales[SOURCE_LOCALE]
+        if source.error:
+            print_error(f"Failed to parse en.json: {source.error}")
             return {}
+        print_success(f"Loaded {len(source.data)} existing strings from en.json")
+        return dict(source.data)
     
     def save_en_json(self, data: Dict[str, str], backup: bool = True):
         """Save data to en.json with optional backup"""
@@ -338,10 +517,22 @@ Examples:
         default=Path(__file__).parent.parent,  # Parent of scripts/ directory
         help="Path to project root (default: parent of scripts directory)"
     )
+    parser.add_argument(
+        '--no-cache',
+        action='store_true',
+        help="Rescan every QML file instead of reusing cached results"
+    )
+    parser.add_argument(
+        '--jobs',
+        type=int,
+        default=DEFAULT_JOBS,
+        help=f"Worker processes for scanning changed files (default: {DEFAULT_JOBS})"
+    )
     
     args = parser.parse_args()
     
-    extractor = StringExtractor(args.project_root)
+    cache_file = None if args.no_cache else default_cache_file(args.project_root)
+    extractor = StringExtractor(args.project_root, cache_file=cache_file, jobs=max(1, args.jobs))
     success = extractor.run(dry_run=args.dry_run, auto=args.auto)
     
     sys.exit(0 if success else 1)
@@ -4,17 +4,24 @@ translate-manager.py - Comprehensive translation management for slickSDDM
 
 This script handles:
 - Pulling translations from Transifex
-- Converting JSON to QML code in TranslationManager.qml
+- Converting JSON to per-locale QML bundles loaded by TranslationManager.qml
 - Validating translations
+- Skipping generated files whose inputs are unchanged (see manifest.json next to the bundles)
+- Exporting Qt Linguist .ts files and importing their translations back into JSON
 """
 
+import hashlib
 import json
-import os
 import sys
 import subprocess
 import argparse
+import xml.etree.ElementTree as ElementTree
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Set
+from typing import Dict, Iterable, Iterator, List, Tuple
+from xml.sax.saxutils import XMLGenerator
+
+from translation_catalog import DEFAULT_WORKERS, SOURCE_LOCALE, TranslationCatalog
 
 # ANSI colors
 GREEN = '\033[0;32m'
@@ -23,6 +30,100 @@ RED = '\033[0;31m'
 BLUE = '\033[0;34m'
 NC = '\033[0m'
 
+# Recorded in the manifest; bump whenever the generated QML or .ts format
+# changes so every output is rebuilt once
+GENERATOR_VERSION = 1
+
+# .ts messages carry their JSON key in the comment, "Key: <key>"
+TS_KEY_PREFIX = "Key: "
+TS_CHUNK_SIZE = 64 * 1024
+
+
+def write_ts_file(path: Path, lang_code: str, en_data: Dict[str, str], trans_data: Dict[str, str]) -> str:
+    """
+    Stream a Qt Linguist .ts file for one language, one message at a time, and
+    replace path only if the content changed. Returns the SHA-256 of the content.
+    """
+    tmp_path = path.with_name(f".{path.name}.tmp")
+    try:
+        with open(tmp_path, 'w', encoding='utf-8', newline='\n') as f:
+            xml = XMLGenerator(f, encoding='utf-8', short_empty_elements=True)
+            xml.startDocument()
+            f.write('<!DOCTYPE TS>\n')
+            xml.startElement('TS', {'version': '2.1', 'language': lang_code})
+            xml.ignorableWhitespace('\n')
+            xml.startElement('context', {})
+            xml.ignorableWhitespace('\n    ')
+            xml.startElement('name', {})
+            xml.characters('TranslationManager')
+            xml.endElement('name')
+            
+            for key in sorted(en_data):
+                translated_text = trans_data.get(key, '')
+                xml.ignorableWhitespace('\n    ')
+                xml.startElement('message', {})
+                xml.ignorableWhitespace('\n      ')
+                xml.startElement('location', {'filename': '../components/TranslationManager.qml', 'line': '0'})
+                xml.endElement('location')
+                xml.ignorableWhitespace('\n      ')
+                xml.startElement('source', {})
+                xml.characters(en_data[key])
+                xml.endElement('source')
+                xml.ignorableWhitespace('\n      ')
+                if translated_text:
+                    xml.startElement('translation', {})
+                    xml.characters(translated_text)
+                else:
+                    xml.startElement('translation', {'type': 'unfinished'})
+                xml.endElement('translation')
+                xml.ignorableWhitespace('\n      ')
+                xml.startElement('comment', {})
+                xml.characters(f"{TS_KEY_PREFIX}{key}")
+                xml.endElement('comment')
+                xml.ignorableWhitespace('\n    ')
+                xml.endElement('message')
+            
+            xml.ignorableWhitespace('\n  ')
+            xml.endElement('context')
+            xml.ignorableWhitespace('\n')
+            xml.endElement('TS')
+            xml.endDocument()
+        
+        sha256 = file_sha256(tmp_path)
+        if path.exists() and file_sha256(path) == sha256:
+            tmp_path.unlink()
+        else:
+            tmp_path.replace(path)
+        return sha256
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+
+def read_ts_file(path: Path) -> Iterator[Tuple[str, str]]:
+    """
+    Stream (key, translation) pairs of the finished messages in a .ts file written
+    by write_ts_file(), clearing each message once read
+    """
+    for _, element in ElementTree.iterparse(path, events=('end',)):
+        if element.tag != 'message':
+            continue
+        comment = element.findtext('comment') or ''
+        translation = element.find('translation')
+        if (comment.startswith(TS_KEY_PREFIX) and translation is not None
+                and translation.get('type') not in ('unfinished', 'obsolete', 'vanished')
+                and translation.text):
+            yield comment[len(TS_KEY_PREFIX):], translation.text
+        element.clear()
+
+
+def file_sha256(path: Path) -> str:
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(TS_CHUNK_SIZE), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
 def print_color(color: str, message: str):
     """Print colored message"""
     print(f"{color}{message}{NC}")
@@ -45,7 +146,10 @@ class TranslationManager:
         self.project_root = project_root
         self.translations_dir = project_root / "sddm-theme" / "translations"
         self.translation_manager_file = project_root / "sddm-theme" / "components" / "TranslationManager.qml"
+        self.bundles_dir = project_root / "sddm-theme" / "components" / "translations"
         self.en_json = self.translations_dir / "en.json"
+        self.manifest_file = self.bundles_dir / "manifest.json"
+        self.catalog = None
         
     def validate_environment(self) -> bool:
         """Validate that required files and tools exist"""
@@ -94,18 +198,21 @@ class TranslationManager:
             print_error(f"Error pulling translations: {e}")
             return False
     
-    def load_json_translations(self) -> Dict[str, Dict[str, str]]:
-        """Load all JSON translation files"""
-        translations = {}
-        
-        for json_file in self.translations_dir.glob("*.json"):
-            lang_code = json_file.stem
-            try:
-                with open(json_file, 'r', encoding='utf-8') as f:
-                    translations[lang_code] = json.load(f)
-            except json.JSONDecodeError as e:
-                print_warning(f"Failed to parse {json_file.name}: {e}")
-        
+    def load_catalog(self, only: Iterable[str] = None) -> TranslationCatalog:
+        """Parse the JSON translation files once per run, or just the languages in only"""
+        if only is not None:
+            only = set(only)
+        if self.catalog is None or not self.catalog.covers(only):
+            self.catalog = TranslationCatalog(self.translations_dir, only=only)
+            for code, error in sorted(self.catalog.errors.items()):
+                print_warning(f"Failed to parse {code}.json: {error}")
+        return self.catalog
+    
+    def load_json_translations(self, only: Iterable[str] = None) -> Dict[str, Dict[str, str]]:
+        """Load all JSON translation files, or just the languages in only"""
+        translations = self.load_catalog(only).translations()
+        if only is not None:
+            translations = {code: data for code, data in translations.items() if code in only}
         return translations
     
     def categorize_strings(self, en_data: Dict[str, str]) -> Dict[str, List[str]]:
@@ -138,18 +245,54 @@ class TranslationManager:
         
         return categories
     
-    def generate_qml_code(self, all_translations: Dict[str, Dict[str, str]]) -> str:
+    def generate_bundle_code(self, lang_code: str, trans_data: Dict[str, str]) -> str:
+        """Generate the QML bundle holding one locale's strings"""
+        lines = [
+            "import QtQuick",
+            "",
+            f"// {lang_code} strings for TranslationManager.qml, merged over its fallbacks",
+            f"// Auto-generated by translate-manager.py from translations/{lang_code}.json - DO NOT EDIT",
+            "QtObject {",
+            "    readonly property var strings: ({",
+        ]
+        for key in sorted(trans_data.keys()):
+            lines.append(f"        {json.dumps(key)}: {json.dumps(trans_data[key], ensure_ascii=False)},")
+        lines.extend([
+            "    })",
+            "}",
+            ""
+        ])
+        return "\n".join(lines)
+    
+    def resolve_fallbacks(self, all_translations: Dict[str, Dict[str, str]]) -> Dict[str, Dict[str, str]]:
         """
-        Generate QML code for TranslationManager.qml with embedded translations
-        
-        Since SDDM cannot load external translation files, we embed ALL translations
-        directly in the QML and use Qt.locale() to select the right one at runtime.
+        Merge every locale over its fallbacks: English, overridden by the language
+        (e.g. 'es' for 'es_ES'), overridden by the locale itself. Empty strings
+        never override, so each resolved key needs a single lookup at runtime.
+        """
+        resolved = {}
+        for lang_code in all_translations:
+            merged = {}
+            chain = ['en', lang_code.split('_')[0], lang_code]
+            for fallback in dict.fromkeys(chain):
+                for key, value in all_translations.get(fallback, {}).items():
+                    if value:
+                        merged[key] = value
+            resolved[lang_code] = merged
+        return resolved
+    
+    def generate_qml_code(self, en_data: Dict[str, str], lang_codes: Iterable[str]) -> str:
         """
-        if 'en' not in all_translations:
-            raise ValueError("English source translations not found")
+        Generate QML code for TranslationManager.qml, a loader for the per-locale bundles
         
-        en_data = all_translations['en']
+        Since SDDM cannot load external .qm files, translations are shipped as QML
+        bundles (see generate_bundle_code()). The English strings are the property
+        values; for any other locale the singleton loads the single bundle that
+        already has the fallbacks resolved, once at startup.
+        """
+        en_data = {key: value for key, value in en_data.items() if value}
         categories = self.categorize_strings(en_data)
+        bundles = ", ".join(f"{json.dumps(lang_code)}: true" for lang_code in sorted(lang_codes))
         
         lines = [
             "pragma Singleton",
@@ -159,59 +302,64 @@ class TranslationManager:
             "QtObject {",
             "    id: translationManager",
             "    ",
-            "    // Embedded translations for SDDM",
-            "    // Since SDDM cannot load external .qm files, all translations are embedded here",
-            "    // and selected based on Qt.locale().name at runtime",
+            "    // Translations for SDDM",
+            "    // Since SDDM cannot load external .qm files, every locale is a QML bundle in",
+            "    // translations/ with its fallbacks already merged in; the properties below",
+            "    // hold the English strings and are overwritten once from the bundle for",
+            "    // Qt.locale().name",
             "    ",
             "    readonly property string currentLocale: Qt.locale().name",
-            "    "
-        ]
-        
-        # Generate embedded translations object
-        lines.append("    // All translations embedded")
-        lines.append("    readonly property var translations: ({")
-        
-        # Add each language
-        for lang_code in sorted(all_translations.keys()):
-            trans_data = all_translations[lang_code]
-            lines.append(f"        '{lang_code}': {{")
-            
-            for key in sorted(trans_data.keys()):
-                value = trans_data[key].replace('"', '\\"').replace('\n', '\\n')
-                lines.append(f"            '{key}': \"{value}\",")
-            
-            lines.append("        },")
-        
-        lines.append("    })")
-        lines.append("")
-        
-        # Helper function to get translated string
-        lines.extend([
-            "    // Get translation for current locale, fallback to English",
-            "    function tr(key) {",
-            "        // Try full locale (e.g., 'es_ES')",
-            "        if (translations[currentLocale] && translations[currentLocale][key]) {",
-            "            return translations[currentLocale][key]",
+            "    ",
+            "    // Locales that have a bundle",
+            f"    readonly property var bundles: ({{{bundles}}})",
+            "    ",
+            "    // The full locale if it has a bundle, else its language (e.g. 'es' from 'es_ES'), else English",
+            "    readonly property string bundleLocale: {",
+            "        if (bundles[currentLocale]) {",
+            "            return currentLocale",
             "        }",
-            "        ",
-            "        // Try language code only (e.g., 'es' from 'es_ES')",
             "        var langCode = currentLocale.split('_')[0]",
-            "        if (translations[langCode] && translations[langCode][key]) {",
-            "            return translations[langCode][key]",
+            "        return bundles[langCode] ? langCode : 'en'",
+            "    }",
+            "    ",
+            "    // Strings of the loaded bundle, empty for English",
+            "    property var strings: ({})",
+            "",
+            "    Component.onCompleted: {",
+            "        if (bundleLocale === 'en') {",
+            "            return",
             "        }",
             "        ",
-            "        // Fallback to English",
-            "        if (translations['en'] && translations['en'][key]) {",
-            "            return translations['en'][key]",
+            "        var component = Qt.createComponent(Qt.resolvedUrl(\"translations/\" + bundleLocale + \".qml\"))",
+            "        if (component.status !== Component.Ready) {",
+            "            console.error(\"TranslationManager: Failed to load bundle\", bundleLocale, component.errorString())",
+            "            return",
+            "        }",
+            "        var bundle = component.createObject(null)",
+            "        strings = bundle.strings",
+            "        bundle.destroy()",
+            "        ",
+            "        for (var key in strings) {",
+            "            if (typeof translationManager[key] === 'string') {",
+            "                translationManager[key] = strings[key]",
+            "            }",
+            "        }",
+            "    }",
+            "",
+            "    // Get translation for current locale, fallback to English",
+            "    function tr(key) {",
+            "        var value = translationManager[key]",
+            "        if (typeof value === 'string' && value.length > 0) {",
+            "            return value",
             "        }",
             "        ",
             "        // Last resort: return key itself",
-            "        return key",
+            "        return strings[key] || key",
             "    }",
             ""
-        ])
+        ]
         
-        # Generate properties for each category using the tr() function
+        # Generate one constant property per string, English until a bundle is loaded
         for category, keys in categories.items():
             if not keys:
                 continue
@@ -219,7 +367,7 @@ class TranslationManager:
             lines.append(f"    // {category}")
             for key in keys:
                 if key in en_data:
-                    lines.append(f"    readonly property string {key}: tr('{key}')")
+                    lines.append(f"    property string {key}: {json.dumps(en_data[key], ensure_ascii=False)}")
             lines.append("")
         
         # Add parameterized functions
@@ -233,41 +381,163 @@ class TranslationManager:
         
         return "\n".join(lines)
     
+    def relative(self, path: Path) -> str:
+        return path.relative_to(self.project_root).as_posix()
+    
+    def hash_inputs(self) -> Dict[str, str]:
+        """SHA-256 of every JSON translation file, keyed by language code"""
+        return {
+            json_file.stem: hashlib.sha256(json_file.read_bytes()).hexdigest()
+            for json_file in self.translations_dir.glob("*.json")
+        }
+    
+    def input_digest(self, parts: Iterable[str]) -> str:
+        """Digest of the generator version and whatever an output is built from"""
+        digest = hashlib.sha256(f"v{GENERATOR_VERSION}".encode())
+        for part in parts:
+            digest.update(f"\n{part}".encode())
+        return digest.hexdigest()
+    
+    def fallback_chain(self, lang_code: str) -> List[str]:
+        """Languages a bundle is merged from, see resolve_fallbacks()"""
+        return list(dict.fromkeys(['en', lang_code.split('_')[0], lang_code]))
+    
+    def qml_outputs(self, input_hashes: Dict[str, str]) -> Dict[Path, str]:
+        """Map every generated QML file to the digest of its inputs"""
+        # The loader holds the English strings and the list of locales
+        outputs = {
+            self.translation_manager_file: self.input_digest(
+                [f"en:{input_hashes['en']}"] + sorted(input_hashes)
+            )
+        }
+        for lang_code in input_hashes:
+            chain = [code for code in self.fallback_chain(lang_code) if code in input_hashes]
+            outputs[self.bundles_dir / f"{lang_code}.qml"] = self.input_digest(
+                f"{code}:{input_hashes[code]}" for code in chain
+            )
+        return outputs
+    
+    def load_manifest(self) -> Dict[str, Dict[str, str]]:
+        """Recorded outputs, or nothing if the manifest is missing or from another generator version"""
+        try:
+            with open(self.manifest_file, 'r', encoding='utf-8') as f:
+                manifest = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        if not isinstance(manifest, dict) or manifest.get('version') != GENERATOR_VERSION:
+            return {}
+        return manifest.get('outputs', {})
+    
+    def save_manifest(self, outputs: Dict[str, Dict[str, str]]):
+        # Forget outputs that no longer exist
+        outputs = {rel: entry for rel, entry in outputs.items() if (self.project_root / rel).exists()}
+        content = json.dumps({'version': GENERATOR_VERSION, 'outputs': outputs}, indent=2, sort_keys=True) + "\n"
+        self.write_if_changed(self.manifest_file, content)
+    
+    def write_if_changed(self, path: Path, content: str) -> bool:
+        """Write content unless the file already holds it; returns whether it was written"""
+        data = content.encode('utf-8')
+        try:
+            if path.read_bytes() == data:
+                return False
+        except OSError:
+            pass
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(data)
+        return True
+    
+    def is_stale(self, path: Path, digest: str, manifest: Dict[str, Dict[str, str]]) -> bool:
+        """True if the output is missing, built from other inputs, or edited since"""
+        entry = manifest.get(self.relative(path))
+        if not entry or entry.get('inputs') != digest:
+            return True
+        try:
+            return hashlib.sha256(path.read_bytes()).hexdigest() != entry.get('sha256')
+        except OSError:
+            return True
+    
+    def stale_qml_outputs(self, input_hashes: Dict[str, str], manifest: Dict[str, Dict[str, str]]) -> List[Path]:
+        """Generated QML files to rebuild, plus bundles of locales that are gone"""
+        stale = [
+            path for path, digest in self.qml_outputs(input_hashes).items()
+            if self.is_stale(path, digest, manifest)
+        ]
+        stale.extend(
+            bundle_file for bundle_file in self.bundles_dir.glob("*.qml")
+            if bundle_file.stem not in input_hashes
+        )
+        return sorted(stale)
+    
+    def check_outputs(self) -> bool:
+        """Report generated QML files that are out of date; True if none are"""
+        print_info("Checking generated translation files...")
+        input_hashes = self.hash_inputs()
+        if 'en' not in input_hashes:
+            print_error("English source file (en.json) not found")
+            return False
+        
+        stale = self.stale_qml_outputs(input_hashes, self.load_manifest())
+        for path in stale:
+            print_warning(f"Out of date: {self.relative(path)}")
+        if stale:
+            print_error(f"{len(stale)} generated files are stale, run translate-manager.py --no-pull")
+            return False
+        
+        print_success("Generated translation files are up to date")
+        return True
+    
     def update_translation_manager(self) -> bool:
-        """Update TranslationManager.qml with embedded translations from all languages"""
+        """Rebuild TranslationManager.qml and the per-locale bundles whose inputs changed"""
         print_info("Updating TranslationManager.qml...")
         
         try:
-            # Load ALL translations (not just English)
-            all_translations = self.load_json_translations()
+            input_hashes = self.hash_inputs()
             
-            if not all_translations:
+            if not input_hashes:
                 print_error("No translation files found")
                 return False
             
-            if 'en' not in all_translations:
+            if 'en' not in input_hashes:
                 print_error("English source file (en.json) not found")
                 return False
             
-            # Create backup
-            backup_file = self.translation_manager_file.with_suffix('.qml.bak')
-            if self.translation_manager_file.exists():
-                with open(self.translation_manager_file, 'r') as src:
-                    with open(backup_file, 'w') as dst:
-                        dst.write(src.read())
-                print_success(f"Backup created: {backup_file.name}")
+            manifest = self.load_manifest()
+            outputs = self.qml_outputs(input_hashes)
+            stale = self.stale_qml_outputs(input_hashes, manifest)
+            if not stale:
+                print_success("TranslationManager.qml and bundles are up to date")
+                return True
             
-            # Generate new QML code with ALL translations embedded
-            qml_code = self.generate_qml_code(all_translations)
+            # Only parse the languages the stale outputs are built from
+            needed = {'en'}
+            for path in stale:
+                if path.parent == self.bundles_dir:
+                    needed.update(self.fallback_chain(path.stem))
+            translations = self.load_json_translations(only=needed)
+            resolved = self.resolve_fallbacks(translations)
             
-            # Write new file
-            with open(self.translation_manager_file, 'w', encoding='utf-8') as f:
-                f.write(qml_code)
+            written = 0
+            for path in stale:
+                if path not in outputs:
+                    path.unlink()
+                    print_info(f"Removed stale bundle {path.name}")
+                    continue
+                
+                if path == self.translation_manager_file:
+                    content = self.generate_qml_code(translations['en'], input_hashes.keys())
+                else:
+                    content = self.generate_bundle_code(path.stem, resolved[path.stem])
+                if self.write_if_changed(path, content):
+                    written += 1
+                manifest[self.relative(path)] = {
+                    'inputs': outputs[path],
+                    'sha256': hashlib.sha256(content.encode('utf-8')).hexdigest(),
+                }
+            self.save_manifest(manifest)
             
-            # Report what was embedded
-            lang_count = len(all_translations)
-            lang_list = ', '.join(sorted(all_translations.keys()))
-            print_success(f"TranslationManager.qml updated with {lang_count} languages: {lang_list}")
+            # Report what was generated
+            lang_list = ', '.join(sorted(input_hashes.keys()))
+            print_success(f"Rebuilt {written} of {len(outputs)} generated files for {len(input_hashes)} languages: {lang_list}")
             return True
             
         except Exception as e:
@@ -277,119 +547,155 @@ class TranslationManager:
             return False
     
     def generate_ts_files(self) -> bool:
-        """Generate .ts files from JSON for Qt"""
+        """Generate .ts files from JSON for Qt, skipping languages whose JSON is unchanged"""
         print_info("Generating .ts files...")
         
         try:
-            translations = self.load_json_translations()
+            input_hashes = self.hash_inputs()
             
             # Load English source
-            if 'en' not in translations:
+            if 'en' not in input_hashes:
                 print_error("English source not found")
                 return False
             
+            manifest = self.load_manifest()
+            outputs = {
+                self.translations_dir / f"theme_{lang_code}.ts": self.input_digest(
+                    [f"en:{input_hashes['en']}", f"{lang_code}:{input_hashes[lang_code]}"]
+                )
+                for lang_code in input_hashes if lang_code != 'en'  # Skip source language
+            }
+            stale = {path: digest for path, digest in outputs.items() if self.is_stale(path, digest, manifest)}
+            if not stale:
+                print_success(".ts files are up to date")
+                return True
+            
+            translations = self.load_json_translations(
+                only={'en'} | {path.stem[len("theme_"):] for path in stale}
+            )
             en_data = translations['en']
             
-            # Generate .ts file for each language
-            for lang_code, trans_data in translations.items():
-                if lang_code == 'en':
-                    continue  # Skip source language
-                
-                ts_file = self.translations_dir / f"theme_{lang_code}.ts"
-                
-                # Build .ts XML
-                ts_lines = [
-                    '<?xml version="1.0" encoding="utf-8"?>',
-                    '<!DOCTYPE TS>',
-                    f'<TS version="2.1" language="{lang_code}">',
-                    '<context>',
-                    '    <name>TranslationManager</name>'
-                ]
-                
-                for key in sorted(en_data.keys()):
-                    source_text = en_data[key]
-                    translated_text = trans_data.get(key, '')
-                    
-                    ts_lines.extend([
-                        '    <message>',
-                        '      <location filename="../components/TranslationManager.qml" line="0"/>',
-                        f'      <source>{self._escape_xml(source_text)}</source>',
-                    ])
-                    
-                    if translated_text:
-                        ts_lines.append(f'      <translation>{self._escape_xml(translated_text)}</translation>')
-                    else:
-                        ts_lines.append('      <translation type="unfinished"/>')
-                    
-                    ts_lines.extend([
-                        f'      <comment>Key: {key}</comment>',
-                        '    </message>'
-                    ])
-                
-                ts_lines.extend([
-                    '  </context>',
-                    '</TS>'
-                ])
-                
-                # Write .ts file
-                with open(ts_file, 'w', encoding='utf-8') as f:
-                    f.write('\n'.join(ts_lines))
-                
+            # Each changed language is streamed to its own file concurrently
+            def write(ts_file: Path) -> str:
+                lang_code = ts_file.stem[len("theme_"):]
+                return write_ts_file(ts_file, lang_code, en_data, translations.get(lang_code, {}))
+            
+            with ThreadPoolExecutor(max_workers=DEFAULT_WORKERS) as executor:
+                written = dict(zip(stale, executor.map(write, stale)))
+            
+            for ts_file in sorted(written):
+                manifest[self.relative(ts_file)] = {'inputs': stale[ts_file], 'sha256': written[ts_file]}
                 print_success(f"Generated {ts_file.name}")
             
+            self.save_manifest(manifest)
             return True
             
         except Exception as e:
             print_error(f"Failed to generate .ts files: {e}")
             return False
     
-
+    def import_ts_files(self) -> bool:
+        """Merge finished translations from theme_<lang>.ts files (e.g. from Qt Linguist) into the JSON files"""
+        print_info("Importing .ts files...")
+        
+        ts_files = sorted(
+            ts_file for ts_file in self.translations_dir.glob("theme_*.ts")
+            if ts_file.stem[len("theme_"):] != SOURCE_LOCALE
+        )
+        if not ts_files:
+            print_warning("No .ts files found")
+            return True
+        
+        catalog = self.load_catalog()
+        if catalog.source is None:
+            print_error("English source file missing")
+            return False
+        
+        def merge(ts_file: Path) -> Tuple[str, int]:
+            lang_code = ts_file.stem[len("theme_"):]
+            locale = catalog.locales.get(lang_code)
+            if locale is not None and locale.error:
+                raise ValueError(f"{lang_code}.json: {locale.error}")
+            data = dict(locale.data) if locale is not None else {}
+            changed = 0
+            for key, translation in read_ts_file(ts_file):
+                # Keys no longer in the source are not brought back
+                if key in catalog.source.keys and data.get(key) != translation:
+                    data[key] = translation
+                    changed += 1
+            if changed:
+                content = json.dumps(dict(sorted(data.items())), indent=2, ensure_ascii=False) + "\n"
+                self.write_if_changed(self.translations_dir / f"{lang_code}.json", content)
+            return lang_code, changed
+        
+        success = True
+        with ThreadPoolExecutor(max_workers=DEFAULT_WORKERS) as executor:
+            futures = [executor.submit(merge, ts_file) for ts_file in ts_files]
+            for ts_file, future in zip(ts_files, futures):
+                try:
+                    lang_code, changed = future.result()
+                except (OSError, ValueError, ElementTree.ParseError) as e:
+                    print_error(f"Failed to import {ts_file.name}: {e}")
+                    success = False
+                    continue
+                if changed:
+                    print_success(f"{lang_code}: imported {changed} translations from {ts_file.name}")
+                else:
+                    print(f"  ✓ {lang_code}: no changes")
+        
+        # The JSON files changed under the catalog
+        self.catalog = None
+        return success
+    
     def validate_translations(self) -> bool:
         """Validate all translation files"""
         print_info("Validating translations...")
         
-        translations = self.load_json_translations()
+        catalog = self.load_catalog()
         
-        if 'en' not in translations:
+        if catalog.source is None:
             print_error("English source file missing")
             return False
         
-        en_keys = set(translations['en'].keys())
         all_valid = True
         
-        for lang_code, trans_data in translations.items():
-            if lang_code == 'en':
+        for lang_code in catalog.translated_codes():
+            if catalog.locales[lang_code].error:
+                all_valid = False
                 continue
             
-            trans_keys = set(trans_data.keys())
-            
             # Check for missing keys
-            missing = en_keys - trans_keys
+            missing = catalog.missing_keys(lang_code)
             if missing:
                 print_warning(f"{lang_code}: Missing keys: {', '.join(sorted(missing))}")
                 all_valid = False
             
             # Check for extra keys
-            extra = trans_keys - en_keys
+            extra = catalog.extra_keys(lang_code)
             if extra:
                 print_warning(f"{lang_code}: Extra keys: {', '.join(sorted(extra))}")
             
             # Check for empty values
-            empty = [key for key, value in trans_data.items() if not value]
+            empty = catalog.empty_keys(lang_code)
             if empty:
                 print_warning(f"{lang_code}: Empty values: {', '.join(sorted(empty))}")
                 all_valid = False
             
+            # Check placeholders like {name} survived translation
+            for key, expected, got in catalog.placeholder_mismatches(lang_code):
+                print_warning(f"{lang_code}: Key '{key}' has placeholders {sorted(got)}, expected {sorted(expected)}")
+                all_valid = False
+            
             # Calculate completion
-            complete_keys = [key for key in en_keys if key in trans_data and trans_data[key]]
-            completion = (len(complete_keys) / len(en_keys)) * 100 if en_keys else 0
+            completion = catalog.completion(lang_code)
             
             status = "✓" if completion == 100 else "⚠"
             print(f"  {status} {lang_code}: {completion:.1f}% complete")
         
         return all_valid
     
-    def run(self, pull: bool = True, validate_only: bool = False):
+    def run(self, pull: bool = True, validate_only: bool = False, check: bool = False,
+            export_ts: bool = False, import_ts: bool = False):
         """Run the full translation update process"""
         print_color(GREEN, "=" * 50)
         print_color(GREEN, "SDDM Translation Manager")
@@ -409,11 +715,23 @@ class TranslationManager:
         if validate_only:
             return self.validate_translations()
         
+        if check:
+            return self.check_outputs()
+        
         # Pull from Transifex
         if pull:
             if not self.pull_translations():
                 return False
         
+        # Translations edited in Qt Linguist go on top of the pulled JSON files
+        if import_ts and not self.import_ts_files():
+            return False
+        
+        # Nothing to validate or rebuild if no JSON file changed
+        if not self.stale_qml_outputs(self.hash_inputs(), self.load_manifest()):
+            print_success("Generated translation files are up to date, nothing to do")
+            return self.generate_ts_files() if export_ts else True
+        
         # Validate translations
         if not self.validate_translations():
             print_warning("Validation found issues, but continuing...")
@@ -422,6 +740,9 @@ class TranslationManager:
         if not self.update_translation_manager():
             return False
         
+        if export_ts and not self.generate_ts_files():
+            return False
+        
         print()
         print_success("Translation update complete!")
         print()
@@ -447,6 +768,21 @@ def main():
         action='store_true',
         help="Only validate existing translations without updating"
     )
+    parser.add_argument(
+        '--check',
+        action='store_true',
+        help="Exit non-zero if the generated QML is out of date with the JSON files (implies --no-pull)"
+    )
+    parser.add_argument(
+        '--ts',
+        action='store_true',
+        help="Also write Qt Linguist theme_<lang>.ts files next to the JSON files"
+    )
+    parser.add_argument(
+        '--import-ts',
+        action='store_true',
+        help="Merge finished translations from theme_<lang>.ts files into the JSON files before updating"
+    )
     parser.add_argument(
         '--project-root',
         type=Path,
@@ -457,7 +793,8 @@ def main():
     args = parser.parse_args()
     
     manager = TranslationManager(args.project_root)
-    success = manager.run(pull=not args.no_pull, validate_only=args.validate_only)
+    success = manager.run(pull=not (args.no_pull or args.check), validate_only=args.validate_only,
+                          check=args.check, export_ts=args.ts, import_ts=args.import_ts)
     
     sys.exit(0 if success else 1)
 
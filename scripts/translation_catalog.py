@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+"""
+translation_catalog.py - Shared single-load view of the JSON translation files
+
+translate-manager.py, extract-strings.py and tests/test_translations.py all
+query a TranslationCatalog instead of parsing the files themselves. Every file
+is read and parsed once, on a thread pool, and the key sets, placeholders and
+empty values of each locale are indexed up front so the checks are set
+operations rather than repeated scans.
+"""
+
+import hashlib
+import json
+import os
+import re
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, FrozenSet, Iterable, List, Optional, Tuple
+
+SOURCE_LOCALE = 'en'
+
+# Placeholders like {name} must survive translation unchanged
+PLACEHOLDER_PATTERN = re.compile(r'\{(\w+)\}')
+
+DEFAULT_WORKERS = min(32, (os.cpu_count() or 1) + 4)
+
+NO_PLACEHOLDERS: FrozenSet[str] = frozenset()
+
+
+class LocaleFile:
+    """One parsed translation file and its indexes"""
+
+    def __init__(self, code: str, path: Path, size: int, digest: str,
+                 data: Dict[str, str], error: Optional[str] = None):
+        self.code = code
+        self.path = path
+        self.size = size
+        self.digest = digest
+        self.data = data
+        self.error = error
+        self.keys = frozenset(data)
+        # Only values that have placeholders are indexed, most have none
+        self.placeholders = {
+            key: frozenset(PLACEHOLDER_PATTERN.findall(value))
+            for key, value in data.items() if '{' in value
+        }
+        self.empty = frozenset(key for key, value in data.items() if not value or not value.strip())
+
+
+def load_locale(path: Path) -> LocaleFile:
+    """Read and index a single translation file, recording rather than raising errors"""
+    try:
+        raw = path.read_bytes()
+    except OSError as e:
+        return LocaleFile(path.stem, path, 0, "", {}, f"Failed to read - {e}")
+
+    digest = hashlib.sha256(raw).hexdigest()
+    try:
+        data = json.loads(raw.decode('utf-8'))
+    except (UnicodeDecodeError, json.JSONDecodeError) as e:
+        return LocaleFile(path.stem, path, len(raw), digest, {}, f"Invalid JSON - {e}")
+    if not isinstance(data, dict) or not all(isinstance(value, str) for value in data.values()):
+        return LocaleFile(path.stem, path, len(raw), digest, {}, "Invalid JSON - expected an object of strings")
+    return LocaleFile(path.stem, path, len(raw), digest, data)
+
+
+class TranslationCatalog:
+    """All translation files of a directory, parsed once"""
+
+    def __init__(self, translations_dir: Path, only: Iterable[str] = None,
+                 workers: int = DEFAULT_WORKERS):
+        self.translations_dir = translations_dir
+        self.only = None if only is None else frozenset(only)
+        paths = sorted(
+            path for path in translations_dir.glob("*.json")
+            if self.only is None or path.stem in self.only
+        )
+        # Reading overlaps on the pool; small directories are not worth the threads
+        if workers > 1 and len(paths) > 1:
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                locales = list(executor.map(load_locale, paths))
+        else:
+            locales = [load_locale(path) for path in paths]
+        self.locales: Dict[str, LocaleFile] = {locale.code: locale for locale in locales}
+
+    def covers(self, codes: Optional[Iterable[str]]) -> bool:
+        """True if every code in codes (None for all) was in scope when the catalog was loaded"""
+        if self.only is None:
+            return True
+        return codes is not None and self.only.issuperset(codes)
+
+    @property
+    def source(self) -> Optional[LocaleFile]:
+        locale = self.locales.get(SOURCE_LOCALE)
+        return locale if locale is not None and locale.error is None else None
+
+    @property
+    def errors(self) -> Dict[str, str]:
+        return {code: locale.error for code, locale in self.locales.items() if locale.error}
+
+    def translations(self) -> Dict[str, Dict[str, str]]:
+        """Parsed data of every loadable file, keyed by language code"""
+        return {code: locale.data for code, locale in self.locales.items() if locale.error is None}
+
+    def translated_codes(self) -> List[str]:
+        """Codes of every file except the source, sorted"""
+        return sorted(code for code in self.locales if code != SOURCE_LOCALE)
+
+    def missing_keys(self, code: str) -> FrozenSet[str]:
+        return self.source.keys - self.locales[code].keys
+
+    def extra_keys(self, code: str) -> FrozenSet[str]:
+        return self.locales[code].keys - self.source.keys
+
+    def empty_keys(self, code: str) -> FrozenSet[str]:
+        return self.locales[code].empty
+
+    def placeholder_mismatches(self, code: str) -> List[Tuple[str, FrozenSet[str], FrozenSet[str]]]:
+        """(key, expected, got) for every shared key whose placeholders differ from the source"""
+        source = self.source
+        locale = self.locales[code]
+        candidates = (source.placeholders.keys() | locale.placeholders.keys()) & source.keys & locale.keys
+        mismatches = []
+        for key in sorted(candidates):
+            expected = source.placeholders.get(key, NO_PLACEHOLDERS)
+            got = locale.placeholders.get(key, NO_PLACEHOLDERS)
+            if expected != got:
+                mismatches.append((key, expected, got))
+        return mismatches
+
+    def completion(self, code: str) -> float:
+        """Percentage of source keys with a non-empty translation"""
+        source_keys = self.source.keys
+        if not source_keys:
+            return 0.0
+        locale = self.locales[code]
+        translated = (source_keys & locale.keys) - locale.empty
+        return len(translated) / len(source_keys) * 100
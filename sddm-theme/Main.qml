@@ -19,6 +19,16 @@ Item {
     Component.onCompleted: {
         if (keyboard)
             capsLockOn = keyboard.capsLock;
+        Trace.mark("main.completed");
+    }
+    onStateChanged: Trace.mark("state.changed", { "state": state })
+
+    // The software scene graph (no working GL) selects the lite render profile
+    readonly property bool softwareRendering: GraphicsInfo.api === GraphicsInfo.Software
+    Binding {
+        target: Config
+        property: "softwareRendering"
+        value: root.softwareRendering
     }
     onCapsLockOnChanged: {
         loginScreen.updateCapsLock();
@@ -41,7 +51,7 @@ Item {
             }
             PropertyChanges {
                 target: backgroundEffect
-                blurMax: Config.lockScreenBlur
+                blurMax: backgroundContainer.lockBlurredSource !== "" ? 0 : Config.lockScreenBlur
                 brightness: Config.lockScreenBrightness
                 saturation: Config.lockScreenSaturation
             }
@@ -62,7 +72,7 @@ Item {
             }
             PropertyChanges {
                 target: backgroundEffect
-                blurMax: Config.loginScreenBlur
+                blurMax: backgroundContainer.loginBlurredSource !== "" ? 0 : Config.loginScreenBlur
                 brightness: Config.loginScreenBrightness
                 saturation: Config.loginScreenSaturation
             }
@@ -70,6 +80,10 @@ Item {
     ]
     transitions: Transition {
         enabled: Config.enableAnimations
+        onRunningChanged: {
+            if (!running)
+                Trace.mark("state.settled", { "state": root.state });
+        }
         PropertyAnimation {
             duration: 150
             properties: "opacity"
@@ -104,6 +118,39 @@ Item {
             property string currentBackground: ""
             property bool displayColor: root.state === "lockState" && Config.lockScreenUseBackgroundColor || root.state === "loginState" && Config.loginScreenUseBackgroundColor
             property bool frontLayerActive: true
+            // Layer loading the next background; the crossfade waits for it
+            property Item pendingLayer: null
+            // The first background is decoded before the first frame, later ones off the GUI thread
+            property bool layersAsynchronous: false
+            // Estimated decoded size of the backgrounds in backgroundCache
+            property real cachedBytes: 0
+            // With a still background and no pre-blurred copies, each state's blur
+            // is rendered once into lockBlurCache/loginBlurCache and the state
+            // change crossfades them instead of animating the live blur
+            property bool blurCached: Config.cacheBlur && !Config.lite
+                && (Config.lockScreenBlur > 0 || Config.loginScreenBlur > 0)
+                && !isVideo(currentBackground)
+                && lockBlurredSource === "" && loginBlurredSource === ""
+                && !Config.lockScreenUseBackgroundColor && !Config.loginScreenUseBackgroundColor
+            // True while the image layers crossfade: the cached blur follows them live
+            property bool crossfading: false
+            // SDDM UserModel NameRole
+            readonly property int userNameRole: Qt.UserRole + 1
+            
+            // Pre-blurred copies from update-sddm-backgrounds-cache; when present the
+            // blur shader is skipped and the state change becomes a crossfade
+            property string lockBlurredSource: resolveSource(blurredBackground(currentBackground, Config.lockScreenBlur))
+            property string loginBlurredSource: resolveSource(blurredBackground(currentBackground, Config.loginScreenBlur))
+            
+            property int imageFillMode: {
+                if (Config.backgroundFillMode === "stretch") {
+                    return Image.Stretch;
+                } else if (Config.backgroundFillMode === "fit") {
+                    return Image.PreserveAspectFit;
+                } else {
+                    return Image.PreserveAspectCrop;
+                }
+            }
             
             // Fallback color background
             Rectangle {
@@ -118,21 +165,21 @@ Item {
             Image {
                 id: backgroundImageA
                 anchors.fill: parent
-                cache: false
+                asynchronous: backgroundContainer.layersAsynchronous
                 mipmap: true
                 opacity: 1.0
                 z: 0
-                
-                fillMode: {
-                    if (Config.backgroundFillMode === "stretch") {
-                        return Image.Stretch;
-                    } else if (Config.backgroundFillMode === "fit") {
-                        return Image.PreserveAspectFit;
-                    } else {
-                        return Image.PreserveAspectCrop;
-                    }
+
+                onStatusChanged: {
+                    backgroundContainer.traceLayer("A", this)
+                    if (status !== Image.Loading)
+                        backgroundContainer.revealLayer(this)
                 }
                 
+                fillMode: backgroundContainer.imageFillMode
+                // Set explicitly: an unset autoTransform is a different pixmap cache key
+                autoTransform: false
+                
                 Behavior on opacity {
                     enabled: Config.enableAnimations
                     NumberAnimation {
@@ -146,18 +193,66 @@ Item {
             Image {
                 id: backgroundImageB
                 anchors.fill: parent
-                cache: false
+                asynchronous: backgroundContainer.layersAsynchronous
                 mipmap: true
                 opacity: 0.0
                 z: 1
+
+                onStatusChanged: {
+                    backgroundContainer.traceLayer("B", this)
+                    if (status !== Image.Loading)
+                        backgroundContainer.revealLayer(this)
+                }
+                
+                fillMode: backgroundContainer.imageFillMode
+                // Set explicitly: an unset autoTransform is a different pixmap cache key
+                autoTransform: false
                 
+                Behavior on opacity {
+                    enabled: Config.enableAnimations
+                    NumberAnimation {
+                        duration: 400
+                        easing.type: Easing.InOutQuad
+                    }
+                }
+            }
+            
+            // Recently shown backgrounds and those of the users next to the current
+            // one, with their pre-blurred copies, most recent first. The hidden images
+            // hold their decoded pixmaps in Qt's pixmap cache, where the background
+            // and blurred layers pick them up without decoding again. The cache key
+            // includes the source size, fill mode and auto-transform, so all three
+            // must match the layers.
+            ListModel {
+                id: backgroundCache
+            }
+            Repeater {
+                model: backgroundCache
+                delegate: Image {
+                    visible: false
+                    asynchronous: true
+                    fillMode: backgroundContainer.imageFillMode
+                    autoTransform: backgroundImageA.autoTransform
+                    source: model.source
+                    sourceSize: Qt.size(model.decodeWidth, model.decodeHeight)
+                }
+            }
+            
+            // Video background layer (z: 1.5), faded in over the poster frame
+            // shown by the image layers once playback is under way
+            VideoOutput {
+                id: backgroundVideo
+                anchors.fill: parent
+                z: 1.5
+                opacity: 0.0
+                visible: opacity > 0
                 fillMode: {
                     if (Config.backgroundFillMode === "stretch") {
-                        return Image.Stretch;
+                        return VideoOutput.Stretch;
                     } else if (Config.backgroundFillMode === "fit") {
-                        return Image.PreserveAspectFit;
+                        return VideoOutput.PreserveAspectFit;
                     } else {
-                        return Image.PreserveAspectCrop;
+                        return VideoOutput.PreserveAspectCrop;
                     }
                 }
                 
@@ -170,10 +265,76 @@ Item {
                 }
             }
             
+            MediaPlayer {
+                id: videoPlayer
+                videoOutput: backgroundVideo
+                loops: MediaPlayer.Infinite
+                
+                function revealWhenPlaying() {
+                    if (playbackState === MediaPlayer.PlayingState && mediaStatus === MediaPlayer.BufferedMedia)
+                        backgroundVideo.opacity = 1.0
+                }
+                
+                onMediaStatusChanged: {
+                    if (mediaStatus === MediaPlayer.LoadedMedia) {
+                        play()
+                    } else if (mediaStatus === MediaPlayer.InvalidMedia) {
+                        // Keep showing the poster
+                        console.warn("Cannot play video background", source, errorString)
+                    }
+                    revealWhenPlaying()
+                }
+                onPlaybackStateChanged: revealWhenPlaying()
+            }
+            
+            // Pre-blurred lock screen layer (z: 2)
+            BlurredLayer {
+                id: lockBlurImage
+                anchors.fill: parent
+                z: 2
+                asynchronous: backgroundContainer.layersAsynchronous
+                fillMode: backgroundContainer.imageFillMode
+                // Only hold the image while shown or fading out (backgroundCache
+                // keeps it decoded for the next time)
+                source: root.state === "lockState" || opacity > 0 ? backgroundContainer.lockBlurredSource : ""
+                opacity: root.state === "lockState" && backgroundContainer.lockBlurredSource !== "" ? 1.0 : 0.0
+                
+                Behavior on opacity {
+                    enabled: Config.enableAnimations
+                    NumberAnimation {
+                        duration: 400
+                        easing.type: Easing.InOutQuad
+                    }
+                }
+            }
+            
+            // Pre-blurred login screen layer (z: 3)
+            BlurredLayer {
+                id: loginBlurImage
+                anchors.fill: parent
+                z: 3
+                asynchronous: backgroundContainer.layersAsynchronous
+                fillMode: backgroundContainer.imageFillMode
+                source: root.state === "loginState" || opacity > 0 ? backgroundContainer.loginBlurredSource : ""
+                opacity: root.state === "loginState" && backgroundContainer.loginBlurredSource !== "" ? 1.0 : 0.0
+                
+                Behavior on opacity {
+                    enabled: Config.enableAnimations
+                    NumberAnimation {
+                        duration: 400
+                        easing.type: Easing.InOutQuad
+                    }
+                }
+            }
+            
             function getCurrentBackground() {
+                return backgroundOf(loginScreen.userName)
+            }
+            
+            function backgroundOf(username) {
                 // Use AccountsService background if available and enabled
-                if (root.useAccountsServiceBackgrounds && loginScreen.userName) {
-                    var userBg = AccountsService.getUserBackground(loginScreen.userName)
+                if (root.useAccountsServiceBackgrounds && username) {
+                    var userBg = AccountsService.getUserBackground(username)
                     if (userBg && userBg.length > 0) {
                         return userBg
                     }
@@ -183,6 +344,146 @@ Item {
                 return root.state === "lockState" ? Config.lockScreenBackground : Config.loginScreenBackground
             }
             
+            function traceLayer(name, layer) {
+                if (layer.status === Image.Ready)
+                    Trace.mark("background.ready", { "layer": name, "source": layer.source.toString() });
+                else if (layer.status === Image.Error)
+                    Trace.mark("background.error", { "layer": name, "source": layer.source.toString() });
+            }
+
+            // Size to decode a background at: the original scaled to what the fill
+            // mode shows on this screen, so large photos are downscaled while they
+            // are decoded. Zero (natural size) when the dimensions are unknown or
+            // the image is no larger than needed.
+            function decodeSize(path) {
+                var dimensions = AccountsService.getBackgroundDimensions(path)
+                if (!dimensions)
+                    return Qt.size(0, 0)
+
+                var screenWidth = width * Screen.devicePixelRatio
+                var screenHeight = height * Screen.devicePixelRatio
+                var scale = imageFillMode === Image.PreserveAspectFit
+                    ? Math.min(screenWidth / dimensions[0], screenHeight / dimensions[1])
+                    : Math.max(screenWidth / dimensions[0], screenHeight / dimensions[1])
+                if (scale >= 1)
+                    return Qt.size(0, 0)
+                return Qt.size(Math.ceil(dimensions[0] * scale), Math.ceil(dimensions[1] * scale))
+            }
+            
+            // Point a background layer at a new background, choosing the decode size
+            // before the source so the image is only decoded once
+            function loadLayer(layer, path) {
+                var size = decodeSize(path)
+                layer.sourceSize = size
+                // Decoded at (about) screen size: no mipmaps needed for minification
+                layer.mipmap = !Config.lite && size.width === 0 && AccountsService.getBackgroundDimensions(path) === null
+                layer.source = resolveSource(scaledBackground(path))
+            }
+            
+            // Keep a background and its pre-blurred copies decoded in backgroundCache,
+            // the background itself most recent
+            function cacheBackground(path) {
+                if (!path || Config.backgroundCacheSize <= 0)
+                    return
+                // Pre-blurred copies are scaled to the screen: decoded at natural size
+                cacheSource(resolveSource(blurredBackground(path, Config.lockScreenBlur)), Qt.size(0, 0))
+                cacheSource(resolveSource(blurredBackground(path, Config.loginScreenBlur)), Qt.size(0, 0))
+                var image = isVideo(path) ? posterOf(path) : path
+                cacheSource(resolveSource(scaledBackground(image)), decodeSize(image))
+            }
+            
+            // Add an image to backgroundCache (or make it the most recent), evicting
+            // the least recently used ones beyond Config.backgroundCacheSize
+            function cacheSource(source, size) {
+                if (source === "")
+                    return
+                
+                for (var i = 0; i < backgroundCache.count; i++) {
+                    if (backgroundCache.get(i).source === source) {
+                        backgroundCache.move(i, 0, 1)
+                        return
+                    }
+                }
+                
+                var pixels = size.width > 0 ? size.width * size.height : width * height * Screen.devicePixelRatio * Screen.devicePixelRatio
+                backgroundCache.insert(0, { "source": source, "decodeWidth": size.width, "decodeHeight": size.height, "bytes": pixels * 4 })
+                cachedBytes += pixels * 4
+                
+                var limit = Config.backgroundCacheSize * 1024 * 1024
+                while (backgroundCache.count > 1 && cachedBytes > limit) {
+                    cachedBytes -= backgroundCache.get(backgroundCache.count - 1).bytes
+                    backgroundCache.remove(backgroundCache.count - 1)
+                }
+            }
+            
+            // Decode the backgrounds of the users either side of the current one
+            // ahead of time, then keep the current background most recent
+            function prefetchNeighbors() {
+                var count = userModel.rowCount()
+                if (root.useAccountsServiceBackgrounds && count > 1) {
+                    var current = loginScreen.userIndex
+                    var neighbors = [(current + count - 1) % count, (current + 1) % count]
+                    for (var i = 0; i < neighbors.length; i++) {
+                        var username = userModel.data(userModel.index(neighbors[i], 0), userNameRole)
+                        cacheBackground(backgroundOf(username))
+                    }
+                }
+                cacheBackground(currentBackground)
+            }
+            
+            // Crossfade to a layer once its image is decoded (or failed)
+            function revealLayer(layer) {
+                if (layer !== pendingLayer)
+                    return
+                pendingLayer = null
+                frontLayerActive = layer === backgroundImageA
+                backgroundImageA.opacity = frontLayerActive ? 1.0 : 0.0
+                backgroundImageB.opacity = frontLayerActive ? 0.0 : 1.0
+                crossfading = true
+                crossfadeTimer.restart()
+            }
+            
+            Timer {
+                id: crossfadeTimer
+                interval: Config.enableAnimations ? 450 : 0
+                onTriggered: {
+                    backgroundContainer.crossfading = false
+                    // Render both cached blurs again once, the hidden one when it is next shown
+                    lockBlurCache.scheduleUpdate()
+                    loginBlurCache.scheduleUpdate()
+                }
+            }
+            
+            function isVideo(path) {
+                return /\.(avi|m4v|mkv|mov|mp4|webm)$/i.test(path)
+            }
+            
+            // Image shown for a video background until the video plays: the poster
+            // frame from update-sddm-backgrounds-cache, else the configured placeholder
+            function posterOf(path) {
+                return AccountsService.getPoster(path) || Config.animatedBackgroundPlaceholder
+            }
+            
+            function playVideo(path) {
+                var source = resolveSource(path)
+                if (source === videoPlayer.source.toString())
+                    return
+                backgroundVideo.opacity = 0.0
+                videoPlayer.stop()
+                // Loading the new source starts playback from onMediaStatusChanged
+                videoPlayer.source = source
+            }
+            
+            function scaledBackground(path) {
+                // Prefer a copy pre-scaled to this screen by update-sddm-backgrounds-cache
+                return AccountsService.getScaledBackground(path, width * Screen.devicePixelRatio, height * Screen.devicePixelRatio)
+            }
+            
+            // Copy of a background pre-blurred for this screen, or "" if there is none
+            function blurredBackground(path, blur) {
+                return AccountsService.getBlurredBackground(path, blur, width * Screen.devicePixelRatio, height * Screen.devicePixelRatio)
+            }
+            
             function resolveSource(path) {
                 if (!path || path.length === 0)
                     // Empty path: no background image configured at build time.
@@ -203,37 +504,42 @@ Item {
             }
             
             function switchBackground(newBg) {
-                var newSource = resolveSource(newBg)
+                var video = isVideo(newBg) ? newBg : ""
+                var image = video !== "" ? posterOf(video) : newBg
+                var newSource = resolveSource(scaledBackground(image))
                 var currentSource = frontLayerActive ? backgroundImageA.source.toString() : backgroundImageB.source.toString()
                 
+                playVideo(video)
                 if (newSource === currentSource) {
+                    // Switched back before the pending layer was shown
+                    pendingLayer = null
                     return
                 }
                 
-                if (frontLayerActive) {
-                    // A is visible, crossfade to B
-                    backgroundImageB.source = newSource
-                    backgroundImageB.opacity = 1.0
-                    backgroundImageA.opacity = 0.0
-                    frontLayerActive = false
-                } else {
-                    // B is visible, crossfade to A
-                    backgroundImageA.source = newSource
-                    backgroundImageA.opacity = 1.0
-                    backgroundImageB.opacity = 0.0
-                    frontLayerActive = true
-                }
+                // Load into the hidden layer (reusing it if its last load is still
+                // pending) and crossfade once it is ready: immediately when the
+                // background is in backgroundCache, else when the decode finishes
+                var layer = pendingLayer || (frontLayerActive ? backgroundImageB : backgroundImageA)
+                pendingLayer = null
+                loadLayer(layer, image)
+                pendingLayer = layer
+                Trace.mark("background.switch", { "cached": layer.status === Image.Ready, "source": layer.source.toString() })
+                if (layer.status !== Image.Loading)
+                    revealLayer(layer)
             }
             
             Component.onCompleted: {
                 var initialBg = getCurrentBackground()
                 currentBackground = initialBg
-                var initialSource = resolveSource(initialBg)
                 
-                backgroundImageA.source = initialSource
+                var initialVideo = isVideo(initialBg) ? initialBg : ""
+                loadLayer(backgroundImageA, initialVideo !== "" ? posterOf(initialVideo) : initialBg)
+                playVideo(initialVideo)
                 backgroundImageA.opacity = 1.0
                 backgroundImageB.opacity = 0.0
                 frontLayerActive = true
+                layersAsynchronous = true
+                prefetchNeighbors()
             }
             
             Connections {
@@ -244,6 +550,7 @@ Item {
                         backgroundContainer.currentBackground = newBg
                         backgroundContainer.switchBackground(newBg)
                     }
+                    backgroundContainer.prefetchNeighbors()
                 }
             }
         }
@@ -253,10 +560,69 @@ Item {
             id: backgroundEffect
             source: backgroundContainer
             anchors.fill: parent
+            // Nothing left to do at runtime when the blur is pre-rendered and no colour adjustment is set
+            visible: !Config.lite && !backgroundContainer.blurCached && (blurMax > 0 || brightness !== 0 || saturation !== 0)
             blurEnabled: backgroundContainer.visible && blurMax > 0
             blur: blurMax > 0 ? 1.0 : 0.0
             autoPaddingEnabled: false
         }
+        
+        // Lock screen blur rendered once (see backgroundContainer.blurCached). Items
+        // at opacity 0 are not rendered, so each cache is only drawn when it is
+        // first shown and again after the background changes.
+        ShaderEffectSource {
+            id: lockBlurCache
+            anchors.fill: parent
+            visible: backgroundContainer.blurCached
+            // Stays opaque under the login screen one until that has faded in
+            opacity: root.state === "lockState" || loginBlurCache.opacity < 1.0 ? 1.0 : 0.0
+            sourceItem: lockBlurEffect
+            hideSource: true
+            live: backgroundContainer.crossfading
+            
+            MultiEffect {
+                id: lockBlurEffect
+                anchors.fill: parent
+                source: backgroundContainer
+                blurEnabled: Config.lockScreenBlur > 0
+                blurMax: Config.lockScreenBlur
+                blur: 1.0
+                brightness: Config.lockScreenBrightness
+                saturation: Config.lockScreenSaturation
+                autoPaddingEnabled: false
+            }
+        }
+        
+        // Login screen blur rendered once, faded in over the lock screen one
+        ShaderEffectSource {
+            id: loginBlurCache
+            anchors.fill: parent
+            visible: backgroundContainer.blurCached
+            opacity: root.state === "loginState" ? 1.0 : 0.0
+            sourceItem: loginBlurEffect
+            hideSource: true
+            live: backgroundContainer.crossfading
+            
+            MultiEffect {
+                id: loginBlurEffect
+                anchors.fill: parent
+                source: backgroundContainer
+                blurEnabled: Config.loginScreenBlur > 0
+                blurMax: Config.loginScreenBlur
+                blur: 1.0
+                brightness: Config.loginScreenBrightness
+                saturation: Config.loginScreenSaturation
+                autoPaddingEnabled: false
+            }
+            
+            Behavior on opacity {
+                enabled: Config.enableAnimations
+                NumberAnimation {
+                    duration: 400
+                    easing.type: Easing.InOutQuad
+                }
+            }
+        }
 
         Item {
             id: screenContainer
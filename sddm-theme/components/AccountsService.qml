@@ -4,40 +4,136 @@ import QtQuick
 QtObject {
     // This data is auto-generated by update-sddm-backgrounds-cache
     // DO NOT EDIT THIS FILE MANUALLY - it will be overwritten
-    readonly property string embeddedCacheData: ""
-    
+    readonly property int userShardCount: 0
+    // Pre-masked thumbnails of faces/face-N.png, empty when not rendered
+    readonly property var faceThumbnails: []
+
+    // username -> background, filled as users are looked up
     property var userBackgrounds: ({})
-    property bool cacheLoaded: false
-    
-    Component.onCompleted: {
-        loadEmbeddedCache()
-    }
-    
-    function loadEmbeddedCache() {
-        if (embeddedCacheData.length === 0) {
-            return
-        }
-        
-        try {
-            var data = JSON.parse(embeddedCacheData)
-            for (var user in data) {
-                userBackgrounds[user] = data[user]
-            }
-            cacheLoaded = true
-        } catch (e) {
-            console.error("AccountsService: Failed to parse cache data:", e)
+    // background path -> [[width, height, path, blur], ...]
+    property var backgroundVariants: ({})
+    // background path -> [width, height] of the original image
+    property var backgroundDimensions: ({})
+    // video background path -> poster frame shown until the video plays
+    property var backgroundPosters: ({})
+    // shard index -> {username: [background, variants, avatar, face, icon, dimensions, poster]}
+    // where variants and dimensions are those of the poster for video backgrounds
+    property var loadedShards: ({})
+
+    // FNV-1a over UTF-16 code units, must match shard_index() in the updater
+    function shardIndex(username) {
+        var hash = 0x811c9dc5
+        for (var i = 0; i < username.length; i++) {
+            hash = Math.imul(hash ^ username.charCodeAt(i), 0x01000193) >>> 0
         }
+        return hash % userShardCount
     }
-    
-    function getUserBackground(username) {
-        if (!username || username.length === 0) {
-            return ""
+
+    function loadShard(index) {
+        if (loadedShards.hasOwnProperty(index)) {
+            return loadedShards[index]
+        }
+
+        var users = {}
+        var name = "users-" + ("000" + index.toString(16)).slice(-4) + ".qml"
+        var component = Qt.createComponent(Qt.resolvedUrl("../cache/user-shards/" + name))
+        if (component.status === Component.Ready) {
+            var shard = component.createObject(null)
+            users = shard.users
+            shard.destroy()
+        } else {
+            console.error("AccountsService: Failed to load user shard", name, component.errorString())
+        }
+        loadedShards[index] = users
+        return users
+    }
+
+    function getUserEntry(username) {
+        if (!username || username.length === 0 || userShardCount === 0) {
+            return null
         }
-        
+
+        return loadShard(shardIndex(username))[username] || null
+    }
+
+    function getUserBackground(username) {
         if (userBackgrounds.hasOwnProperty(username)) {
             return userBackgrounds[username]
         }
-        
+
+        var entry = getUserEntry(username)
+        var background = entry ? entry[0] : ""
+        if (background !== "") {
+            var image = entry[6] || background
+            if (entry[6]) {
+                backgroundPosters[background] = entry[6]
+            }
+            if (!backgroundVariants.hasOwnProperty(image)) {
+                backgroundVariants[image] = entry[1]
+            }
+            if (entry[5] && !backgroundDimensions.hasOwnProperty(image)) {
+                backgroundDimensions[image] = entry[5]
+            }
+        }
+        if (entry) {
+            userBackgrounds[username] = background
+        }
+        return background
+    }
+
+    // Pre-masked thumbnail of the user's AccountsService icon, or ""
+    function getUserAvatar(username) {
+        var entry = getUserEntry(username)
+        return entry ? entry[2] : ""
+    }
+
+    // The user's icon at a path the greeter can read without touching home
+    // directories, or "" if the user has no icon
+    function getUserIcon(username) {
+        var entry = getUserEntry(username)
+        return entry ? entry[4] : ""
+    }
+
+    // Pre-masked thumbnail of the user's fallback face, or ""
+    function getFallbackAvatar(username) {
+        var entry = getUserEntry(username)
+        return entry && faceThumbnails.length > entry[3] ? faceThumbnails[entry[3]] : ""
+    }
+
+    // Smallest variant of a background with the given blur radius that still
+    // covers width x height (in device pixels), or "" if there is none
+    function findVariant(path, blur, width, height) {
+        if (!path || width <= 0 || height <= 0 || !backgroundVariants.hasOwnProperty(path)) {
+            return ""
+        }
+
+        var variants = backgroundVariants[path]
+        for (var i = 0; i < variants.length; i++) {
+            if (variants[i][3] === blur && variants[i][0] >= width && variants[i][1] >= height) {
+                return variants[i][2]
+            }
+        }
+
         return ""
     }
+
+    // Poster frame of a video background, or "" if there is none
+    function getPoster(path) {
+        return path && backgroundPosters.hasOwnProperty(path) ? backgroundPosters[path] : ""
+    }
+
+    // [width, height] of a background as validated by the updater, or null if unknown
+    function getBackgroundDimensions(path) {
+        return path && backgroundDimensions.hasOwnProperty(path) ? backgroundDimensions[path] : null
+    }
+
+    // Pre-scaled copy of a background, or the original path if there is none
+    function getScaledBackground(path, width, height) {
+        return findVariant(path, 0, width, height) || path
+    }
+
+    // Pre-blurred copy of a background, or "" if the blur must be done at runtime
+    function getBlurredBackground(path, blur, width, height) {
+        return blur > 0 ? findVariant(path, blur, width, height) : ""
+    }
 }
@@ -15,9 +15,48 @@ Rectangle {
     property string tooltipText: ""
     property bool showTooltip: false
     
-    property string fallbackAvatar: ""
-    property bool useFallback: false
-    property bool checkedForFallback: false
+    // Steps down on load errors: 0 the user's icon, 1 the fallback face, 2 the default icon
+    property int fallbackLevel: 0
+    property bool cacheFailed: false
+    readonly property int traceId: Trace.enabled ? Trace.newId() : 0
+
+    // Every avatar decodes at the largest size it is shown at, in device pixels.
+    // The size is the same for all avatars, so delegates showing the same file
+    // share one texture through Qt's pixmap cache (keyed by source and size).
+    readonly property int decodeSize: Math.ceil(Math.max(Config.avatarActiveSize, Config.avatarInactiveSize) * Config.generalScale * Screen.devicePixelRatio)
+
+    // Icon published by the backgrounds cache: used instead of source so the
+    // greeter never opens files in (possibly slow, network) home directories
+    property string publishedIcon: AccountsService.getUserIcon(username)
+    // The cache lists the user but published no icon (none set, or a private
+    // one it skipped): never fall back to source, which may be in /home
+    readonly property bool iconWithheld: publishedIcon === "" && AccountsService.getUserEntry(username) !== null
+    // Thumbnail from the backgrounds cache, already sized and clipped to the
+    // avatar shape: shown as a plain image, without the mask effect
+    property string cachedAvatar: {
+        if (cacheFailed)
+            return "";
+        var thumbnail = AccountsService.getUserAvatar(username);
+        if (thumbnail === "" && publishedIcon === "" && (iconWithheld || isDefaultSDDMAvatar(source))) {
+            thumbnail = AccountsService.getFallbackAvatar(username);
+        }
+        return thumbnail;
+    }
+    // SDDM's default avatar is never decoded: users without an icon go straight to their fallback face
+    readonly property int faceLevel: {
+        if (fallbackLevel === 0 && !(username && (iconWithheld || isDefaultSDDMAvatar(publishedIcon || source))))
+            return 0;
+        return fallbackLevel <= 1 && username ? 1 : 2;
+    }
+    readonly property string faceSource: {
+        if (cachedAvatar !== "")
+            return "";
+        if (faceLevel === 0)
+            return publishedIcon || source;
+        if (faceLevel === 1)
+            return getFallbackAvatar(username);
+        return Config.getIcon("user-default");
+    }
 
     signal clicked
     signal clickedOutside
@@ -26,6 +65,8 @@ Rectangle {
     color: "transparent"
     antialiasing: true
 
+    Component.onCompleted: Trace.mark("avatar.created", { "id": traceId })
+
     // Function to check if the source is SDDM's default avatar
     function isDefaultSDDMAvatar(sourcePath) {
         if (!sourcePath || sourcePath.length === 0) return true;
@@ -67,25 +108,6 @@ Rectangle {
         return Qt.resolvedUrl("../faces/face-" + selectedIndex + ".png");
     }
 
-    // Timer to check and replace default avatar after initial load
-    Timer {
-        interval: 50
-        running: true
-        repeat: false
-        onTriggered: {
-            if (!avatar.checkedForFallback && avatar.username) {
-                avatar.checkedForFallback = true;
-                
-                // Check if we should use a fallback avatar
-                if (isDefaultSDDMAvatar(faceImage.source)) {
-                    avatar.fallbackAvatar = avatar.getFallbackAvatar(avatar.username);
-                    avatar.useFallback = true;
-                    faceImage.source = avatar.fallbackAvatar;
-                }
-            }
-        }
-    }
-
     // Background
     Rectangle {
         anchors.fill: parent
@@ -95,13 +117,47 @@ Rectangle {
         visible: true
     }
 
+    Image {
+        id: cachedImage
+        source: avatar.cachedAvatar
+        sourceSize: Qt.size(avatar.decodeSize, avatar.decodeSize)
+        anchors.fill: parent
+        asynchronous: true
+        visible: avatar.cachedAvatar !== ""
+        smooth: true
+        fillMode: Image.PreserveAspectFit
+
+        onStatusChanged: {
+            if (status === Image.Error) {
+                // Stale cache entry, fall back to decoding and masking the original
+                avatar.cacheFailed = true;
+                Trace.mark("avatar.fallback", { "id": avatar.traceId, "reason": "cache" });
+            } else if (status === Image.Ready) {
+                Trace.mark("avatar.loaded", { "id": avatar.traceId, "kind": "cached" });
+            }
+        }
+
+        // Border
+        Rectangle {
+            anchors.fill: parent
+            radius: avatar.squareRadius
+            color: "transparent"
+            border.width: avatar.strokeSize
+            border.color: avatar.strokeColor
+            antialiasing: true
+        }
+    }
+
     Image {
         id: faceImage
-        source: parent.source
+        source: avatar.faceSource
+        // Decoded off the GUI thread at display size, so no mipmaps are needed
+        sourceSize: Qt.size(avatar.decodeSize, avatar.decodeSize)
         anchors.fill: parent
-        mipmap: true
+        asynchronous: true
         antialiasing: true
-        visible: false
+        // Shown unmasked in the lite profile
+        visible: Config.lite && avatar.cachedAvatar === ""
         smooth: true
 
         fillMode: Image.PreserveAspectCrop
@@ -109,20 +165,12 @@ Rectangle {
         verticalAlignment: Image.AlignVCenter
 
         onStatusChanged: {
-            if (status === Image.Error) {
-                // If image fails to load, try fallback
-                if (!avatar.useFallback && avatar.username) {
-                    avatar.fallbackAvatar = avatar.getFallbackAvatar(avatar.username);
-                    avatar.useFallback = true;
-                    source = avatar.fallbackAvatar;
-                } else {
-                    // If fallback also fails, use the default icon
-                    source = Config.getIcon("user-default");
-                    faceEffects.colorization = 1;
-                }
+            if (status === Image.Error && avatar.faceLevel < 2) {
+                // Try the fallback face, then the default icon
+                avatar.fallbackLevel = avatar.faceLevel + 1;
+                Trace.mark("avatar.fallback", { "id": avatar.traceId, "reason": avatar.faceLevel === 1 ? "error" : "default-icon" });
             } else if (status === Image.Ready) {
-                // Image loaded successfully
-                faceEffects.colorization = 0;
+                Trace.mark("avatar.loaded", { "id": avatar.traceId, "kind": ["icon", "fallback", "default-icon"][avatar.faceLevel] });
             }
         }
 
@@ -141,13 +189,15 @@ Rectangle {
         id: faceEffects
         anchors.fill: faceImage
         source: faceImage
+        visible: !Config.lite && avatar.cachedAvatar === ""
         antialiasing: true
         maskEnabled: true
         maskSource: faceImageMask
         maskSpreadAtMin: 1.0
         maskThresholdMax: 1.0
         maskThresholdMin: 0.5
-        colorization: 0
+        // The default icon is monochrome and takes the border color
+        colorization: avatar.faceLevel === 2 ? 1 : 0
         colorizationColor: avatar.strokeColor === Config.passwordInputBackgroundColor && (1.0 - Config.passwordInputBackgroundOpacity < 0.3) ? Config.passwordInputContentColor : avatar.strokeColor
     }
 
@@ -155,7 +205,7 @@ Rectangle {
         id: faceImageMask
 
         height: this.width
-        layer.enabled: true
+        layer.enabled: !Config.lite && avatar.cachedAvatar === ""
         layer.smooth: true
         visible: false
         width: faceImage.width
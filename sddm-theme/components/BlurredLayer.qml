@@ -0,0 +1,106 @@
+import QtQuick
+
+// Pre-blurred background from update-sddm-backgrounds-cache, double buffered
+// like the background layers in Main.qml: a new source is decoded into the
+// hidden image and crossfaded in once ready, which is immediately when it is
+// already decoded in Main.qml's backgroundCache
+Item {
+    id: blurredLayer
+    property string source: ""
+    property bool asynchronous: true
+    property int fillMode: Image.PreserveAspectCrop
+    property bool frontImageActive: true
+    // Image loading the next source; the crossfade waits for it
+    property Image pendingImage: null
+
+    onSourceChanged: load()
+
+    function load() {
+        if (source === "") {
+            // Hidden: drop both images until the layer is shown again
+            pendingImage = null
+            imageA.source = ""
+            imageB.source = ""
+            return
+        }
+
+        var front = frontImageActive ? imageA : imageB
+        if (front.source.toString() === "") {
+            // Nothing shown yet: no crossfade
+            pendingImage = null
+            front.source = source
+            return
+        }
+        if (source === front.source.toString()) {
+            // Switched back before the pending image was shown
+            pendingImage = null
+            return
+        }
+
+        // Load into the hidden image (reusing it if its last load is still pending)
+        var image = pendingImage || (frontImageActive ? imageB : imageA)
+        pendingImage = null
+        image.source = source
+        pendingImage = image
+        if (image.status !== Image.Loading)
+            reveal(image)
+    }
+
+    // Crossfade to an image once it is decoded (or failed)
+    function reveal(image) {
+        if (image !== pendingImage)
+            return
+        pendingImage = null
+        frontImageActive = image === imageA
+        imageA.opacity = frontImageActive ? 1.0 : 0.0
+        imageB.opacity = frontImageActive ? 0.0 : 1.0
+    }
+
+    Image {
+        id: imageA
+        anchors.fill: parent
+        asynchronous: blurredLayer.asynchronous
+        fillMode: blurredLayer.fillMode
+        // The pixmap cache key includes the source size and auto-transform:
+        // both are set explicitly to match the backgroundCache delegates
+        sourceSize: Qt.size(0, 0)
+        autoTransform: false
+        opacity: 1.0
+
+        onStatusChanged: {
+            if (status !== Image.Loading)
+                blurredLayer.reveal(this)
+        }
+
+        Behavior on opacity {
+            enabled: Config.enableAnimations
+            NumberAnimation {
+                duration: 400
+                easing.type: Easing.InOutQuad
+            }
+        }
+    }
+
+    Image {
+        id: imageB
+        anchors.fill: parent
+        asynchronous: blurredLayer.asynchronous
+        fillMode: blurredLayer.fillMode
+        sourceSize: Qt.size(0, 0)
+        autoTransform: false
+        opacity: 0.0
+
+        onStatusChanged: {
+            if (status !== Image.Loading)
+                blurredLayer.reveal(this)
+        }
+
+        Behavior on opacity {
+            enabled: Config.enableAnimations
+            NumberAnimation {
+                duration: 400
+                easing.type: Easing.InOutQuad
+            }
+        }
+    }
+}
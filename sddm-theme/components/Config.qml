@@ -9,9 +9,16 @@ import QtQuick
 QtObject {
     // [General]
     property real generalScale: config.realValue("scale") || 1.0 // @desc:Overall scale of the UI. This option can cause the UI to break, so it is recommended to use the individual width/height/size options instead.
-    property bool enableAnimations: config['enable-animations'] === "false" ? false : true // @desc:Enable or disable all animations.
-    property string animatedBackgroundPlaceholder: config.stringValue("animated-background-placeholder") // @possible:File in `backgrounds/` @desc:An image file to be used as a placeholder for the animated background while it loads.
+    property bool enableAnimations: !lite && config['enable-animations'] !== "false" // @desc:Enable or disable all animations. Always disabled by the lite <a href="#renderprofile">render-profile</a>.
+    property string animatedBackgroundPlaceholder: config.stringValue("animated-background-placeholder") // @possible:File in `backgrounds/` @desc:An image file to be used as a placeholder for the animated background while it loads. Only used when update-sddm-backgrounds-cache has no poster frame for the video (it extracts one automatically when ffmpeg is installed).
     property string backgroundFillMode: config.stringValue("background-fill-mode") || "fill" // @possible:'fill' | 'fit' | 'stretch' @desc:Fill mode for <a href="#lockscreenbackground">LockScreen/background</a> and <a href="#loginscreenbackground">LoginScreen/background</a>.<br/><table><tr><th>Value</th><th>QML equivalent</th><th>Description</th></tr><tr><td>fit</td><td><a href="https://doc.qt.io/qt-6/qml-qtquick-image.html#fillMode-prop">Image.PreserveAspectFit</a> and <a href="https://doc.qt.io/qt-6/qml-qtmultimedia-video.html#fillMode-prop">VideoOutput.PreserveAspectFit</a></td><td>The image/video is scaled uniformly to fit without cropping.</td></tr><tr><td>fill</td><td><a href="https://doc.qt.io/qt-6/qml-qtquick-image.html#fillMode-prop">Image.PreserveAspectCrop</a> and <a href="https://doc.qt.io/qt-6/qml-qtmultimedia-video.html#fillMode-prop">VideoOutput.PreserveAspectCrop</a></td><td>The image/video is scaled uniformly to fill, cropping if necessary.</td></tr><tr><td>stretch</td><td><a href="https://doc.qt.io/qt-6/qml-qtquick-image.html#fillMode-prop">Image.Stretch</a> and <a href="https://doc.qt.io/qt-6/qml-qtmultimedia-video.html#fillMode-prop">VideoOutput.Stretch</a></td><td>The image/video is scaled to fit, stretching if necessary.</td></tr></table>
+    property int backgroundCacheSize: config['background-cache-size'] === "0" ? 0 : (config.intValue("background-cache-size") || 128) // @desc:Memory, in MiB, for keeping recently shown backgrounds and those of the users next to the selected one (with their pre-blurred copies) decoded, so switching users does not wait for a decode. 0 disables the cache.
+    property bool cacheBlur: config['cache-blur'] === "false" ? false : true // @desc:Render the blurred lock and login screen backgrounds once and crossfade between them, instead of animating a live blur. Only used for still images without pre-blurred copies from update-sddm-backgrounds-cache.
+    property string renderProfile: config.stringValue("render-profile") || "auto" // @possible:'auto' | 'full' | 'lite' @desc:The lite profile draws without shader effects (blur, avatar masks and icon colorization), mipmaps or animations, for virtual machines, thin clients and machines without working OpenGL. Pre-rendered blurred backgrounds and avatar thumbnails from update-sddm-backgrounds-cache are still used. 'auto' picks lite when Qt Quick falls back to the software renderer.
+    // Set by Main.qml from GraphicsInfo, not read from the configuration
+    property bool softwareRendering: false
+    readonly property bool lite: renderProfile === "lite" || (renderProfile === "auto" && softwareRendering)
+    property bool trace: config.boolValue("trace") // @desc:Log startup and login timings (backgrounds, avatars, screen changes, authentication) to the journal as "slicksddm-trace" lines. Aggregate them with scripts/analyze-greeter-trace.py.
 
     // [LockScreen]
     property bool lockScreenDisplay: config['LockScreen/display'] === "false" ? false : true // @desc:Whether or not to display the lock screen. If false, the theme will load straight to the login screen.
@@ -86,13 +86,15 @@ Item {
                 height: width
                 sourceSize: Qt.size(width, height)
                 fillMode: Image.PreserveAspectFit
-                visible: false // Apparently `MultiEffect.colorization` replaces the Image
+                visible: Config.lite // Apparently `MultiEffect.colorization` replaces the Image
+                opacity: iconButton.enabled ? 1.0 : 0.5
             }
 
             MultiEffect {
                 id: iconEffect
                 source: buttonIcon
                 anchors.fill: buttonIcon
+                visible: !Config.lite
                 colorization: 1
                 colorizationColor: iconButton.isActive ? iconButton.activeContentColor : iconButton.contentColor
                 antialiasing: true
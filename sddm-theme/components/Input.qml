@@ -86,6 +86,7 @@ Item {
                     MultiEffect {
                         source: parent
                         anchors.fill: parent
+                        visible: !Config.lite
                         colorization: 1
                         colorizationColor: textField.color
                     }
@@ -39,14 +39,27 @@ Item {
             }
         }
 
+        // Fires when the shown clock or date can next change, not every second,
+        // and stops while the lock screen is hidden
         Timer {
             id: clockTimer
-            interval: 1000
+            interval: lockScreen.nextClockUpdate()
+            // Changing the interval restarts the countdown, so every tick is
+            // aligned to the next boundary instead of repeating the last period
             repeat: true
-            running: true
+            running: lockScreen.opacity > 0
             onTriggered: {
                 time.updateTime();
                 date.updateDate();
+                interval = lockScreen.nextClockUpdate();
+            }
+            onRunningChanged: {
+                // Catch up and realign when the lock screen is shown again
+                if (running) {
+                    time.updateTime();
+                    date.updateDate();
+                    interval = lockScreen.nextClockUpdate();
+                }
             }
         }
 
@@ -86,14 +99,14 @@ Item {
                 height: width
                 sourceSize: Qt.size(width, height)
                 fillMode: Image.PreserveAspectFit
-                visible: false
+                visible: Config.lite && Config.lockMessageDisplayIcon
             }
             MultiEffect {
                 source: lockIcon
                 anchors.fill: lockIcon
                 colorization: Config.lockMessagePaintIcon ? 1 : 0
                 colorizationColor: Config.lockMessageColor
-                visible: Config.lockMessageDisplayIcon
+                visible: !Config.lite && Config.lockMessageDisplayIcon
                 antialiasing: true
             }
         }
@@ -118,6 +131,46 @@ Item {
         Component.onCompleted: lockScreen.alignItem(messagePositioner, Config.lockMessagePosition)
     }
 
+    // Smallest unit a Qt date/time format shows, in ms: a second, minute, hour or day
+    function formatStep(format) {
+        var step = 86400000;
+        var literal = false;
+        for (var i = 0; i < format.length; i++) {
+            var c = format[i];
+            if (c === "'") {
+                literal = !literal;
+            } else if (literal) {
+                continue;
+            } else if (c === "s" || c === "z") {
+                return 1000;
+            } else if (c === "m") {
+                step = Math.min(step, 60000);
+            } else if (c === "h" || c === "H" || c === "a" || c === "A") {
+                step = Math.min(step, 3600000);
+            }
+        }
+        return step;
+    }
+
+    // Milliseconds until the displayed clock or date changes. Capped at a
+    // minute so the clock catches up after a suspend or a system clock change.
+    function nextClockUpdate() {
+        var step = Math.min(Config.clockDisplay ? formatStep(Config.clockFormat) : 86400000, Config.dateDisplay ? formatStep(Config.dateFormat) : 86400000);
+        var now = new Date();
+        var next;
+        if (step === 1000) {
+            next = 1000 - now.getMilliseconds();
+        } else if (step === 60000) {
+            next = 60000 - now.getSeconds() * 1000 - now.getMilliseconds();
+        } else if (step === 3600000) {
+            next = new Date(now.getFullYear(), now.getMonth(), now.getDate(), now.getHours() + 1) - now;
+        } else {
+            next = new Date(now.getFullYear(), now.getMonth(), now.getDate() + 1) - now;
+        }
+        // Land just past the boundary, timers may fire a little early
+        return Math.min(next, 60000) + 20;
+    }
+
     function alignItem(item, pos) {
         switch (pos) {
         case "top-left":
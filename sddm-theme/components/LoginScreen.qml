@@ -43,6 +43,7 @@ Item {
         var user = foundUsers ? userName : userInput.text;
         if (user && user !== "") {
             safeStateChange("authenticating");
+            Trace.mark("login.request");
             sddm.login(user, password.text, sessionIndex);
         } else {
             loginMessage.warn(TranslationManager.promptUser || "Enter your user!", "error");
@@ -50,9 +51,11 @@ Item {
     }
     Connections {
         function onLoginSucceeded() {
+            Trace.mark("login.succeeded");
             loginContainer.scale = 0.0;
         }
         function onLoginFailed() {
+            Trace.mark("login.failed");
             safeStateChange("normal");
             loginMessage.warn(TranslationManager.loginFailed || "Login failed", "error");
             password.text = "";
@@ -74,11 +74,12 @@ KeyboardStyle {
                 sourceSize.height: 80 * keyIconScale
                 smooth: false
                 source: resourcePrefix + "settings.svg"
-                visible: false
+                visible: Config.lite
             }
             MultiEffect {
                 id: settingsIconEffect
                 source: settingsIcon
+                visible: !Config.lite
                 anchors.fill: settingsIcon
                 colorization: 1
                 colorizationColor: vkeyboardStyle.textOnPrimaryColor
@@ -265,11 +266,12 @@ KeyboardStyle {
                 sourceSize.height: height
                 smooth: false
                 source: resourcePrefix + "backspace.svg"
-                visible: false
+                visible: Config.lite
             }
             MultiEffect {
                 id: backspaceIconEffect
                 source: backspaceKeyIcon
+                visible: !Config.lite
                 anchors.fill: backspaceKeyIcon
                 colorization: 1
                 colorizationColor: vkeyboardStyle.textOnPrimaryColor
@@ -345,11 +347,12 @@ KeyboardStyle {
                 sourceSize.height: height
                 smooth: false
                 source: resourcePrefix + "language.svg"
-                visible: false
+                visible: Config.lite
             }
             MultiEffect {
                 id: languageIconEffect
                 source: languageKeyIcon
+                visible: !Config.lite
                 anchors.fill: languageKeyIcon
                 colorization: 1
                 colorizationColor: vkeyboardStyle.textOnPrimaryColor
@@ -438,14 +441,14 @@ KeyboardStyle {
                 sourceSize.height: height
                 smooth: false
                 source: resourcePrefix + "enter-key.svg"
-                visible: false
+                visible: Config.lite && enterKeyText.text.length === 0
             }
             MultiEffect {
                 id: enterIconEffect
                 source: enterKeyIcon
                 anchors.fill: enterKeyIcon
                 colorization: 1
-                visible: enterKeyText.text.length === 0
+                visible: !Config.lite && enterKeyText.text.length === 0
                 colorizationColor: vkeyboardStyle.textOnPrimaryColor
                 antialiasing: true
             }
@@ -545,11 +548,12 @@ KeyboardStyle {
                 sourceSize.height: height
                 smooth: false
                 source: resourcePrefix + "hidekeyboard.svg"
-                visible: false
+                visible: Config.lite
             }
             MultiEffect {
                 id: hideIconEffect
                 source: hideKeyIcon
+                visible: !Config.lite
                 anchors.fill: hideKeyIcon
                 colorization: 1
                 colorizationColor: vkeyboardStyle.textOnPrimaryColor
@@ -631,11 +635,12 @@ KeyboardStyle {
                 sourceSize.height: height
                 smooth: false
                 source: resourcePrefix + "shift.svg"
-                visible: false
+                visible: Config.lite
             }
             MultiEffect {
                 id: shiftKeyColor
                 source: shiftKeyIcon
+                visible: !Config.lite
                 anchors.fill: shiftKeyIcon
                 colorization: 1
                 colorizationColor: vkeyboardStyle.textOnPrimaryColor
@@ -976,11 +981,12 @@ KeyboardStyle {
                 sourceSize.height: height
                 smooth: false
                 source: resourcePrefix + ((keyboard && keyboard.handwritingMode) ? "textmode.svg" : "handwriting.svg")
-                visible: false
+                visible: Config.lite
             }
             MultiEffect {
                 id: hwrIconEffect
                 source: hwrKeyIcon
+                visible: !Config.lite
                 anchors.fill: hwrKeyIcon
                 colorization: 1
                 colorizationColor: vkeyboardStyle.textOnPrimaryColor
@@ -1558,6 +1564,7 @@ KeyboardStyle {
 
         MultiEffect {
             source: parent
+            visible: !Config.lite
             anchors.fill: parent
             colorization: 1
             colorizationColor: vkeyboardStyle.textOnPrimaryColor
@@ -1609,11 +1616,12 @@ KeyboardStyle {
                     return resourcePrefix + (keyboard.handwritingMode ? "textmode.svg" : "handwriting.svg");
                 }
             }
-            visible: false
+            visible: Config.lite
         }
         MultiEffect {
             id: functionIconEffect
             source: functionIcon
+            visible: !Config.lite
             anchors.fill: functionIcon
             colorization: 1
             colorizationColor: vkeyboardStyle.textOnPrimaryColor
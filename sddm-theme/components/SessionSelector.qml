@@ -88,12 +88,13 @@ ColumnLayout {
                         height: Config.menuAreaPopupsIconSize * Config.generalScale
                         sourceSize: Qt.size(width, height)
                         fillMode: Image.PreserveAspectFit
-                        visible: false
+                        visible: Config.lite
                     }
                     MultiEffect {
                         id: sessionIconEffect
                         source: sessionIcon
                         anchors.fill: sessionIcon
+                        visible: !Config.lite
                         colorization: 1
                         colorizationColor: index === selector.currentSessionIndex || itemMouseArea.containsMouse ? Config.menuAreaPopupsActiveContentColor : Config.menuAreaPopupsContentColor
                         antialiasing: true
@@ -42,7 +42,8 @@ Item {
         height: width
         sourceSize.width: width
         sourceSize.height: height
-        visible: false
+        // The effect stays transparent without animations when the text is shown
+        visible: Config.lite && !Config.spinnerDisplayText
 
         Component.onCompleted: {
             if (Config.loginAreaPosition === "left") {
@@ -61,14 +62,17 @@ Item {
         id: spinnerEffect
         source: spinner
         anchors.fill: spinner
+        visible: !Config.lite
         colorization: 1
         colorizationColor: Config.spinnerColor
         opacity: Config.spinnerDisplayText ? 0.0 : 1.0
         antialiasing: true
     }
     RotationAnimation {
-        target: spinnerEffect
-        running: spinnerContainer.visible && Config.enableAnimations
+        // Rotate whichever of the two is shown: the effect is hidden in lite
+        target: Config.lite ? spinner : spinnerEffect
+        // Nothing to repaint while hidden or fully transparent
+        running: spinnerContainer.visible && spinnerContainer.opacity > 0 && Config.enableAnimations
         from: 0
         to: 360
         loops: Animation.Infinite
@@ -0,0 +1,30 @@
+pragma Singleton
+
+import QtQuick
+
+// Opt-in greeter timing, enabled with [General] trace = true. Every mark is one
+// "slicksddm-trace {json}" line on the greeter's output, which SDDM sends to the
+// journal; scripts/analyze-greeter-trace.py aggregates them across boots.
+QtObject {
+    readonly property bool enabled: Config.trace
+    // Ties together the marks of one greeter start
+    readonly property string session: enabled ? Date.now().toString(36) + Math.floor(Math.random() * 1e9).toString(36) : ""
+    property int lastId: 0
+
+    // Identifies one of several instances (e.g. an avatar) across its marks
+    function newId() {
+        lastId += 1;
+        return lastId;
+    }
+
+    function mark(event, detail) {
+        if (!enabled)
+            return;
+        var record = { "session": session, "event": event, "ts": Date.now() };
+        if (detail !== undefined)
+            record.detail = detail;
+        console.info("slicksddm-trace " + JSON.stringify(record));
+    }
+
+    Component.onCompleted: mark("trace.start")
+}
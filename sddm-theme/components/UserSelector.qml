@@ -13,6 +13,15 @@ Item {
     property string orientation: ""
     property bool isDragging: false
 
+    // Type-to-search: lower-cased user and real names as sorted [key, row]
+    // pairs, built on the first search so large models cost nothing up front
+    property var searchIndex: null
+    property string searchText: ""
+    property int searchPosition: -1
+    // SDDM UserModel roles
+    readonly property int nameRole: Qt.UserRole + 1
+    readonly property int realNameRole: Qt.UserRole + 2
+
     function prevUser() {
         userList.decrementCurrentIndex();
     }
@@ -20,6 +29,98 @@ Item {
         userList.incrementCurrentIndex();
     }
 
+    function selectUser(row) {
+        // Jump straight to far rows instead of animating (and creating a
+        // delegate for) every user in between
+        if (Math.abs(row - userList.currentIndex) > 5) {
+            userList.positionViewAtIndex(row, ListView.Center);
+        }
+        userList.currentIndex = row;
+    }
+
+    function buildSearchIndex() {
+        var entries = [];
+        var count = userModel.rowCount();
+        for (var row = 0; row < count; row++) {
+            var modelIndex = userModel.index(row, 0);
+            var name = (userModel.data(modelIndex, nameRole) || "").toLowerCase();
+            var realName = (userModel.data(modelIndex, realNameRole) || "").toLowerCase();
+            entries.push([name, row]);
+            if (realName !== "" && realName !== name) {
+                entries.push([realName, row]);
+            }
+        }
+        entries.sort(function (a, b) {
+            return a[0] < b[0] ? -1 : (a[0] > b[0] ? 1 : a[1] - b[1]);
+        });
+        return entries;
+    }
+
+    // Position of the first entry whose key is >= prefix
+    function lowerBound(entries, prefix) {
+        var low = 0;
+        var high = entries.length;
+        while (low < high) {
+            var middle = (low + high) >> 1;
+            if (entries[middle][0] < prefix) {
+                low = middle + 1;
+            } else {
+                high = middle;
+            }
+        }
+        return low;
+    }
+
+    function search(text) {
+        if (searchIndex === null) {
+            searchIndex = buildSearchIndex();
+        }
+        var prefix = text.toLowerCase();
+        var position = lowerBound(searchIndex, prefix);
+        var matched = position < searchIndex.length && searchIndex[position][0].indexOf(prefix) === 0;
+        var repeated = prefix.length > 1 && prefix.split(prefix[0]).length === prefix.length + 1;
+        if (!matched && repeated && searchPosition >= 0) {
+            // Typing the same letter again cycles through the users it matches,
+            // unless a user actually starts with the repeated letters ("aaron")
+            prefix = prefix[0];
+            position = searchPosition + 1;
+            if (position >= searchIndex.length || searchIndex[position][0].indexOf(prefix) !== 0) {
+                position = lowerBound(searchIndex, prefix);
+            }
+        }
+        if (position >= searchIndex.length || searchIndex[position][0].indexOf(prefix) !== 0) {
+            return false;
+        }
+        searchPosition = position;
+        selectUser(searchIndex[position][1]);
+        return true;
+    }
+
+    Connections {
+        target: userModel
+        function onModelReset() {
+            selector.searchIndex = null;
+        }
+        function onRowsInserted() {
+            selector.searchIndex = null;
+        }
+        function onRowsRemoved() {
+            selector.searchIndex = null;
+        }
+        function onDataChanged() {
+            selector.searchIndex = null;
+        }
+    }
+
+    Timer {
+        id: searchTimer
+        interval: 1000
+        onTriggered: {
+            selector.searchText = "";
+            selector.searchPosition = -1;
+        }
+    }
+
     ListView {
         id: userList
         anchors.fill: parent
@@ -27,6 +128,9 @@ Item {
         spacing: 10
         interactive: false
         boundsBehavior: Flickable.StopAtBounds
+        // Only the avatars on screen (and one either side while the list is
+        // open) get a delegate, however many users there are
+        cacheBuffer: selector.listUsers ? Config.avatarActiveSize * Config.generalScale : 0
 
         // Center the active avatar
         preferredHighlightBegin: selector.orientation === "horizontal" ? (width - Config.avatarActiveSize * Config.generalScale) / 2 : (height - Config.avatarActiveSize * Config.generalScale) / 2
@@ -95,7 +199,7 @@ Item {
                 username: model.name  // NEW: Pass username for fallback avatar selection
                 active: index === userList.currentIndex
                 opacity: active ? 1.0 : Config.avatarInactiveOpacity
-                enabled: userModel.rowCount() > 1 // No need to open the selector if there's only one user
+                enabled: userList.count > 1 // No need to open the selector if there's only one user
                 tooltipText: {
                     if (!active) return "";
                     if (selector.listUsers) return TranslationManager.closeUserSelection;
@@ -132,6 +236,33 @@ Item {
         }
     }
 
+    // Typed search prefix, over the bottom of the active avatar
+    Rectangle {
+        anchors.horizontalCenter: parent.horizontalCenter
+        anchors.bottom: parent.bottom
+        width: searchLabel.implicitWidth + 12 * Config.generalScale
+        height: searchLabel.implicitHeight + 6 * Config.generalScale
+        color: "transparent"
+        visible: selector.searchText !== ""
+        z: 1
+
+        Rectangle {
+            anchors.fill: parent
+            radius: Config.tooltipsBorderRadius * Config.generalScale
+            color: Config.tooltipsBackgroundColor
+            opacity: Config.tooltipsBackgroundOpacity
+        }
+
+        Text {
+            id: searchLabel
+            anchors.centerIn: parent
+            text: selector.searchText
+            color: Config.tooltipsContentColor
+            font.family: Config.tooltipsFontFamily
+            font.pixelSize: Config.tooltipsFontSize * Config.generalScale
+        }
+    }
+
     Keys.onPressed: function (event) {
         if (event.key == Qt.Key_Return || event.key == Qt.Key_Enter || event.key === Qt.Key_Space) {
             if (selector.listUsers) {
@@ -161,6 +292,23 @@ Item {
         } else if (event.key === Qt.Key_CapsLock) {
             root.capsLockOn = !root.capsLockOn;
             event.accepted = true;
+        } else if (event.key === Qt.Key_Backspace && selector.searchText !== "") {
+            selector.searchText = selector.searchText.slice(0, -1);
+            selector.searchPosition = -1;
+            if (selector.searchText !== "") {
+                selector.search(selector.searchText);
+            }
+            searchTimer.restart();
+            event.accepted = true;
+        } else if (event.text.length === 1 && event.text > " " && !(event.modifiers & (Qt.ControlModifier | Qt.AltModifier | Qt.MetaModifier))) {
+            selector.searchText += event.text;
+            if (!selector.search(selector.searchText)) {
+                // Keep the last match selected and drop the character that broke it
+                selector.searchText = selector.searchText.slice(0, -1);
+            }
+            searchTimer.restart();
+            selector.focus = true;
+            event.accepted = true;
         } else {
             // Do not steal other keys
             event.accepted = false;
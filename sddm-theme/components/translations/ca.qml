@@ -0,0 +1,27 @@
+import QtQuick
+
+// ca strings for TranslationManager.qml, merged over its fallbacks
+// Auto-generated by translate-manager.py from translations/ca.json - DO NOT EDIT
+QtObject {
+    readonly property var strings: ({
+        "capslockWarning": "El blocatge de majúscules està activat.",
+        "changeKeyboardLayout": "Canvia la disposició del teclat.",
+        "changeSession": "Canvia de sessió",
+        "closeUserSelection": "Tanca la selecció d'usuari.",
+        "loggingIn": "S'entra a la sessió",
+        "login": "Entrada",
+        "loginFailed": "Ha fallat entrar a la sessió.",
+        "noKeyboardLayoutsConfigured": "No hi ha cap disposició de teclat configurada. Establiu les disposicions a /etc/sddm.conf.d/*.conf",
+        "noUsersFound": "L'SDDM no ha pogut trobar cap usuari. Escriviu el nom d'usuari a continuació:",
+        "password": "Contrasenya",
+        "powerOptions": "Opcions d'energia",
+        "pressAnyKey": "Premeu qualsevol tecla.",
+        "promptUser": "Escriviu el nom d'usuari",
+        "reboot": "Reinicia't",
+        "selectUser": "Seleccioneu l'usuari",
+        "shutdown": "Atura't",
+        "suspend": "Suspèn-te",
+        "toggleVirtualKeyboard": "Activa / desactiva el teclat virtual",
+        "username": "Nom d'usuari",
+    })
+}
@@ -0,0 +1,27 @@
+import QtQuick
+
+// de_DE strings for TranslationManager.qml, merged over its fallbacks
+// Auto-generated by translate-manager.py from translations/de_DE.json - DO NOT EDIT
+QtObject {
+    readonly property var strings: ({
+        "capslockWarning": "Feststelltaste ist aktiviert",
+        "changeKeyboardLayout": "Tastaturbelegung ändern",
+        "changeSession": "Sitzung ändern",
+        "closeUserSelection": "Benutzerauswahl schließen",
+        "loggingIn": "Anmeldung läuft",
+        "login": "Anmelden",
+        "loginFailed": "Anmeldung fehlgeschlagen",
+        "noKeyboardLayoutsConfigured": "Keine Tastaturbelegungen konfiguriert",
+        "noUsersFound": "SDDM konnte keinen Benutzer finden. Geben Sie unten Ihren Benutzernamen ein:",
+        "password": "Passwort",
+        "powerOptions": "Energieoptionen",
+        "pressAnyKey": "Drücken Sie eine beliebige Taste",
+        "promptUser": "Geben Sie Ihren Benutzernamen ein",
+        "reboot": "Neu starten",
+        "selectUser": "Benutzer auswählen",
+        "shutdown": "Herunterfahren",
+        "suspend": "Bereitschaft",
+        "toggleVirtualKeyboard": "Virtuelle Tastatur umschalten",
+        "username": "Benutzername",
+    })
+}
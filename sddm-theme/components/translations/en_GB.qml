@@ -0,0 +1,27 @@
+import QtQuick
+
+// en_GB strings for TranslationManager.qml, merged over its fallbacks
+// Auto-generated by translate-manager.py from translations/en_GB.json - DO NOT EDIT
+QtObject {
+    readonly property var strings: ({
+        "capslockWarning": "Caps Lock is on",
+        "changeKeyboardLayout": "Change keyboard layout",
+        "changeSession": "Change session",
+        "closeUserSelection": "Close user selection",
+        "loggingIn": "Logging in",
+        "login": "Login",
+        "loginFailed": "Login failed",
+        "noKeyboardLayoutsConfigured": "No keyboard layouts configured",
+        "noUsersFound": "SDDM could not find any user. Type your username below:",
+        "password": "Password",
+        "powerOptions": "Power options",
+        "pressAnyKey": "Press any key",
+        "promptUser": "Enter your username",
+        "reboot": "Reboot",
+        "selectUser": "Select user",
+        "shutdown": "Shutdown",
+        "suspend": "Suspend",
+        "toggleVirtualKeyboard": "Toggle virtual keyboard",
+        "username": "Username",
+    })
+}
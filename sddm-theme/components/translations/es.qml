@@ -0,0 +1,27 @@
+import QtQuick
+
+// es strings for TranslationManager.qml, merged over its fallbacks
+// Auto-generated by translate-manager.py from translations/es.json - DO NOT EDIT
+QtObject {
+    readonly property var strings: ({
+        "capslockWarning": "Bloq Mayús está activado",
+        "changeKeyboardLayout": "Cambiar distribución de teclado",
+        "changeSession": "Cambiar sesión",
+        "closeUserSelection": "Cerrar selección de usuario",
+        "loggingIn": "Iniciando sesión",
+        "login": "Acceder",
+        "loginFailed": "Error al iniciar sesión",
+        "noKeyboardLayoutsConfigured": "No hay distribuciones de teclado configuradas",
+        "noUsersFound": "SDDM no pudo encontrar ningún usuario. Escriba su nombre de usuario a continuación:",
+        "password": "Contraseña",
+        "powerOptions": "Opciones de energía",
+        "pressAnyKey": "Presione cualquier tecla",
+        "promptUser": "Ingrese su nombre de usuario",
+        "reboot": "Reiniciar",
+        "selectUser": "Seleccionar usuario",
+        "shutdown": "Apagar",
+        "suspend": "Suspender",
+        "toggleVirtualKeyboard": "Alternar teclado virtual",
+        "username": "Usuario",
+    })
+}
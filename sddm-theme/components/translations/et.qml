@@ -0,0 +1,27 @@
+import QtQuick
+
+// et strings for TranslationManager.qml, merged over its fallbacks
+// Auto-generated by translate-manager.py from translations/et.json - DO NOT EDIT
+QtObject {
+    readonly property var strings: ({
+        "capslockWarning": "Caps Lock (suurtähtede lukustus) on lülitatud sisse",
+        "changeKeyboardLayout": "Vaheta klahvistiku paigutust",
+        "changeSession": "Vaheta sessiooni",
+        "closeUserSelection": "Sulge kasutaja valik",
+        "loggingIn": "Sisselogimisel",
+        "login": "Logi sisse",
+        "loginFailed": "Sisselogimine ei õnnestunud",
+        "noKeyboardLayoutsConfigured": "Ühtegi klahvistikupaigutust pole seadistatud",
+        "noUsersFound": "SDDM ei leidnud ühtegi kasutajat. Palun sisesta kasutajanimi alljärgnevalt:",
+        "password": "Salasõna",
+        "powerOptions": "Toitevalikud",
+        "pressAnyKey": "Vajuta suvalist klahvi",
+        "promptUser": "Sisesta oma kasutajanimi",
+        "reboot": "Taaskäivita",
+        "selectUser": "Vali kasutaja",
+        "shutdown": "Seiska",
+        "suspend": "Peata",
+        "toggleVirtualKeyboard": "Lülita virtuaalne klahvistik sisse/välja",
+        "username": "Kasutajanimi",
+    })
+}
@@ -0,0 +1,27 @@
+import QtQuick
+
+// fi strings for TranslationManager.qml, merged over its fallbacks
+// Auto-generated by translate-manager.py from translations/fi.json - DO NOT EDIT
+QtObject {
+    readonly property var strings: ({
+        "capslockWarning": "Caps Lock on päällä",
+        "changeKeyboardLayout": "Vaihda näppäimistöasettelua",
+        "changeSession": "Vaihda istuntoa",
+        "closeUserSelection": "Sulje käyttäjän valinta",
+        "loggingIn": "Kirjautuminen sisään ",
+        "login": "Kirjaudu",
+        "loginFailed": "Kirjautuminen epäonnistui",
+        "noKeyboardLayoutsConfigured": "Ei määritettyjä näppäimistöasetteluja",
+        "noUsersFound": "SDDM ei löytänyt käyttäjiä. Kirjoita käyttäjätunnuksesi alle:",
+        "password": "Salasana",
+        "powerOptions": "Virtavaihtoehdot",
+        "pressAnyKey": "Paina mitä tahansa näppäintä",
+        "promptUser": "Syötä käyttäjätunnuksesi",
+        "reboot": "Käynnistä uudelleen",
+        "selectUser": "Valitse käyttäjä",
+        "shutdown": "Sammuta",
+        "suspend": "Keskeyttää",
+        "toggleVirtualKeyboard": "Virtuaalinäppäimistö päälle/pois",
+        "username": "Käyttäjän nimi",
+    })
+}
@@ -0,0 +1,27 @@
+import QtQuick
+
+// fr strings for TranslationManager.qml, merged over its fallbacks
+// Auto-generated by translate-manager.py from translations/fr.json - DO NOT EDIT
+QtObject {
+    readonly property var strings: ({
+        "capslockWarning": "Verr Maj est activé",
+        "changeKeyboardLayout": "Changer la disposition du clavier",
+        "changeSession": "Changer de session",
+        "closeUserSelection": "Fermer la sélection d'utilisateur",
+        "loggingIn": "Connexion en cours",
+        "login": "Connexion",
+        "loginFailed": "Échec de la connexion",
+        "noKeyboardLayoutsConfigured": "Aucune disposition de clavier configurée",
+        "noUsersFound": "SDDM n'a pas pu trouver d'utilisateur. Tapez votre nom d'utilisateur ci-dessous :",
+        "password": "Mot de passe",
+        "powerOptions": "Options d'alimentation",
+        "pressAnyKey": "Appuyez sur n'importe quelle touche",
+        "promptUser": "Entrez votre nom d'utilisateur",
+        "reboot": "Redémarrer",
+        "selectUser": "Sélectionner un utilisateur",
+        "shutdown": "Éteindre",
+        "suspend": "Suspendre",
+        "toggleVirtualKeyboard": "Basculer le clavier virtuel",
+        "username": "Nom d'utilisateur",
+    })
+}
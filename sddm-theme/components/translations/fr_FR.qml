@@ -0,0 +1,27 @@
+import QtQuick
+
+// fr_FR strings for TranslationManager.qml, merged over its fallbacks
+// Auto-generated by translate-manager.py from translations/fr_FR.json - DO NOT EDIT
+QtObject {
+    readonly property var strings: ({
+        "capslockWarning": "Verr Maj est activé",
+        "changeKeyboardLayout": "Changer la disposition  du clavier",
+        "changeSession": "Déconnexion",
+        "closeUserSelection": "Fermer la sélection utilisateur",
+        "loggingIn": "Connexion en cours",
+        "login": "Connexion",
+        "loginFailed": "Échec de la connexion",
+        "noKeyboardLayoutsConfigured": "Aucune disposition de clavier n'est configurée",
+        "noUsersFound": "SDDM n'a pas pu trouver d'utilisateur. Retapez votre nom d'utilisateur ci-dessous :",
+        "password": "Mot de passe",
+        "powerOptions": "Options d'alimentation",
+        "pressAnyKey": "Appuyez sur une touche",
+        "promptUser": "Entrez votre nom d'utilisateur",
+        "reboot": "Redémarrer",
+        "selectUser": "Sélectionner l'utilisateur",
+        "shutdown": "Arrêter",
+        "suspend": "Suspendre",
+        "toggleVirtualKeyboard": "Activer/désactiver le clavier virtuel",
+        "username": "Nom d'utilisateur",
+    })
+}
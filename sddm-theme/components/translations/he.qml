@@ -0,0 +1,27 @@
+import QtQuick
+
+// he strings for TranslationManager.qml, merged over its fallbacks
+// Auto-generated by translate-manager.py from translations/he.json - DO NOT EDIT
+QtObject {
+    readonly property var strings: ({
+        "capslockWarning": "Caps Lock דולק",
+        "changeKeyboardLayout": "החלפת פריסת מקלדת",
+        "changeSession": "החלפת הפעלה",
+        "closeUserSelection": "סגירת בחירת משתמש",
+        "loggingIn": "מתבצעת כניסה",
+        "login": "כניסה",
+        "loginFailed": "הכניסה נכשלה",
+        "noKeyboardLayoutsConfigured": "לא מוגדרות פריסות מקלדת.",
+        "noUsersFound": "SDDM לא הצליח למצוא משתמשים כלשהם. נא למלא את שם המשתמש שלך להלן:",
+        "password": "סיסמה",
+        "powerOptions": "אפשרויות תפעול",
+        "pressAnyKey": "נא ללחוץ על מקש כלשהו",
+        "promptUser": "נא למלא את שם המשתמש שלך",
+        "reboot": "הפעלה מחדש",
+        "selectUser": "בחירת משתמש",
+        "shutdown": "כיבוי",
+        "suspend": "השהיה",
+        "toggleVirtualKeyboard": "הצגת/הסתרת מקלדת וירטואלית",
+        "username": "שם משתמש",
+    })
+}
@@ -0,0 +1,27 @@
+import QtQuick
+
+// nl_NL strings for TranslationManager.qml, merged over its fallbacks
+// Auto-generated by translate-manager.py from translations/nl_NL.json - DO NOT EDIT
+QtObject {
+    readonly property var strings: ({
+        "capslockWarning": "Caps Lock staat aan",
+        "changeKeyboardLayout": "Toetsenbordindeling wijzigen",
+        "changeSession": "Sessie wijzigen",
+        "closeUserSelection": "Selectie van gebruikers sluiten",
+        "loggingIn": "Inloggen",
+        "login": "Inloggen",
+        "loginFailed": "Inloggen is mislukt",
+        "noKeyboardLayoutsConfigured": "Geen toetsenbordindelingen geconfigureerd",
+        "noUsersFound": "SDDM kon geen enkele gebruiker vinden. Typ hieronder uw gebruikersnaam:",
+        "password": "Wachtwoord",
+        "powerOptions": "Opties voor energiebeheer",
+        "pressAnyKey": "Druk op een toets",
+        "promptUser": "Gebruikersnaam invoeren ",
+        "reboot": "Opnieuw opstarten",
+        "selectUser": "Gebruiker selecteren",
+        "shutdown": "Uitschakelen",
+        "suspend": "Opschorten",
+        "toggleVirtualKeyboard": "Virtueel toetsenbord omschakelen",
+        "username": "Gebruikersnaam",
+    })
+}
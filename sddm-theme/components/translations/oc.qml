@@ -0,0 +1,27 @@
+import QtQuick
+
+// oc strings for TranslationManager.qml, merged over its fallbacks
+// Auto-generated by translate-manager.py from translations/oc.json - DO NOT EDIT
+QtObject {
+    readonly property var strings: ({
+        "capslockWarning": "Ver. Maj. actiu",
+        "changeKeyboardLayout": "Cambiar la disposicion del clavièr",
+        "changeSession": "Cambiar de session",
+        "closeUserSelection": "Tampar la seleccion de l’utilizaire",
+        "loggingIn": "Autentificacion",
+        "login": "S’autentificar",
+        "loginFailed": "Fracàs de l’autentificacion",
+        "noKeyboardLayoutsConfigured": "Cap de disposicion de clavièr pas trobada",
+        "noUsersFound": "SDDM a pas pogut trobar cap d’utilizaire. Picatz lo nom d’utilizaire çaijós :",
+        "password": "Senhal",
+        "powerOptions": "Opcions d’alimentacion",
+        "pressAnyKey": "Quichar una tòca",
+        "promptUser": "Picatz lo nom d’utilizaire",
+        "reboot": "Reaviar",
+        "selectUser": "Seleccionar utilizaire",
+        "shutdown": "Atudar",
+        "suspend": "Metre en velha",
+        "toggleVirtualKeyboard": "Alternar clavièr virtual",
+        "username": "Nom d’utilizaire",
+    })
+}
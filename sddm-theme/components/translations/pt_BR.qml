@@ -0,0 +1,27 @@
+import QtQuick
+
+// pt_BR strings for TranslationManager.qml, merged over its fallbacks
+// Auto-generated by translate-manager.py from translations/pt_BR.json - DO NOT EDIT
+QtObject {
+    readonly property var strings: ({
+        "capslockWarning": "A tecla Caps Lock está ativada",
+        "changeKeyboardLayout": "Alterar layout do teclado",
+        "changeSession": "Alterar sessão",
+        "closeUserSelection": "Fechar seleção de usuário",
+        "loggingIn": "Logging in",
+        "login": "Login",
+        "loginFailed": "Login failed",
+        "noKeyboardLayoutsConfigured": "Nenhum layout de teclado configurado",
+        "noUsersFound": "O SDDM não encontrou nenhum usuário. Digite seu nome de usuário abaixo:",
+        "password": "Senha",
+        "powerOptions": "Opções de energia",
+        "pressAnyKey": "Pressione qualquer tecla",
+        "promptUser": "Digite seu nome de usuário",
+        "reboot": "Reiniciar",
+        "selectUser": "Selecionar usuário",
+        "shutdown": "Desligar",
+        "suspend": "Suspender",
+        "toggleVirtualKeyboard": "Alternar teclado virtual",
+        "username": "Nome de usuário",
+    })
+}
@@ -0,0 +1,27 @@
+import QtQuick
+
+// tr strings for TranslationManager.qml, merged over its fallbacks
+// Auto-generated by translate-manager.py from translations/tr.json - DO NOT EDIT
+QtObject {
+    readonly property var strings: ({
+        "capslockWarning": "Caps Lock açık",
+        "changeKeyboardLayout": "Klavye düzenini değiştir",
+        "changeSession": "Oturumu değiştir",
+        "closeUserSelection": "Kullanıcı seçimini kapat",
+        "loggingIn": "Giriş yapılıyor",
+        "login": "Giriş",
+        "loginFailed": "Giriş başarısız",
+        "noKeyboardLayoutsConfigured": "Klavyeniz için herhangi bir düzen yapılandırılmamış",
+        "noUsersFound": "SDDM herhangi bir kullanıcı bulamadı. Kullanıcı adınızı aşağıya yazın.",
+        "password": "Parola",
+        "powerOptions": "Güç seçenekleri",
+        "pressAnyKey": "Herhangi bir tuşa basın",
+        "promptUser": "Kullanıcı adınızı giriniz",
+        "reboot": "Yeniden başlat",
+        "selectUser": "Kullancıyı seçin",
+        "shutdown": "Kapat",
+        "suspend": "Durdur",
+        "toggleVirtualKeyboard": "Sanal klavyeyi aç/kapat",
+        "username": "Kullanıcı adı",
+    })
+}
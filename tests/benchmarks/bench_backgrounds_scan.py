@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""
+Backgrounds Cache Scan Benchmark for slickSDDM Theme
+Times the AccountsService scan of update-sddm-backgrounds-cache against a
+synthetic users directory, cold (no manifest) and warm (unchanged manifest),
+for a range of worker counts.
+
+Usage: bench_backgrounds_scan.py [--users 10000,50000] [--workers 1,4,16]
+"""
+
+import argparse
+import contextlib
+import io
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from test_backgrounds_cache import Colors, load_updater, png_bytes, write_user  # noqa: E402
+
+# Distinct background files shared by the synthetic users
+BACKGROUND_COUNT = 64
+
+
+def parse_list(value):
+    return [int(item) for item in value.split(',') if item.strip()]
+
+
+def populate(workdir: Path, users: int) -> Path:
+    """Create a users directory with a mix of valid, missing and private backgrounds"""
+    accounts_dir = workdir / f"users-{users}"
+    backgrounds_dir = workdir / "backgrounds"
+    accounts_dir.mkdir()
+    backgrounds_dir.mkdir(exist_ok=True)
+    for index in range(BACKGROUND_COUNT):
+        path = backgrounds_dir / f"bg{index}.jpg"
+        path.write_bytes(png_bytes(4, 3))
+        path.chmod(0o600 if index % 8 == 0 else 0o644)
+    for index in range(users):
+        background = backgrounds_dir / f"bg{index % BACKGROUND_COUNT}.jpg"
+        write_user(accounts_dir, f"user{index}", str(background) if index % 10 else "/missing.jpg")
+    return accounts_dir
+
+
+def timed_scan(updater, accounts_dir: Path, previous: dict, workers: int):
+    # The updater reports every skipped user on stdout, keep that out of the table
+    with contextlib.redirect_stdout(io.StringIO()):
+        start = time.perf_counter()
+        result = updater.scan_users(str(accounts_dir), previous, workers=workers)
+        elapsed = time.perf_counter() - start
+    return elapsed, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the backgrounds cache user scan")
+    parser.add_argument('--users', type=parse_list, default=[10000, 50000],
+                        help="Comma separated synthetic user counts (default: 10000,50000)")
+    parser.add_argument('--workers', type=parse_list, default=[1, 4, 16],
+                        help="Comma separated worker counts (default: 1,4,16)")
+    args = parser.parse_args()
+
+    print(f"{Colors.GREEN}Ubuntu Budgie SDDM Theme - Backgrounds Scan Benchmark{Colors.NC}")
+    print("=" * 50)
+    print(f"{'users':>8} {'workers':>8} {'cold (s)':>10} {'warm (s)':>10} {'users/s cold':>14}")
+
+    with tempfile.TemporaryDirectory() as workdir:
+        workdir = Path(workdir)
+        (workdir / "theme" / "cache").mkdir(parents=True)
+        updater = load_updater(workdir / "theme")
+
+        for users in args.users:
+            accounts_dir = populate(workdir, users)
+            for workers in args.workers:
+                cold, (_, manifest_users, _) = timed_scan(updater, accounts_dir, {}, workers)
+                warm, (_, _, reread) = timed_scan(updater, accounts_dir, manifest_users, workers)
+                if reread:
+                    print(f"{Colors.RED}✗ warm scan re-read {reread} user files{Colors.NC}")
+                    sys.exit(1)
+                print(f"{users:>8} {workers:>8} {cold:>10.3f} {warm:>10.3f} {users / cold:>14.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,286 @@
+#!/usr/bin/env python3
+"""
+Generator Benchmark Suite for slickSDDM Theme
+Times every stage of the offline generators against synthetic data and
+compares the results with stored baselines:
+
+  backgrounds  update-sddm-backgrounds-cache for N users
+  translations translate-manager.py for M locales of K keys
+  extract      extract-strings.py for F QML files
+
+Each stage reports its wall time, throughput and peak RSS. Every suite runs in
+its own process so one suite's memory does not hide another's. A stage is a
+regression when it is more than --time-tolerance times slower (or
+--rss-tolerance times bigger) than its baseline, beyond a small absolute slack.
+
+Baselines are machine specific; refresh them on the reference build machine:
+  bench_generators.py --update-baselines
+
+Usage: bench_generators.py [--users 10000] [--locales 100] [--keys 2000] [--qml-files 300]
+                           [--suites backgrounds,translations,extract] [--update-baselines]
+"""
+
+import argparse
+import contextlib
+import importlib.util
+import io
+import json
+import multiprocessing
+import resource
+import shutil
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+BENCHMARKS_DIR = Path(__file__).parent
+PROJECT_ROOT = BENCHMARKS_DIR.parent.parent
+BASELINES_FILE = BENCHMARKS_DIR / "baselines.json"
+
+sys.path.insert(0, str(BENCHMARKS_DIR))
+sys.path.insert(0, str(PROJECT_ROOT / "tests"))
+sys.path.insert(0, str(PROJECT_ROOT / "scripts"))
+from bench_backgrounds_scan import populate as populate_users  # noqa: E402
+from bench_translation_catalog import populate as populate_locales  # noqa: E402
+from test_backgrounds_cache import Colors, load_updater  # noqa: E402
+from translation_catalog import TranslationCatalog  # noqa: E402
+
+SUITES = ['backgrounds', 'translations', 'extract']
+
+# Differences below these never count as regressions, they are noise
+TIME_SLACK = 0.05
+RSS_SLACK_KB = 16 * 1024
+
+
+def parse_list(value):
+    return [item.strip() for item in value.split(',') if item.strip()]
+
+
+def load_script(name: str):
+    """Load one of the hyphenated scripts/ tools as a module"""
+    path = PROJECT_ROOT / "scripts" / f"{name}.py"
+    spec = importlib.util.spec_from_file_location(name.replace('-', '_'), path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def reset_peak_rss():
+    """Reset the kernel's RSS high-water mark (VmHWM) where that is allowed"""
+    try:
+        with open("/proc/self/clear_refs", 'w') as f:
+            f.write("5")
+    except OSError:
+        pass
+
+
+def peak_rss_kb() -> int:
+    try:
+        with open("/proc/self/status") as f:
+            for line in f:
+                if line.startswith("VmHWM:"):
+                    return int(line.split()[1])
+    except OSError:
+        pass
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+
+class StageRecorder:
+    def __init__(self):
+        self.stages = []
+
+    @contextlib.contextmanager
+    def stage(self, name: str, items: int):
+        """Time a stage, keeping the generators' progress output out of the table"""
+        reset_peak_rss()
+        with contextlib.redirect_stdout(io.StringIO()):
+            start = time.perf_counter()
+            yield
+            elapsed = time.perf_counter() - start
+        self.stages.append({'stage': name, 'items': items, 'seconds': elapsed, 'peak_rss_kb': peak_rss_kb()})
+
+
+def bench_backgrounds(workdir: Path, users: int):
+    recorder = StageRecorder()
+    theme_dir = workdir / "theme"
+    for directory in ("cache", "components"):
+        (theme_dir / directory).mkdir(parents=True)
+    updater = load_updater(theme_dir)
+    accounts_dir = populate_users(workdir, users)
+
+    with recorder.stage("load", users):
+        user_backgrounds, manifest_users, _ = updater.scan_users(str(accounts_dir), {})
+
+    entries = {
+        username: [user_backgrounds.get(username, ""), [], "", updater.fallback_face(username), "",
+                   manifest_users[username].get("dimensions"), ""]
+        for username in manifest_users
+    }
+    with recorder.stage("generate", users):
+        count = updater.shard_count(len(entries))
+        shards = [{} for _ in range(count)]
+        for username, entry in entries.items():
+            shards[updater.shard_index(username, count)][username] = entry
+        for shard in shards:
+            updater.generate_shard(shard)
+        updater.generate_qml(count, {}, {}, {}, [])
+
+    with recorder.stage("write", users):
+        count, _ = updater.write_user_shards(entries)
+        updater.write_if_changed(updater.QML_FILE, updater.generate_qml(count, {}, {}, {}, []))
+
+    with recorder.stage("cold update", users):
+        updater.update_cache(accounts_dir=str(accounts_dir), resolutions=[(1920, 1080)], full=True)
+    with recorder.stage("warm update", users):
+        updater.update_cache(accounts_dir=str(accounts_dir), resolutions=[(1920, 1080)])
+    return recorder.stages
+
+
+def bench_translations(workdir: Path, locales: int, keys: int):
+    recorder = StageRecorder()
+    translations_dir = workdir / "sddm-theme" / "translations"
+    populate_locales(translations_dir, locales, keys)
+    manager = load_script("translate-manager").TranslationManager(workdir)
+    strings = (locales + 1) * keys
+
+    with recorder.stage("load", strings):
+        catalog = TranslationCatalog(translations_dir)
+    manager.catalog = catalog
+
+    with recorder.stage("validate", strings):
+        manager.validate_translations()
+
+    with recorder.stage("generate", strings):
+        resolved = manager.resolve_fallbacks(catalog.translations())
+        manager.generate_qml_code(catalog.source.data, catalog.locales.keys())
+        for lang_code, trans_data in resolved.items():
+            manager.generate_bundle_code(lang_code, trans_data)
+
+    with recorder.stage("write", strings):
+        manager.update_translation_manager()
+    with recorder.stage("write .ts", strings):
+        manager.generate_ts_files()
+    with recorder.stage("warm check", strings):
+        manager.check_outputs()
+    return recorder.stages
+
+
+def bench_extract(workdir: Path, qml_files: int):
+    recorder = StageRecorder()
+    theme_dir = workdir / "sddm-theme"
+    sources = sorted((PROJECT_ROOT / "sddm-theme").rglob("*.qml"))
+    for index in range(qml_files):
+        target = theme_dir / f"dir{index % 16}" / f"Component{index}.qml"
+        target.parent.mkdir(parents=True, exist_ok=True)
+        shutil.copyfile(sources[index % len(sources)], target)
+    extract_strings = load_script("extract-strings")
+    cache_file = workdir / "extract-cache.json"
+
+    with recorder.stage("cold scan", qml_files):
+        extract_strings.StringExtractor(workdir, cache_file=cache_file).extract_all_strings()
+    with recorder.stage("warm scan", qml_files):
+        extract_strings.StringExtractor(workdir, cache_file=cache_file).extract_all_strings()
+    return recorder.stages
+
+
+def run_suite(suite: str, sizes: dict):
+    """Run one suite in a scratch directory; called in a fresh process"""
+    with tempfile.TemporaryDirectory() as workdir:
+        workdir = Path(workdir)
+        if suite == 'backgrounds':
+            return bench_backgrounds(workdir, sizes['users'])
+        if suite == 'translations':
+            return bench_translations(workdir, sizes['locales'], sizes['keys'])
+        return bench_extract(workdir, sizes['qml_files'])
+
+
+def suite_key(suite: str, sizes: dict) -> str:
+    """Baselines are only comparable for the same synthetic data size"""
+    if suite == 'backgrounds':
+        return f"backgrounds/{sizes['users']}-users"
+    if suite == 'translations':
+        return f"translations/{sizes['locales']}x{sizes['keys']}"
+    return f"extract/{sizes['qml_files']}-files"
+
+
+def load_baselines(path: Path) -> dict:
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the offline generators against stored baselines")
+    parser.add_argument('--users', type=int, default=10000, help="Synthetic users (default: 10000)")
+    parser.add_argument('--locales', type=int, default=100, help="Synthetic locales (default: 100)")
+    parser.add_argument('--keys', type=int, default=2000, help="Keys per locale (default: 2000)")
+    parser.add_argument('--qml-files', type=int, default=300, help="Synthetic QML files (default: 300)")
+    parser.add_argument('--suites', type=parse_list, default=SUITES,
+                        help=f"Comma separated suites to run (default: {','.join(SUITES)})")
+    parser.add_argument('--baselines', type=Path, default=BASELINES_FILE,
+                        help="Baselines file (default: tests/benchmarks/baselines.json)")
+    parser.add_argument('--update-baselines', action='store_true',
+                        help="Store these results as the new baselines instead of comparing")
+    parser.add_argument('--time-tolerance', type=float, default=2.0,
+                        help="Slowdown factor that counts as a regression (default: 2.0)")
+    parser.add_argument('--rss-tolerance', type=float, default=1.5,
+                        help="Peak RSS growth factor that counts as a regression (default: 1.5)")
+    args = parser.parse_args()
+
+    unknown = set(args.suites) - set(SUITES)
+    if unknown:
+        parser.error(f"unknown suites: {', '.join(sorted(unknown))}")
+    sizes = {'users': args.users, 'locales': args.locales, 'keys': args.keys, 'qml_files': args.qml_files}
+    baselines = load_baselines(args.baselines)
+
+    print(f"{Colors.GREEN}Ubuntu Budgie SDDM Theme - Generator Benchmarks{Colors.NC}")
+    print("=" * 50)
+    print(f"{'suite':<26} {'stage':<12} {'time (s)':>9} {'items/s':>11} {'peak RSS':>10} {'baseline':>9}")
+
+    regressions = []
+    context = multiprocessing.get_context('fork')
+    for suite in args.suites:
+        key = suite_key(suite, sizes)
+        with ProcessPoolExecutor(max_workers=1, mp_context=context) as executor:
+            stages = executor.submit(run_suite, suite, sizes).result()
+
+        for result in stages:
+            baseline = baselines.get(key, {}).get(result['stage'])
+            status = ""
+            if baseline and not args.update_baselines:
+                slower = (result['seconds'] > baseline['seconds'] * args.time_tolerance
+                          and result['seconds'] - baseline['seconds'] > TIME_SLACK)
+                bigger = (result['peak_rss_kb'] > baseline['peak_rss_kb'] * args.rss_tolerance
+                          and result['peak_rss_kb'] - baseline['peak_rss_kb'] > RSS_SLACK_KB)
+                if slower or bigger:
+                    regressions.append(f"{key} {result['stage']}")
+                    status = f"{Colors.RED}✗{Colors.NC}"
+                else:
+                    status = f"{Colors.GREEN}✓{Colors.NC}"
+                status = f"{baseline['seconds']:>7.3f} {status}"
+            rate = result['items'] / result['seconds'] if result['seconds'] else 0
+            print(f"{key:<26} {result['stage']:<12} {result['seconds']:>9.3f} {rate:>11.0f} "
+                  f"{result['peak_rss_kb'] / 1024:>8.1f}MB {status:>9}")
+
+        if args.update_baselines:
+            baselines[key] = {
+                result['stage']: {'seconds': round(result['seconds'], 4), 'peak_rss_kb': result['peak_rss_kb']}
+                for result in stages
+            }
+
+    if args.update_baselines:
+        args.baselines.write_text(json.dumps(baselines, indent=2, sort_keys=True) + "\n", encoding='utf-8')
+        print(f"\n{Colors.BLUE}Baselines written to {args.baselines}{Colors.NC}")
+        return
+
+    if regressions:
+        print(f"\n{Colors.RED}✗ {len(regressions)} regressions: {', '.join(regressions)}{Colors.NC}")
+        sys.exit(1)
+    print(f"\n{Colors.GREEN}✓ No regressions against baselines{Colors.NC}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,406 @@
+#!/usr/bin/env python3
+"""
+Greeter Startup Benchmark for slickSDDM Theme
+Loads sddm-theme/Main.qml headless (offscreen QPA, software Qt Quick backend)
+with mock sddm, userModel, sessionModel, keyboard, screenModel and config
+objects, and reports for every combination of the requested settings:
+
+  load (ms)   creating Main.qml and all its components
+  frame (ms)  process start of the view to its first swapped frame
+  objects     QObjects under the root item, and how many are QQuickItems
+  RSS         resident and peak memory once the first frame is out
+
+config serves sddm-theme/theme.conf.in, with @TOKENS@ blanked and --set
+overrides applied. Every measurement runs in a fresh process so the QML
+type cache of one run does not speed up the next.
+
+Requires PySide6 (QtQuick and QtMultimedia).
+
+Usage: bench_greeter_startup.py [--users 1,100,1000] [--locales en,fr_FR] [--blur 0,16]
+                                [--animations true,false] [--runs 3] [--set SECTION/key=value]
+"""
+
+import argparse
+import configparser
+import itertools
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).parent.parent.parent
+THEME_DIR = PROJECT_ROOT / "sddm-theme"
+THEME_CONF = THEME_DIR / "theme.conf.in"
+
+
+class Colors:
+    GREEN = '\033[0;32m'
+    RED = '\033[0;31m'
+    NC = '\033[0m'  # No Color
+
+
+# Roles of SDDM's UserModel and SessionModel, the theme reads them by number
+USER_ROLES = {257: b"name", 258: b"realName", 259: b"homeDir", 260: b"icon", 261: b"needsPassword"}
+SESSION_ROLES = {257: b"directory", 258: b"file", 259: b"type", 260: b"name", 261: b"exec", 262: b"comment"}
+
+# Give up on a run that has not rendered by then
+FIRST_FRAME_TIMEOUT_MS = 60000
+
+
+def parse_list(value):
+    return [item.strip() for item in value.split(',') if item.strip()]
+
+
+def theme_config(overrides):
+    """theme.conf.in as SDDM's config map sees it: [General] keys bare, others as Section/key"""
+    parser = configparser.ConfigParser(interpolation=None, strict=False)
+    parser.optionxform = str
+    parser.read(THEME_CONF, encoding='utf-8')
+    values = {}
+    for section in parser.sections():
+        for key, value in parser.items(section):
+            value = value.strip().strip('"')
+            if value.startswith('@') and value.endswith('@'):
+                value = ""
+            values[key if section == "General" else f"{section}/{key}"] = value
+    values.update(overrides)
+    return values
+
+
+def run_child(settings):
+    """Load the theme once and return its measurements; runs in its own process"""
+    start = time.perf_counter()
+    os.environ.setdefault("QT_QPA_PLATFORM", settings['platform'])
+    # Compile the QML every run, like a greeter without a warm disk cache
+    os.environ["QML_DISABLE_DISK_CACHE"] = "1"
+    if settings['backend']:
+        os.environ["QT_QUICK_BACKEND"] = settings['backend']
+
+    from PySide6.QtCore import (QAbstractListModel, QByteArray, QLocale, QModelIndex, QObject, QRect,
+                                Qt, QTimer, QUrl, Property, Signal, Slot, qInstallMessageHandler)
+    from PySide6.QtGui import QGuiApplication
+    from PySide6.QtQuick import QQuickItem, QQuickView
+
+    class ConfigAccessors(QObject):
+        """
+        Typed accessors of SDDM's theme config. Python slots of a
+        QQmlPropertyMap subclass are not callable from QML, so the mock is a
+        plain QObject: see mock_config() for the config['key'] lookups.
+        """
+        def raw(self, key):
+            value = self.property(key)
+            return "" if value is None else str(value)
+
+        @Slot(str, result=str)
+        def stringValue(self, key):
+            return self.raw(key)
+
+        @Slot(str, result=int)
+        def intValue(self, key):
+            try:
+                return int(float(self.raw(key)))
+            except ValueError:
+                return 0
+
+        @Slot(str, result=float)
+        def realValue(self, key):
+            try:
+                return float(self.raw(key))
+            except ValueError:
+                return 0.0
+
+        @Slot(str, result=bool)
+        def boolValue(self, key):
+            return self.raw(key).lower() == "true"
+
+    def mock_config(values):
+        """QObject with one constant property per config key on top of the typed accessors"""
+        def getter(value):
+            return lambda self: value
+
+        properties = {key: Property(str, getter(str(value)), constant=True) for key, value in values.items()}
+        return type("MockConfig", (ConfigAccessors,), properties)()
+
+    class MockListModel(QAbstractListModel):
+        def __init__(self, roles, rows):
+            super().__init__()
+            self.roles = roles
+            self.rows = rows
+
+        def rowCount(self, parent=QModelIndex()):
+            return 0 if parent.isValid() else len(self.rows)
+
+        def roleNames(self):
+            return {role: QByteArray(name) for role, name in self.roles.items()}
+
+        def data(self, index, role=Qt.DisplayRole):
+            if not index.isValid() or role not in self.roles:
+                return None
+            return self.rows[index.row()].get(self.roles[role].decode())
+
+        def get_count(self):
+            return len(self.rows)
+
+        def get_last_index(self):
+            return 0
+
+        countChanged = Signal()
+        count = Property(int, get_count, notify=countChanged)
+        lastIndex = Property(int, get_last_index, constant=True)
+
+    class MockSddm(QObject):
+        loginSucceeded = Signal()
+        loginFailed = Signal()
+        informationMessage = Signal(str)
+        currentUserChanged = Signal()
+
+        def __init__(self):
+            super().__init__()
+            self._current_user = ""
+
+        def get_current_user(self):
+            return self._current_user
+
+        def set_current_user(self, value):
+            self._current_user = value
+            self.currentUserChanged.emit()
+
+        def can(self):
+            return True
+
+        currentUser = Property(str, get_current_user, set_current_user, notify=currentUserChanged)
+        canPowerOff = Property(bool, can, constant=True)
+        canReboot = Property(bool, can, constant=True)
+        canSuspend = Property(bool, can, constant=True)
+        canHibernate = Property(bool, can, constant=True)
+        canHybridSleep = Property(bool, can, constant=True)
+
+        @Slot(str, str, int)
+        def login(self, user, password, session):
+            self.loginFailed.emit()
+
+        @Slot()
+        def powerOff(self):
+            pass
+
+        @Slot()
+        def reboot(self):
+            pass
+
+        @Slot()
+        def suspend(self):
+            pass
+
+    class MockKeyboard(QObject):
+        currentLayoutChanged = Signal()
+
+        def __init__(self):
+            super().__init__()
+            self._current_layout = 0
+
+        def get_layouts(self):
+            return [{"shortName": "us", "longName": "English (US)"},
+                    {"shortName": "de", "longName": "German"}]
+
+        def get_current_layout(self):
+            return self._current_layout
+
+        def set_current_layout(self, value):
+            self._current_layout = value
+            self.currentLayoutChanged.emit()
+
+        def off(self):
+            return False
+
+        layouts = Property('QVariantList', get_layouts, constant=True)
+        currentLayout = Property(int, get_current_layout, set_current_layout, notify=currentLayoutChanged)
+        capsLock = Property(bool, off, constant=True)
+        numLock = Property(bool, off, constant=True)
+
+    class MockScreenModel(QObject):
+        def __init__(self, width, height):
+            super().__init__()
+            self.rect = QRect(0, 0, width, height)
+
+        def get_primary(self):
+            return 0
+
+        primary = Property(int, get_primary, constant=True)
+
+        @Slot(int, result=QRect)
+        def geometry(self, index):
+            return self.rect
+
+    messages = {'warnings': 0}
+
+    def count_messages(mode, context, message):
+        messages['warnings'] += 1
+        if settings['verbose']:
+            print(message, file=sys.stderr)
+
+    qInstallMessageHandler(count_messages)
+    QLocale.setDefault(QLocale(settings['locale']))
+    app = QGuiApplication([sys.argv[0]])
+
+    width, height = settings['size']
+    users = MockListModel(USER_ROLES, [
+        {"name": f"user{index}", "realName": f"User {index}", "homeDir": f"/home/user{index}",
+         "icon": "", "needsPassword": True}
+        for index in range(settings['users'])
+    ])
+    sessions = MockListModel(SESSION_ROLES, [
+        {"directory": "/usr/share/xsessions", "file": "budgie-desktop.desktop", "type": 0,
+         "name": "Budgie Desktop", "exec": "budgie-desktop", "comment": ""}
+    ])
+    mocks = {
+        'config': mock_config(settings['config']),
+        'sddm': MockSddm(),
+        'userModel': users,
+        'sessionModel': sessions,
+        'keyboard': MockKeyboard(),
+        'screenModel': MockScreenModel(width, height),
+    }
+
+    view = QQuickView()
+    view.setResizeMode(QQuickView.SizeRootObjectToView)
+    view.resize(width, height)
+    # The theme imports SddmComponents but uses none of its types
+    view.engine().addImportPath(settings['import_dir'])
+    for name, mock in mocks.items():
+        view.rootContext().setContextProperty(name, mock)
+
+    view.setSource(QUrl.fromLocalFile(str(THEME_DIR / "Main.qml")))
+    loaded = time.perf_counter()
+    if view.status() != QQuickView.Ready:
+        return {'error': "; ".join(error.toString() for error in view.errors())}
+
+    first_frame = {}
+
+    def on_frame():
+        if not first_frame:
+            first_frame['at'] = time.perf_counter()
+            # Let the frame settle before counting, then stop
+            QTimer.singleShot(settings['settle_ms'], app.quit)
+
+    view.frameSwapped.connect(on_frame)
+    QTimer.singleShot(FIRST_FRAME_TIMEOUT_MS, app.quit)
+    view.show()
+    app.exec()
+    if not first_frame:
+        return {'error': f"no frame within {FIRST_FRAME_TIMEOUT_MS} ms"}
+
+    root = view.rootObject()
+    objects = root.findChildren(QObject)
+    memory = {}
+    with open("/proc/self/status") as f:
+        for line in f:
+            if line.startswith(("VmRSS:", "VmHWM:")):
+                memory[line.split(':')[0]] = int(line.split()[1])
+
+    return {
+        'load_ms': (loaded - start) * 1000,
+        'frame_ms': (first_frame['at'] - start) * 1000,
+        'objects': len(objects) + 1,
+        'items': sum(1 for obj in objects if isinstance(obj, QQuickItem)) + 1,
+        'rss_kb': memory.get('VmRSS', 0),
+        'peak_rss_kb': memory.get('VmHWM', 0),
+        'warnings': messages['warnings'],
+    }
+
+
+def measure(settings):
+    """Run one child process per measurement and return its result"""
+    result = subprocess.run(
+        [sys.executable, __file__, '--child', json.dumps(settings)],
+        capture_output=True, text=True
+    )
+    if result.returncode != 0:
+        return {'error': result.stderr.strip().splitlines()[-1] if result.stderr.strip() else "child failed"}
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure headless greeter startup of Main.qml")
+    parser.add_argument('--users', type=parse_list, default=['1', '100', '1000'],
+                        help="Comma separated user counts (default: 1,100,1000)")
+    parser.add_argument('--locales', type=parse_list, default=['en_US', 'fr_FR'],
+                        help="Comma separated locales (default: en_US,fr_FR)")
+    parser.add_argument('--blur', type=parse_list, default=['0', '16'],
+                        help="Comma separated blur radii for both screens (default: 0,16)")
+    parser.add_argument('--animations', type=parse_list, default=['true', 'false'],
+                        help="Comma separated enable-animations values (default: true,false)")
+    parser.add_argument('--set', action='append', default=[], metavar='KEY=VALUE',
+                        help="Override a theme.conf value, e.g. LockScreen/display=false (repeatable)")
+    parser.add_argument('--runs', type=int, default=3, help="Runs per combination, the median is shown (default: 3)")
+    parser.add_argument('--size', default="1920x1080", help="Window size (default: 1920x1080)")
+    parser.add_argument('--platform', default="offscreen", help="Qt platform plugin (default: offscreen)")
+    parser.add_argument('--backend', default="software",
+                        help="Qt Quick scene graph backend, empty for the default (default: software)")
+    parser.add_argument('--settle-ms', type=int, default=200, help="Wait after the first frame before counting objects")
+    parser.add_argument('--json', action='store_true', help="Print one JSON object per combination instead of a table")
+    parser.add_argument('--verbose', action='store_true', help="Show QML warnings of the runs")
+    parser.add_argument('--child', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        print(json.dumps(run_child(json.loads(args.child))))
+        return
+
+    try:
+        import PySide6  # noqa: F401
+    except ImportError:
+        print(f"{Colors.RED}✗ PySide6 not found - install it to run the greeter harness (pip install PySide6){Colors.NC}")
+        sys.exit(1)
+
+    overrides = dict(item.split('=', 1) for item in args.set)
+    width, height = (int(value) for value in args.size.lower().split('x'))
+
+    if not args.json:
+        print(f"{Colors.GREEN}Ubuntu Budgie SDDM Theme - Greeter Startup Benchmark{Colors.NC}")
+        print("=" * 50)
+        print(f"{'users':>6} {'locale':>7} {'blur':>5} {'anim':>6} {'load (ms)':>10} {'frame (ms)':>11} "
+              f"{'objects':>8} {'items':>6} {'RSS (MB)':>9} {'peak (MB)':>10}")
+
+    failed = False
+    with tempfile.TemporaryDirectory() as import_dir:
+        module_dir = Path(import_dir) / "SddmComponents"
+        module_dir.mkdir()
+        # Qt 6 does not consider a module without any type installed
+        (module_dir / "qmldir").write_text("module SddmComponents\nPlaceholder 2.0 Placeholder.qml\n",
+                                           encoding='utf-8')
+        (module_dir / "Placeholder.qml").write_text("import QtQml\nQtObject {}\n", encoding='utf-8')
+
+        for users, locale, blur, animations in itertools.product(args.users, args.locales, args.blur, args.animations):
+            config = theme_config({'LockScreen/blur': blur, 'LoginScreen/blur': blur,
+                                   'enable-animations': animations, **overrides})
+            settings = {
+                'users': int(users), 'locale': locale, 'config': config, 'size': [width, height],
+                'platform': args.platform, 'backend': args.backend, 'settle_ms': args.settle_ms,
+                'import_dir': import_dir, 'verbose': args.verbose,
+            }
+            results = [measure(settings) for _ in range(args.runs)]
+            errors = [result['error'] for result in results if 'error' in result]
+            if errors:
+                failed = True
+                print(f"{Colors.RED}✗ users={users} locale={locale} blur={blur} animations={animations}: "
+                      f"{errors[0]}{Colors.NC}")
+                continue
+
+            summary = {key: statistics.median(result[key] for result in results) for key in results[0]}
+            if args.json:
+                print(json.dumps({'users': int(users), 'locale': locale, 'blur': int(blur),
+                                  'animations': animations == 'true', **summary}))
+            else:
+                print(f"{users:>6} {locale:>7} {blur:>5} {animations:>6} {summary['load_ms']:>10.1f} "
+                      f"{summary['frame_ms']:>11.1f} {summary['objects']:>8.0f} {summary['items']:>6.0f} "
+                      f"{summary['rss_kb'] / 1024:>9.1f} {summary['peak_rss_kb'] / 1024:>10.1f}")
+
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
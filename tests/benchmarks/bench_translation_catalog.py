@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+Translation Catalog Benchmark for slickSDDM Theme
+Times loading a TranslationCatalog and running every check the translation
+tests and translate-manager.py --validate-only make, against synthetic locale
+directories. The per-string cost should stay roughly flat as the locale and
+key counts grow.
+
+Usage: bench_translation_catalog.py [--locales 75,150,300] [--keys 5000]
+"""
+
+import argparse
+import json
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "scripts"))
+from test_translations import Colors  # noqa: E402
+from translation_catalog import TranslationCatalog  # noqa: E402
+
+
+def parse_list(value):
+    return [int(item) for item in value.split(',') if item.strip()]
+
+
+def populate(translations_dir: Path, locales: int, keys: int):
+    """Write en.json plus locales translations, some incomplete or with broken placeholders"""
+    translations_dir.mkdir(parents=True)
+    source = {
+        f"key{index}": f"Source string {index} for {{name}}" if index % 20 == 0 else f"Source string {index}"
+        for index in range(keys)
+    }
+    (translations_dir / "en.json").write_text(json.dumps(source, indent=2), encoding='utf-8')
+    for locale in range(locales):
+        data = {key: f"Übersetzung {locale} {value}" for key, value in source.items()}
+        if locale % 3 == 0:
+            for index in range(0, keys, 50):
+                del data[f"key{index + 1}"]
+        if locale % 5 == 0:
+            data["key0"] = "Ohne Platzhalter"
+            data[f"key{keys - 1}"] = ""
+        (translations_dir / f"xx_{locale:03d}.json").write_text(
+            json.dumps(data, indent=2, ensure_ascii=False), encoding='utf-8'
+        )
+
+
+def validate(catalog: TranslationCatalog) -> int:
+    """Run every catalog check on every locale, returning how many issues were found"""
+    issues = 0
+    for code in catalog.translated_codes():
+        issues += len(catalog.missing_keys(code))
+        issues += len(catalog.extra_keys(code))
+        issues += len(catalog.empty_keys(code))
+        issues += len(catalog.placeholder_mismatches(code))
+        catalog.completion(code)
+    return issues
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the shared translation catalog")
+    parser.add_argument('--locales', type=parse_list, default=[75, 150, 300],
+                        help="Comma separated synthetic locale counts (default: 75,150,300)")
+    parser.add_argument('--keys', type=parse_list, default=[5000],
+                        help="Comma separated key counts per locale (default: 5000)")
+    args = parser.parse_args()
+
+    print(f"{Colors.GREEN}Ubuntu Budgie SDDM Theme - Translation Catalog Benchmark{Colors.NC}")
+    print("=" * 50)
+    print(f"{'locales':>8} {'keys':>8} {'load (s)':>10} {'checks (s)':>11} {'µs/string':>10} {'issues':>8}")
+
+    with tempfile.TemporaryDirectory() as workdir:
+        for keys in args.keys:
+            for locales in args.locales:
+                translations_dir = Path(workdir) / f"{locales}x{keys}"
+                populate(translations_dir, locales, keys)
+
+                start = time.perf_counter()
+                catalog = TranslationCatalog(translations_dir)
+                loaded = time.perf_counter()
+                issues = validate(catalog)
+                checked = time.perf_counter()
+
+                strings = (locales + 1) * keys
+                per_string = (checked - start) / strings * 1e6
+                print(f"{locales:>8} {keys:>8} {loaded - start:>10.3f} {checked - loaded:>11.3f} "
+                      f"{per_string:>10.2f} {issues:>8}")
+
+
+if __name__ == "__main__":
+    main()
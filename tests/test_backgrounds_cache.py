@@ -0,0 +1,532 @@
+#!/usr/bin/env python3
+"""
+Backgrounds Cache Test Suite for slickSDDM Theme
+Tests the Python embedded in sddm-theme/scripts/update-sddm-backgrounds-cache.in
+against a synthetic AccountsService users directory.
+"""
+
+import json
+import os
+import struct
+import sys
+import tempfile
+import time
+import types
+import zlib
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).parent.parent
+UPDATER_TEMPLATE = PROJECT_ROOT / "sddm-theme" / "scripts" / "update-sddm-backgrounds-cache.in"
+
+# Colors for terminal output
+class Colors:
+    GREEN = '\033[0;32m'
+    YELLOW = '\033[1;33m'
+    RED = '\033[0;31m'
+    BLUE = '\033[0;34m'
+    NC = '\033[0m'  # No Color
+
+
+def load_updater(theme_dir: Path) -> types.ModuleType:
+    """
+    Extract the embedded Python from the updater template, substitute the
+    meson tokens and load it as a module (without running main()).
+    """
+    template = UPDATER_TEMPLATE.read_text(encoding='utf-8')
+    start = template.index("<< 'PYTHON_SCRIPT'\n") + len("<< 'PYTHON_SCRIPT'\n")
+    end = template.index("\nPYTHON_SCRIPT", start)
+    source = template[start:end].replace("@THEME_DIR@", str(theme_dir))
+
+    module = types.ModuleType("update_sddm_backgrounds_cache")
+    module.__file__ = str(UPDATER_TEMPLATE)
+    exec(compile(source, str(UPDATER_TEMPLATE), 'exec'), module.__dict__)
+    return module
+
+
+def png_bytes(width: int, height: int) -> bytes:
+    """A complete, valid greyscale PNG of the given size"""
+    def chunk(kind: bytes, data: bytes) -> bytes:
+        return struct.pack('>I', len(data)) + kind + data + struct.pack('>I', zlib.crc32(kind + data))
+
+    rows = b''.join(b'\x00' + b'\x80' * width for _ in range(height))
+    return (b'\x89PNG\r\n\x1a\n' + chunk(b'IHDR', struct.pack('>IIBBBBB', width, height, 8, 0, 0, 0, 0))
+            + chunk(b'IDAT', zlib.compress(rows)) + chunk(b'IEND', b''))
+
+
+def write_user(accounts_dir: Path, username: str, background: str, icon: str = ""):
+    """Write a minimal AccountsService user file"""
+    icon_line = f"Icon={icon}\n" if icon else ""
+    (accounts_dir / username).write_text(
+        f"[User]\nLanguage=\nXSession=budgie-desktop\nBackgroundFile='{background}'\n{icon_line}SystemAccount=false\n",
+        encoding='utf-8'
+    )
+
+
+class BackgroundsCacheTester:
+    def __init__(self, workdir: Path):
+        self.workdir = workdir
+        self.theme_dir = workdir / "theme"
+        self.accounts_dir = workdir / "users"
+        self.backgrounds_dir = workdir / "backgrounds"
+        self.errors = []
+
+        for directory in (self.theme_dir / "cache", self.theme_dir / "components",
+                          self.accounts_dir, self.backgrounds_dir):
+            directory.mkdir(parents=True, exist_ok=True)
+        # Run as root, the updater starts its converters as 'nobody'
+        workdir.chmod(0o755)
+
+        self.updater = load_updater(self.theme_dir)
+
+    def make_background(self, name: str, mode: int = 0o644) -> Path:
+        path = self.backgrounds_dir / name
+        path.write_bytes(png_bytes(4, 3))
+        path.chmod(mode)
+        return path
+
+    def make_fake_tool(self):
+        """Stand-in for ImageMagick: writes an image to stdout and logs the call"""
+        log = self.workdir / "tool.log"
+        tool = self.workdir / "fake-magick"
+        tool.write_text(
+            "#!/usr/bin/env python3\n"
+            "import sys\n"
+            f"open({str(log)!r}, 'a').write(' '.join(sys.argv[1:]) + '\\n')\n"
+            "sys.stdout.write('image')\n",
+            encoding='utf-8'
+        )
+        tool.chmod(0o755)
+        log.write_text("", encoding='utf-8')
+        log.chmod(0o666)
+        return [str(tool)], log
+
+    def update(self, full: bool = False):
+        return self.updater.update_cache(accounts_dir=str(self.accounts_dir),
+                                         resolutions=[(1920, 1080)], full=full)
+
+    def check(self, condition: bool, message: str) -> bool:
+        if not condition:
+            self.errors.append(message)
+            print(f"  {Colors.RED}✗ {message}{Colors.NC}")
+        return condition
+
+    def test_initial_scan(self) -> bool:
+        """Test that the first run publishes accessible backgrounds only."""
+        print(f"\n{Colors.BLUE}Test: Initial scan{Colors.NC}")
+        readable = self.make_background("alice.jpg")
+        private = self.make_background("bob.jpg", mode=0o600)
+        write_user(self.accounts_dir, "alice", str(readable))
+        write_user(self.accounts_dir, "bob", str(private))
+        write_user(self.accounts_dir, "sddm", str(readable))
+
+        written = self.update()
+        cache = Path(self.updater.CACHE_FILE).read_text(encoding='utf-8')
+
+        ok = self.check(self.updater.CACHE_FILE in written and self.updater.QML_FILE in written,
+                        f"expected cache and QML to be written, got {written}")
+        ok &= self.check('"alice"' in cache, "alice missing from cache")
+        ok &= self.check('"bob"' not in cache, "non world-readable background was published")
+        ok &= self.check('"sddm"' not in cache, "system user was published")
+        if ok:
+            print(f"  {Colors.GREEN}✓ PASSED{Colors.NC}")
+        return ok
+
+    def test_unchanged_run_writes_nothing(self) -> bool:
+        """Test that a run over unchanged inputs rewrites no output."""
+        print(f"\n{Colors.BLUE}Test: Unchanged run writes nothing{Colors.NC}")
+        qml_mtime = os.stat(self.updater.QML_FILE).st_mtime_ns
+        written = self.update()
+
+        ok = self.check(written == [], f"expected no writes, got {written}")
+        ok &= self.check(os.stat(self.updater.QML_FILE).st_mtime_ns == qml_mtime, "QML file was touched")
+        if ok:
+            print(f"  {Colors.GREEN}✓ PASSED{Colors.NC}")
+        return ok
+
+    def test_only_changed_users_reread(self) -> bool:
+        """Test that only modified user files are re-read."""
+        print(f"\n{Colors.BLUE}Test: Only changed users re-read{Colors.NC}")
+        previous = self.updater.load_manifest(self.updater.MANIFEST_FILE).get("users", {})
+        carol = self.make_background("carol.jpg")
+        write_user(self.accounts_dir, "carol", str(carol))
+
+        _, _, reread = self.updater.scan_users(str(self.accounts_dir), previous)
+        ok = self.check(reread == 1, f"expected 1 user file re-read, got {reread}")
+        written = self.update()
+        ok &= self.check(self.updater.CACHE_FILE in written and self.updater.QML_FILE not in written,
+                         f"new user should only update the cache and its shard, got {written}")
+        if ok:
+            print(f"  {Colors.GREEN}✓ PASSED{Colors.NC}")
+        return ok
+
+    def test_background_change_detected(self) -> bool:
+        """Test that a background becoming readable is picked up without a user file change."""
+        print(f"\n{Colors.BLUE}Test: Background change detected{Colors.NC}")
+        (self.backgrounds_dir / "bob.jpg").chmod(0o644)
+        self.update()
+        cache = Path(self.updater.CACHE_FILE).read_text(encoding='utf-8')
+
+        ok = self.check('"bob"' in cache, "bob's now readable background was not published")
+        if ok:
+            print(f"  {Colors.GREEN}✓ PASSED{Colors.NC}")
+        return ok
+
+    def test_outdated_manifest_ignored(self) -> bool:
+        """Test that a manifest from another version triggers a full rescan."""
+        print(f"\n{Colors.BLUE}Test: Outdated manifest ignored{Colors.NC}")
+        Path(self.updater.MANIFEST_FILE).write_text('{"version": -1, "users": {}}', encoding='utf-8')
+
+        ok = self.check(self.updater.load_manifest(self.updater.MANIFEST_FILE) == {},
+                        "outdated manifest was not discarded")
+        if ok:
+            print(f"  {Colors.GREEN}✓ PASSED{Colors.NC}")
+        return ok
+
+    def test_image_validation(self) -> bool:
+        """Test that image headers are parsed and truncated, corrupt or oversized backgrounds rejected."""
+        print(f"\n{Colors.BLUE}Test: Image validation{Colors.NC}")
+        jpeg = (b'\xff\xd8' + b'\xff\xe0' + struct.pack('>H', 16) + b'JFIF\x00' + b'\x00' * 9
+                + b'\xff\xc0' + struct.pack('>HBHHB', 11, 8, 1080, 1920, 1) + b'\x01\x11\x00'
+                + b'\xff\xda' + b'\x00' * 16 + b'\xff\xd9')
+        webp_data = b'\x2f' + struct.pack('<I', (640 - 1) | ((480 - 1) << 14)) + b'\x00' * 8
+        webp = b'RIFF' + struct.pack('<I', 12 + len(webp_data)) + b'WEBP' + b'VP8L' + struct.pack('<I', len(webp_data)) + webp_data
+        samples = {
+            "valid.png": (png_bytes(7, 5), [7, 5]),
+            "valid.jpg": (jpeg, [1920, 1080]),
+            "valid.webp": (webp, [640, 480]),
+            "truncated.png": (png_bytes(7, 5)[:-20], None),
+            "truncated.jpg": (jpeg[:40], None),
+            "truncated.webp": (webp[:-4], None),
+            "text.jpg": (b"not really an image", None),
+        }
+        ok = True
+        for name, (data, expected) in samples.items():
+            path = self.backgrounds_dir / name
+            path.write_bytes(data)
+            dimensions = self.updater.image_dimensions(str(path))
+            ok &= self.check(dimensions == expected, f"{name}: expected {expected}, got {dimensions}")
+
+        huge = self.backgrounds_dir / "huge.png"
+        huge.write_bytes(png_bytes(1, 1).replace(struct.pack('>II', 1, 1), struct.pack('>II', 20000, 20000), 1))
+        accepted, _ = self.updater.evaluate_background("ivan", str(huge), self.updater.background_signature(str(huge)))
+        ok &= self.check(accepted is None, "oversized background was accepted")
+        accepted, dimensions = self.updater.evaluate_background(
+            "ivan", str(self.backgrounds_dir / "valid.jpg"),
+            self.updater.background_signature(str(self.backgrounds_dir / "valid.jpg")))
+        ok &= self.check(dimensions == [1920, 1080], f"dimensions were not recorded: {dimensions}")
+        if ok:
+            print(f"  {Colors.GREEN}✓ PASSED{Colors.NC}")
+        return ok
+
+    def test_parallel_scan_matches_sequential(self) -> bool:
+        """Test that a multi-threaded scan produces the same result as a single-threaded one."""
+        print(f"\n{Colors.BLUE}Test: Parallel scan matches sequential{Colors.NC}")
+        accounts_dir = self.workdir / "many-users"
+        accounts_dir.mkdir()
+        shared = self.make_background("shared.jpg")
+        users = 3 * self.updater.SCAN_CHUNK_SIZE + 7
+        for index in range(users):
+            write_user(accounts_dir, f"user{index}", str(shared) if index % 3 else "/missing.jpg")
+
+        sequential = self.updater.scan_users(str(accounts_dir), {}, workers=1)
+        parallel = self.updater.scan_users(str(accounts_dir), {}, workers=8)
+        ok = self.check(parallel == sequential, "parallel scan differs from sequential scan")
+        ok &= self.check(len(parallel[0]) == users - len(range(0, users, 3)),
+                         f"unexpected number of published users {len(parallel[0])}")
+        if ok:
+            print(f"  {Colors.GREEN}✓ PASSED{Colors.NC}")
+        return ok
+
+    def test_user_lookup_sharded(self) -> bool:
+        """Test that users are split into hash shards and stale shards are removed."""
+        print(f"\n{Colors.BLUE}Test: User lookup sharded{Colors.NC}")
+        # Published FNV-1a test vector: the QML side relies on the same hash
+        ok = self.check(self.updater.shard_index("a", 1 << 32) == 0xe40c292c, "shard hash is not FNV-1a")
+
+        per_shard = self.updater.USERS_PER_SHARD
+        background = self.make_background("shard.jpg")
+        extra = [f"shard{index}" for index in range(per_shard * 2)]
+        for username in extra:
+            write_user(self.accounts_dir, username, str(background))
+        self.update()
+        count = self.updater.shard_count(len(extra) + 4)
+        shards = sorted(Path(self.updater.SHARDS_DIR).glob("users-*.qml"))
+        ok &= self.check(len(shards) == count == 4, f"expected 4 shards, got {len(shards)} of {count}")
+        shard = Path(self.updater.shard_path(self.updater.shard_index("alice", count))).read_text(encoding='utf-8')
+        ok &= self.check('"alice"' in shard, "alice is not in the shard the greeter will look in")
+
+        for username in extra:
+            (self.accounts_dir / username).unlink()
+        self.update()
+        shards = sorted(Path(self.updater.SHARDS_DIR).glob("users-*.qml"))
+        ok &= self.check(len(shards) == 1, f"stale shards were left behind: {len(shards)}")
+        if ok:
+            print(f"  {Colors.GREEN}✓ PASSED{Colors.NC}")
+        return ok
+
+    def test_display_resolution_detection(self) -> bool:
+        """Test that preferred modes of connected DRM connectors are detected."""
+        print(f"\n{Colors.BLUE}Test: Display resolution detection{Colors.NC}")
+        drm_dir = self.workdir / "drm"
+        connectors = {
+            "card0-eDP-1": ("connected", "2560x1600\n1920x1200\n"),
+            "card0-HDMI-A-1": ("connected", "1920x1080i\n1280x720\n"),
+            "card0-DP-1": ("disconnected", ""),
+        }
+        for name, (status, modes) in connectors.items():
+            (drm_dir / name).mkdir(parents=True)
+            (drm_dir / name / "status").write_text(status + "\n", encoding='utf-8')
+            (drm_dir / name / "modes").write_text(modes, encoding='utf-8')
+
+        detected = self.updater.detect_display_resolutions(str(drm_dir))
+        ok = self.check(detected == [(1920, 1080), (2560, 1600)], f"unexpected resolutions {detected}")
+        ok &= self.check(self.updater.parse_resolutions("1280x720, 3840x2160") == [(1280, 720), (3840, 2160)],
+                         "--resolutions list was not parsed")
+        if ok:
+            print(f"  {Colors.GREEN}✓ PASSED{Colors.NC}")
+        return ok
+
+    def test_variants_rendered_incrementally(self) -> bool:
+        """Test that scaled/blurred variants are only rendered when missing."""
+        print(f"\n{Colors.BLUE}Test: Variants rendered incrementally{Colors.NC}")
+        tool, log = self.make_fake_tool()
+        source = str(self.make_background("dave.jpg"))
+        sources = {source: source}
+
+        def render(blurs, previous):
+            log.write_text("", encoding='utf-8')
+            result = self.updater.build_variants(sources, [(1920, 1080)], blurs, previous, tool)
+            return result, len(log.read_text(encoding='utf-8').splitlines())
+
+        (variants, manifest), calls = render([16], {})
+        ok = self.check(calls == 2, f"expected a scaled and a blurred render, got {calls}")
+        # The coder comes from the header, not from the .jpg extension
+        ok &= self.check(f"png:{source}[0]" in log.read_text(encoding='utf-8').splitlines()[0],
+                         "source was not passed with its sniffed coder")
+        ok &= self.check([entry[3] for entry in variants[source]] == [0, 16], f"unexpected variants {variants}")
+
+        (variants, manifest), calls = render([8, 16], manifest)
+        ok &= self.check(calls == 1, f"expected only the new blur radius to render, got {calls}")
+
+        (variants, manifest), calls = render([8, 16], manifest)
+        ok &= self.check(calls == 0, f"expected no renders for unchanged inputs, got {calls}")
+
+        Path(source).write_text("msl:/etc/shadow", encoding='utf-8')
+        (variants, manifest), calls = render([16], manifest)
+        ok &= self.check(calls == 0 and source not in variants, f"expected a non-image to be skipped, got {calls}")
+        if ok:
+            print(f"  {Colors.GREEN}✓ PASSED{Colors.NC}")
+        return ok
+
+    def test_avatar_thumbnails(self) -> bool:
+        """Test that avatar thumbnails follow the theme settings and are only rendered when missing."""
+        print(f"\n{Colors.BLUE}Test: Avatar thumbnails{Colors.NC}")
+        tool, log = self.make_fake_tool()
+        icons = [str(self.make_background("icon-erin.png")), str(self.make_background("icon-frank.png"))]
+
+        def render(settings, previous):
+            log.write_text("", encoding='utf-8')
+            result = self.updater.build_avatars(icons, settings, previous, tool)
+            return result, log.read_text(encoding='utf-8').splitlines()
+
+        (avatars, manifest), calls = render((120, 60), {})
+        ok = self.check(len(calls) == 2 and "roundrectangle 0,0,119,119,60,60" in calls[0],
+                        f"expected circular 120px renders, got {calls}")
+        ok &= self.check(all(call.startswith("png:") for call in calls), f"icons were not passed with a coder: {calls}")
+
+        (avatars, manifest), calls = render((120, 60), manifest)
+        ok &= self.check(calls == [], f"expected no renders for unchanged inputs, got {calls}")
+
+        (avatars, manifest), calls = render((90, 0), manifest)
+        ok &= self.check(len(calls) == 2 and "roundrectangle" not in calls[0],
+                         f"expected unmasked square renders after a settings change, got {calls}")
+
+        config = self.updater.read_theme_config(str(self.workdir / "missing.conf"))
+        ok &= self.check(self.updater.avatar_settings(config) == (120, 60), "defaults differ from Config.qml")
+        # Same choice as getFallbackAvatar() in Avatar.qml
+        ok &= self.check([self.updater.fallback_face(name) for name in ("a", "alice", "jöhn.doe")] == [7, 0, 2],
+                         "fallback face differs from Avatar.qml")
+        if ok:
+            print(f"  {Colors.GREEN}✓ PASSED{Colors.NC}")
+        return ok
+
+    def test_icons_published_readable(self) -> bool:
+        """Test that Icon= is collected, home icons are copied into the cache and private ones skipped."""
+        print(f"\n{Colors.BLUE}Test: Icons published readable{Colors.NC}")
+        readable = self.make_background("icon-gina.png")
+        private = self.make_background("icon-hank.png", mode=0o600)
+        write_user(self.accounts_dir, "gina", str(self.backgrounds_dir / "gina-bg.jpg"), icon=f"'{readable}'")
+        write_user(self.accounts_dir, "hank", str(self.backgrounds_dir / "hank-bg.jpg"), icon=str(private))
+
+        self.update()
+        manifest_users = self.updater.load_manifest(self.updater.MANIFEST_FILE)["users"]
+        ok = self.check(manifest_users["gina"]["icon"] == str(readable), "Icon= was not collected")
+
+        def shard_entry(username):
+            count = self.updater.shard_count(len(manifest_users))
+            shard = Path(self.updater.shard_path(self.updater.shard_index(username, count))).read_text(encoding='utf-8')
+            return json.loads(shard[shard.index("({") + 1:shard.rindex("})") + 1])[username]
+
+        ok &= self.check(shard_entry("gina")[4] == str(readable), "readable icon was not published in place")
+        ok &= self.check(shard_entry("hank")[4] == "", "private icon was published")
+
+        # A world-readable icon behind a home directory the greeter cannot enter
+        greeter_readable = self.updater.greeter_readable
+        self.updater.greeter_readable = lambda path, signature: False
+
+        def publish(path, owners):
+            return self.updater.publish_icon(str(path), self.updater.background_signature(str(path)), owners)
+
+        try:
+            owner = readable.stat().st_uid
+            copy = Path(publish(readable, {owner}))
+            stranger = publish(readable, {owner + 1})
+            # Swapped for a symlink to a file only root may read
+            secret = self.make_background("secret.png", mode=0o600)
+            link = self.backgrounds_dir / "icon-ivan.png"
+            link.symlink_to(secret)
+            linked = publish(link, {owner})
+        finally:
+            self.updater.greeter_readable = greeter_readable
+        ok &= self.check(copy.parent == Path(self.updater.AVATARS_DIR) and copy.read_bytes() == readable.read_bytes()
+                         and copy.stat().st_mode & 0o777 == 0o644,
+                         f"home icon was not published as a world-readable copy: {copy}")
+        ok &= self.check(stranger == "", "icon owned by another user was published")
+        ok &= self.check(linked == "", "symlinked icon was published")
+        if ok:
+            print(f"  {Colors.GREEN}✓ PASSED{Colors.NC}")
+        return ok
+
+    def test_video_posters(self) -> bool:
+        """Test that video backgrounds get a poster frame, extracted once per video version."""
+        print(f"\n{Colors.BLUE}Test: Video posters{Colors.NC}")
+        tool, log = self.make_fake_tool()
+        video = self.backgrounds_dir / "intro.MP4"
+        video.write_bytes(b"\x00\x00\x00\x18ftypmp42 video")
+        videos = {"intro.MP4": str(video)}
+
+        def extract(previous):
+            log.write_text("", encoding='utf-8')
+            result = self.updater.build_posters(videos, previous, tool[0])
+            return result, log.read_text(encoding='utf-8').splitlines()
+
+        (posters, manifest), calls = extract({})
+        ok = self.check(self.updater.is_video(str(video)), "upper-case video extension not recognised")
+        ok &= self.check(len(calls) == 1 and "-frames:v 1" in calls[0] and "-protocol_whitelist file -f mov" in calls[0],
+                         f"expected one sandboxed frame extraction, got {calls}")
+        ok &= self.check(posters["intro.MP4"][0] == self.updater.poster_path(str(video)), f"unexpected posters {posters}")
+
+        _, calls = extract(manifest)
+        ok &= self.check(calls == [], f"expected no extraction for an unchanged video, got {calls}")
+
+        video.write_bytes(b"\x1a\x45\xdf\xa3 another video")
+        (_, manifest), calls = extract(manifest)
+        ok &= self.check(len(calls) == 1 and "-f matroska" in calls[0],
+                         f"expected a changed video to be extracted again, got {calls}")
+
+        # A playlist renamed to .mp4 must never reach ffmpeg's probing
+        video.write_bytes(b"#EXTM3U\n/etc/shadow\n")
+        (posters, _), calls = extract(manifest)
+        ok &= self.check(calls == [] and "intro.MP4" not in posters, f"expected a fake video to be skipped, got {calls}")
+        if ok:
+            print(f"  {Colors.GREEN}✓ PASSED{Colors.NC}")
+        return ok
+
+    def test_watcher_maps_events_to_users(self) -> bool:
+        """Test that inotify events are debounced and mapped to the affected users."""
+        print(f"\n{Colors.BLUE}Test: Watcher maps events to users{Colors.NC}")
+        write_user(self.accounts_dir, "ivy", "/home/ivy/background.jpg")
+        self.update()
+        watcher = self.updater.CacheWatcher(str(self.accounts_dir), [(1920, 1080)], debounce=0.2)
+        watcher.sync_watches()
+        watched = set(watcher.inotify.watches.values())
+        ok = self.check(str(self.backgrounds_dir) in watched, "background directory is not watched")
+        ok &= self.check("/home/ivy/background.jpg" not in watcher.background_users,
+                         "rejected background in /home is watched")
+
+        # A burst of writes to one user file and a background shared by nobody else
+        for _ in range(3):
+            write_user(self.accounts_dir, "alice", str(self.backgrounds_dir / "alice.jpg"))
+        carol = self.backgrounds_dir / "carol.jpg"
+        carol.write_bytes(carol.read_bytes())
+        (self.backgrounds_dir / "unrelated.jpg").write_bytes(b"nobody uses this")
+
+        affected = watcher.affected_users(watcher.collect())
+        ok &= self.check(affected == {"alice", "carol"}, f"unexpected affected users {affected}")
+
+        written = self.updater.update_cache(accounts_dir=str(self.accounts_dir),
+                                            resolutions=[(1920, 1080)], only=affected)
+        ok &= self.check(written == [], f"content-neutral changes rewrote outputs: {written}")
+
+        # An update for one user only looks at that user's background and icon
+        checked = []
+        background_signature = self.updater.background_signature
+        self.updater.background_signature = lambda path: checked.append(path) or background_signature(path)
+        try:
+            self.updater.update_cache(accounts_dir=str(self.accounts_dir), resolutions=[(1920, 1080)], only={"alice"})
+        finally:
+            self.updater.background_signature = background_signature
+        expected = {str(self.backgrounds_dir / "alice.jpg"), str(self.workdir / "icons" / "alice")}
+        ok &= self.check(set(checked) <= expected, f"single user update checked other files: {set(checked) - expected}")
+        os.close(watcher.inotify.fd)
+
+        # A burst that never settles is flushed after at most MAX_WAIT_PERIODS debounces
+        def endless(timeout):
+            time.sleep(0.02)
+            return ["event"]
+
+        watcher.inotify.read_events = endless
+        start = time.monotonic()
+        events = watcher.collect()
+        elapsed = time.monotonic() - start
+        ok &= self.check(len(events) > 1 and elapsed < 0.2 * watcher.MAX_WAIT_PERIODS + 0.5,
+                         f"endless burst was not flushed ({len(events)} events in {elapsed:.2f}s)")
+        if ok:
+            print(f"  {Colors.GREEN}✓ PASSED{Colors.NC}")
+        return ok
+
+    def run_all_tests(self) -> bool:
+        """Run all backgrounds cache tests."""
+        print(f"{Colors.GREEN}Ubuntu Budgie SDDM Theme - Backgrounds Cache Tests{Colors.NC}")
+        print("=" * 50)
+
+        # Order matters: each test builds on the state left by the previous one
+        tests = [
+            self.test_initial_scan,
+            self.test_unchanged_run_writes_nothing,
+            self.test_only_changed_users_reread,
+            self.test_background_change_detected,
+            self.test_outdated_manifest_ignored,
+            self.test_image_validation,
+            self.test_parallel_scan_matches_sequential,
+            self.test_user_lookup_sharded,
+            self.test_display_resolution_detection,
+            self.test_variants_rendered_incrementally,
+            self.test_avatar_thumbnails,
+            self.test_icons_published_readable,
+            self.test_video_posters,
+            self.test_watcher_maps_events_to_users,
+        ]
+
+        results = [test() for test in tests]
+
+        passed_tests = sum(results)
+        total_tests = len(results)
+        print(f"\n{Colors.BLUE}Tests passed: {passed_tests}/{total_tests}{Colors.NC}")
+
+        if all(results):
+            print(f"\n{Colors.GREEN}✓ All tests passed!{Colors.NC}")
+            return True
+        print(f"\n{Colors.RED}✗ Tests failed with errors{Colors.NC}")
+        return False
+
+
+def main():
+    with tempfile.TemporaryDirectory() as workdir:
+        tester = BackgroundsCacheTester(Path(workdir))
+        success = tester.run_all_tests()
+
+    sys.exit(0 if success else 1)
+
+if __name__ == "__main__":
+    main()
@@ -4,11 +4,12 @@ Translation Test Suite for slickSDDM Theme
 Tests translation files for completeness, validity, and consistency.
 """
 
-import json
-import os
 import sys
 from pathlib import Path
-from typing import Dict, List, Set
+from typing import List
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+from translation_catalog import SOURCE_LOCALE, TranslationCatalog  # noqa: E402
 
 # Colors for terminal output
 class Colors:
@@ -24,26 +25,21 @@ class TranslationTester:
         self.source_file = translations_dir / "en.json"
         self.errors = []
         self.warnings = []
-        
-    def load_json(self, filepath: Path) -> Dict:
-        """Load and parse a JSON file."""
-        try:
-            with open(filepath, 'r', encoding='utf-8') as f:
-                return json.load(f)
-        except json.JSONDecodeError as e:
-            self.errors.append(f"{filepath.name}: Invalid JSON - {e}")
-            return {}
-        except Exception as e:
-            self.errors.append(f"{filepath.name}: Failed to read - {e}")
-            return {}
+        # Every file is parsed once here and shared by all tests
+        self.catalog = TranslationCatalog(translations_dir)
+        for code, error in sorted(self.catalog.errors.items()):
+            self.errors.append(f"{self.catalog.locales[code].path.name}: {error}")
     
     def get_translation_files(self) -> List[Path]:
         """Get all translation JSON files except source."""
-        files = []
-        for file in self.translations_dir.glob("*.json"):
-            if file != self.source_file:
-                files.append(file)
-        return sorted(files)
+        return [self.catalog.locales[code].path for code in self.catalog.translated_codes()]
+    
+    def get_translations(self):
+        """Get the catalog entries of all translations except source, skipping empty files."""
+        for code in self.catalog.translated_codes():
+            locale = self.catalog.locales[code]
+            if locale.data:
+                yield locale
     
     def test_source_file_exists(self) -> bool:
         """Test that source translation file exists."""
@@ -60,13 +56,17 @@ class TranslationTester:
         print(f"\n{Colors.BLUE}Test: JSON validity{Colors.NC}")
         all_valid = True
         
-        for file in [self.source_file] + self.get_translation_files():
-            data = self.load_json(file)
-            if not data and file.stat().st_size > 0:
+        # The source is always checked: catalog.source is None when it fails to parse
+        for code in [SOURCE_LOCALE] + self.catalog.translated_codes():
+            locale = self.catalog.locales.get(code)
+            if locale is None:
+                all_valid = False
+                print(f"  {Colors.RED}✗ {code}.json - missing{Colors.NC}")
+            elif not locale.data and locale.size > 0:
                 all_valid = False
-                print(f"  {Colors.RED}✗ {file.name}{Colors.NC}")
+                print(f"  {Colors.RED}✗ {locale.path.name}{Colors.NC}")
             else:
-                print(f"  {Colors.GREEN}✓ {file.name}{Colors.NC}")
+                print(f"  {Colors.GREEN}✓ {locale.path.name}{Colors.NC}")
         
         if all_valid:
             print(f"  {Colors.GREEN}✓ PASSED{Colors.NC}")
@@ -77,22 +77,16 @@ class TranslationTester:
     def test_key_completeness(self) -> bool:
         """Test that all translation files have all keys from source."""
         print(f"\n{Colors.BLUE}Test: Key completeness{Colors.NC}")
-        source_data = self.load_json(self.source_file)
-        if not source_data:
+        if not self.catalog.source or not self.catalog.source.data:
             print(f"  {Colors.RED}✗ FAILED - Cannot load source file{Colors.NC}")
             return False
         
-        source_keys = set(source_data.keys())
         all_complete = True
         
-        for file in self.get_translation_files():
-            trans_data = self.load_json(file)
-            if not trans_data:
-                continue
-            
-            trans_keys = set(trans_data.keys())
-            missing_keys = source_keys - trans_keys
-            extra_keys = trans_keys - source_keys
+        for locale in self.get_translations():
+            file = locale.path
+            missing_keys = self.catalog.missing_keys(locale.code)
+            extra_keys = self.catalog.extra_keys(locale.code)
             
             if missing_keys:
                 all_complete = False
@@ -117,35 +111,20 @@ class TranslationTester:
     def test_placeholder_consistency(self) -> bool:
         """Test that placeholders like {name} are preserved in translations."""
         print(f"\n{Colors.BLUE}Test: Placeholder consistency{Colors.NC}")
-        source_data = self.load_json(self.source_file)
-        if not source_data:
+        if not self.catalog.source or not self.catalog.source.data:
             print(f"  {Colors.RED}✗ FAILED - Cannot load source file{Colors.NC}")
             return False
         
-        # Find all placeholders in source
-        import re
-        placeholder_pattern = re.compile(r'\{(\w+)\}')
-        
         all_consistent = True
-        for file in self.get_translation_files():
-            trans_data = self.load_json(file)
-            if not trans_data:
-                continue
-            
-            for key, source_value in source_data.items():
-                if key not in trans_data:
-                    continue
-                
-                source_placeholders = set(placeholder_pattern.findall(source_value))
-                trans_placeholders = set(placeholder_pattern.findall(trans_data[key]))
-                
-                if source_placeholders != trans_placeholders:
-                    all_consistent = False
-                    self.errors.append(
-                        f"{file.name}: Key '{key}' has mismatched placeholders. "
-                        f"Expected: {source_placeholders}, Got: {trans_placeholders}"
-                    )
-                    print(f"  {Colors.RED}✗ {file.name} - Key '{key}'{Colors.NC}")
+        for locale in self.get_translations():
+            file = locale.path
+            for key, source_placeholders, trans_placeholders in self.catalog.placeholder_mismatches(locale.code):
+                all_consistent = False
+                self.errors.append(
+                    f"{file.name}: Key '{key}' has mismatched placeholders. "
+                    f"Expected: {set(source_placeholders)}, Got: {set(trans_placeholders)}"
+                )
+                print(f"  {Colors.RED}✗ {file.name} - Key '{key}'{Colors.NC}")
         
         if all_consistent:
             print(f"  {Colors.GREEN}✓ PASSED{Colors.NC}")
@@ -158,12 +137,9 @@ class TranslationTester:
         print(f"\n{Colors.BLUE}Test: No empty values{Colors.NC}")
         all_valid = True
         
-        for file in self.get_translation_files():
-            trans_data = self.load_json(file)
-            if not trans_data:
-                continue
-            
-            empty_keys = [k for k, v in trans_data.items() if not v or not v.strip()]
+        for locale in self.get_translations():
+            file = locale.path
+            empty_keys = sorted(self.catalog.empty_keys(locale.code))
             if empty_keys:
                 all_valid = False
                 self.warnings.append(
@@ -182,24 +158,18 @@ class TranslationTester:
     def test_translation_coverage(self) -> bool:
         """Test translation coverage percentage."""
         print(f"\n{Colors.BLUE}Test: Translation coverage{Colors.NC}")
-        source_data = self.load_json(self.source_file)
-        if not source_data:
+        if not self.catalog.source or not self.catalog.source.data:
             print(f"  {Colors.RED}✗ FAILED - Cannot load source file{Colors.NC}")
             return False
         
-        total_keys = len(source_data)
-        
-        for file in self.get_translation_files():
-            trans_data = self.load_json(file)
-            if not trans_data:
+        for code in self.catalog.translated_codes():
+            locale = self.catalog.locales[code]
+            file = locale.path
+            if not locale.data:
                 print(f"  {Colors.YELLOW}⚠ {file.name} - 0%{Colors.NC}")
                 continue
             
-            translated_keys = sum(
-                1 for k, v in trans_data.items() 
-                if k in source_data and v and v.strip()
-            )
-            coverage = (translated_keys / total_keys) * 100
+            coverage = self.catalog.completion(code)
             
             if coverage >= 90:
                 color = Colors.GREEN